@@ -31,6 +31,7 @@ function Runs() {
   const tableRef = useResizableTable()
   const [searchParams, setSearchParams] = useSearchParams()
   const [runs, setRuns] = useState<Run[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [schedules, setSchedules] = useState<Schedule[]>([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
@@ -76,7 +77,7 @@ function Runs() {
     }
   }
 
-  const loadRuns = async () => {
+  const loadRuns = async (cursor?: string) => {
     try {
       setLoading(true)
       const params: Record<string, string> = {}
@@ -84,9 +85,12 @@ function Runs() {
       if (filters.status) params.status = filters.status
       if (filters.start_time) params.start_time = filters.start_time
       if (filters.end_time) params.end_time = filters.end_time
+      if (cursor) params.cursor = cursor
 
       const response = await runsApi.getAll(params)
-      setRuns(response.data.data || [])
+      const page = response.data.data || []
+      setRuns(prevRuns => (cursor ? [...prevRuns, ...page] : page))
+      setNextCursor(response.data.next_cursor || null)
       setError(null)
     } catch (err) {
       const axiosError = err as AxiosError<{ detail: string }>
@@ -342,6 +346,14 @@ function Runs() {
             </Table>
           </div>
 
+          {nextCursor && (
+            <div className="flex justify-center mt-4">
+              <Button variant="outline" disabled={loading} onClick={() => loadRuns(nextCursor)}>
+                Load more
+              </Button>
+            </div>
+          )}
+
           {runs.length === 0 && !loading && (
             <motion.div
               initial={{ opacity: 0 }}
@@ -50,4 +50,5 @@ export interface APIResponse<T> {
   status_code: number
   message: string
   data: T
+  next_cursor?: string
 }
@@ -0,0 +1,150 @@
+"""Compare HTTP/1.1 and HTTP/2 against a local stub that serves many endpoints on one origin.
+
+Requires the optional ``h2`` package. Run from services/api with ``make bench-http2`` or:
+
+    uv run --with h2 python benchmarks/http2_multiplexing.py --endpoints 400 --rounds 5 --delay-ms 20
+
+The stub speaks cleartext HTTP/1.1 and HTTP/2 with prior knowledge on the same port and
+counts accepted TCP connections, which is what multiplexing is meant to reduce.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+RESPONSE_BODY = b'{"ok": true}'
+
+
+class StubServer:
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+            if head == H2_PREFACE:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_h1(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h1(self, buffer: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            _, buffer = buffer.split(b"\r\n\r\n", 1)
+            await asyncio.sleep(self.delay_seconds)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"content-type: application/json\r\n"
+                b"content-length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+                b"\r\n" + RESPONSE_BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, preface: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.receive_data(preface)
+        writer.write(conn.data_to_send())
+
+        pending = set()
+
+        async def respond(stream_id: int):
+            await asyncio.sleep(self.delay_seconds)
+            conn.send_headers(stream_id, [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(RESPONSE_BODY))),
+            ])
+            conn.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+async def run_mode(client: httpx.AsyncClient, base_url: str, endpoints: int, rounds: int) -> list[float]:
+    latencies = []
+
+    async def fetch(i: int):
+        start = time.perf_counter()
+        response = await client.get(f"{base_url}/endpoint/{i}")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    for _ in range(rounds):
+        await asyncio.gather(*(fetch(i) for i in range(endpoints)))
+
+    return latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--endpoints", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--max-keepalive", type=int, default=20)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_keepalive,
+    )
+
+    print(f"{'mode':<10}{'connections':>12}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}{'wall s':>10}")
+    for name, http1, http2 in (("HTTP/1.1", True, False), ("HTTP/2", False, True)):
+        stub = StubServer(args.delay_ms / 1000)
+        server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        base_url = f"http://127.0.0.1:{port}"
+
+        async with httpx.AsyncClient(http1=http1, http2=http2, limits=limits, timeout=30) as client:
+            started = time.perf_counter()
+            latencies = await run_mode(client, base_url, args.endpoints, args.rounds)
+            wall = time.perf_counter() - started
+
+        server.close()
+        await server.wait_closed()
+
+        print(
+            f"{name:<10}{stub.connections:>12}{len(latencies):>10}"
+            f"{statistics.median(latencies):>10.1f}{percentile(latencies, 99):>10.1f}{wall:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+"""Compare the ORM and Core write paths for a job record with its attempts.
+
+The ORM path is how create_job_record used to persist a job: add the Job, commit, refresh,
+add each Attempt, commit again. The Core path is what JobWriteBuffer does now: one
+transaction with an INSERT ... RETURNING for the job and one executemany for its attempts.
+Run from services/api with ``make bench-job-write`` or:
+
+    uv run python benchmarks/job_write_path.py --database-url postgresql+asyncpg://...
+
+Defaults to an in-memory SQLite database, which understates the round-trip savings.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from db.models.attempt import Attempt  # noqa: E402
+from db.models.job import Job  # noqa: E402
+from temporal.job_writer import JobWriteBuffer, attempt_row, job_row, parse_status, parse_timestamp  # noqa: E402
+
+ATTEMPT_COUNTS = (1, 3, 10)
+
+
+def make_request_result(attempts: int) -> dict:
+    started_at = datetime.now(UTC).isoformat()
+    return {
+        "status": "success",
+        "status_code": 200,
+        "latency_ms": 12.5,
+        "started_at": started_at,
+        "response_headers": {"Content-Type": "application/json"},
+        "response_body": {"ok": True},
+        "attempts": [
+            {
+                "attempt_number": number,
+                "started_at": started_at,
+                "status": "success",
+                "status_code": 200,
+                "latency_ms": 12.5,
+            }
+            for number in range(1, attempts + 1)
+        ],
+    }
+
+
+async def write_orm(session_factory, result: dict):
+    async with session_factory() as session:
+        job = Job(
+            schedule_id=uuid4(),
+            run_number=1,
+            started_at=parse_timestamp(result["started_at"]),
+            status=parse_status(result["status"]),
+            status_code=result["status_code"],
+            latency_ms=result["latency_ms"],
+            response_headers=result["response_headers"],
+            response_body=result["response_body"],
+        )
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+
+        for attempt in result["attempts"]:
+            session.add(Attempt(
+                job_id=job.id,
+                job_started_at=job.started_at,
+                attempt_number=attempt["attempt_number"],
+                started_at=parse_timestamp(attempt["started_at"]),
+                status=parse_status(attempt["status"]),
+                status_code=attempt["status_code"],
+                latency_ms=attempt["latency_ms"],
+            ))
+        await session.commit()
+
+
+async def write_core(buffer: JobWriteBuffer, result: dict):
+    row = job_row(uuid4(), 1, result)
+    await buffer.submit(row, [attempt_row(row, attempt) for attempt in result["attempts"]])
+
+
+async def measure(write, target, result: dict, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await write(target, result)
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    buffer = JobWriteBuffer(session_factory, max_batch_size=1)
+
+    print(f"{'attempts':>8}{'orm ms':>10}{'core ms':>10}{'speedup':>10}")
+    for attempts in ATTEMPT_COUNTS:
+        result = make_request_result(attempts)
+        orm_ms = await measure(write_orm, session_factory, result, args.iterations)
+        core_ms = await measure(write_core, buffer, result, args.iterations)
+        print(f"{attempts:>8}{orm_ms:>10.3f}{core_ms:>10.3f}{orm_ms / core_ms:>9.2f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
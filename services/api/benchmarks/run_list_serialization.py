@@ -0,0 +1,116 @@
+"""Compare the old and new serialization paths for a GET /runs response.
+
+The old path is what the runs listing used to do per row: ORM Job -> pydantic Job ->
+model_dump -> Job(**dict) -> RunResponse(**model_dump), followed by FastAPI's
+response_model validation, jsonable conversion and json.dumps. The new path validates
+each row once into RunListResponse and lets pydantic-core write the JSON bytes
+(models.response.list_response). Run from services/api with ``make bench-run-list`` or:
+
+    uv run python benchmarks/run_list_serialization.py --rows 10000
+
+Rows are built in memory, so database time is excluded from both paths.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from db.models.job import Job as JobModel  # noqa: E402
+from domains.runs.projection import SUMMARY_FIELDS  # noqa: E402
+from domains.runs.schemas import RunListResponse, RunResponse  # noqa: E402
+from domains.runs.service import RUN_LIST_ADAPTER  # noqa: E402
+from enums.job_status import JobStatus  # noqa: E402
+from models.job import Job as JobPydantic  # noqa: E402
+from models.response import HTTPResponse, list_response  # noqa: E402
+
+RunRow = namedtuple("RunRow", SUMMARY_FIELDS)
+
+
+def make_job(index: int, started_at: datetime) -> dict:
+    return {
+        "id": uuid4(),
+        "created_at": started_at,
+        "updated_at": started_at,
+        "schedule_id": uuid4(),
+        "run_number": index,
+        "started_at": started_at - timedelta(seconds=index),
+        "scheduled_at": started_at - timedelta(seconds=index),
+        "missed_runs": 0,
+        "status": JobStatus.SUCCESS,
+        "status_code": 200,
+        "latency_ms": 42.0,
+        "response_size_bytes": 512,
+        "response_sha256": "0" * 64,
+        "response_truncated": False,
+        "http_version": "HTTP/1.1",
+        "connect_ms": 1.5,
+        "tls_ms": 3.0,
+        "ttfb_ms": 30.0,
+        "download_ms": 2.0,
+        "error_message": None,
+        "redirected": False,
+        "redirect_count": 0,
+    }
+
+
+def serialize_old(jobs: list[JobModel], adapter: TypeAdapter) -> bytes:
+    responses = []
+    for job in jobs:
+        run_dict = job.to_pydantic_model().model_dump()
+        run_dict["name"] = "schedule"
+        run = JobPydantic(**run_dict)
+        responses.append(RunResponse(**run.model_dump()))
+    envelope = HTTPResponse(
+        success=True, status_code=200, message="Runs retrieved successfully", data=responses)
+    validated = adapter.validate_python(envelope.model_dump())
+    content = adapter.dump_python(validated, mode="json", exclude_none=True)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def serialize_new(rows: list[RunRow]) -> bytes:
+    runs = RUN_LIST_ADAPTER.validate_python(
+        [{**row._asdict(), "name": "schedule"} for row in rows])
+    return list_response(RunListResponse, runs, "Runs retrieved successfully").body
+
+
+def measure(serialize, *args, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        serialize(*args)
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.now()
+    jobs_data = [make_job(index, now) for index in range(args.rows)]
+    jobs = [JobModel(**job) for job in jobs_data]
+    rows = [RunRow(**{field: job.get(field) for field in SUMMARY_FIELDS}) for job in jobs_data]
+    adapter = TypeAdapter(HTTPResponse[List[RunResponse]])
+
+    old_seconds = measure(serialize_old, jobs, adapter, iterations=args.iterations)
+    new_seconds = measure(serialize_new, rows, iterations=args.iterations)
+
+    print(f"{'path':>6}{'ms':>10}{'rows/s':>12}")
+    print(f"{'old':>6}{old_seconds * 1000:>10.1f}{args.rows / old_seconds:>12,.0f}")
+    print(f"{'new':>6}{new_seconds * 1000:>10.1f}{args.rows / new_seconds:>12,.0f}")
+    print(f"speedup {old_seconds / new_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
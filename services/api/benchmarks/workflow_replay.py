@@ -0,0 +1,106 @@
+"""Measure IntervalScheduleWorkflow history size and replay time with and without continue-as-new.
+
+Runs the workflow in Temporal's time-skipping test server with stub activities, lets it tick
+for a while, then replays the current run's history. Run from services/api with
+``make bench-replay`` or:
+
+    uv run python benchmarks/workflow_replay.py --ticks 2000 --max-ticks 500
+
+The "unbounded" case puts both limits out of reach so ticks accumulate in one history, which
+is how the workflow behaved before continue-as-new (only a server-side continue-as-new
+suggestion can still roll the run over).
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from temporalio import activity
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Replayer, Worker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from temporal.workflows import IntervalScheduleWorkflow  # noqa: E402
+
+INTERVAL_SECONDS = 10
+UNBOUNDED = 10**9
+
+
+@activity.defn(name="get_schedule_and_target")
+async def get_schedule_and_target(schedule_id) -> dict:
+    return {
+        "paused": False,
+        "schedule": {"interval_seconds": INTERVAL_SECONDS},
+        "target": {"method": "GET", "headers": {}, "body": None},
+        "url": "http://127.0.0.1/bench",
+    }
+
+
+@activity.defn(name="execute_http_request")
+async def execute_http_request(*args) -> dict:
+    return {
+        "status": "success",
+        "status_code": 200,
+        "latency_ms": 1.0,
+        "started_at": "2024-01-01T00:00:00",
+        "attempts": [],
+        "payload_ref": uuid4().hex,
+    }
+
+
+@activity.defn(name="create_job_record")
+async def create_job_record(schedule_id, run_number, request_result, scheduled_at=None, missed_runs=0) -> str:
+    return str(uuid4())
+
+
+async def measure(env: WorkflowEnvironment, ticks: int, max_ticks: int, repeats: int) -> tuple[int, float]:
+    workflow_id = f"bench-replay-{uuid4()}"
+    handle = await env.client.start_workflow(
+        IntervalScheduleWorkflow.run,
+        args=[uuid4(), 1, max_ticks, UNBOUNDED],
+        id=workflow_id,
+        task_queue="bench-replay",
+    )
+    await env.sleep(timedelta(seconds=INTERVAL_SECONDS * ticks))
+
+    current = env.client.get_workflow_handle(workflow_id)
+    history = await current.fetch_history()
+    await current.terminate()
+
+    replayer = Replayer(workflows=[IntervalScheduleWorkflow])
+    started = time.perf_counter()
+    for _ in range(repeats):
+        await replayer.replay_workflow(history)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeats
+    return len(history.events), elapsed_ms
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--max-ticks", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="bench-replay",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[get_schedule_and_target, execute_http_request, create_job_record],
+        ):
+            print(f"{'mode':<24}{'ticks':>8}{'events':>10}{'replay ms':>12}")
+            for mode, max_ticks in (
+                ("unbounded", UNBOUNDED),
+                (f"continue-as-new@{args.max_ticks}", args.max_ticks),
+            ):
+                events, replay_ms = await measure(env, args.ticks, max_ticks, args.repeats)
+                print(f"{mode:<24}{args.ticks:>8}{events:>10}{replay_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+-- ============================================================================
+-- Add the columns, types and indexes introduced since the baseline schema
+-- ============================================================================
+-- Targets gain http2 and max_capture_bytes; both schedule tables gain
+-- misfire_policy, max_catch_up_runs and priority; jobs and attempts gain the
+-- response hash/capture, protocol and phase timing columns, and jobs gain
+-- scheduled_at and missed_runs. Schedules with repeated run numbers are
+-- renumbered in start order before the unique (schedule_id, run_number) index
+-- is built. Must run before 002_unify_schedules.sql.
+-- ============================================================================
+
+BEGIN;
+
+DO $$ BEGIN
+    CREATE TYPE misfirepolicy AS ENUM (
+        'skip',
+        'coalesce',
+        'catch_up'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE schedulepriority AS ENUM (
+        'critical',
+        'normal',
+        'low'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+ALTER TABLE targets
+    ADD COLUMN IF NOT EXISTS http2 BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS max_capture_bytes INTEGER;
+
+ALTER TABLE interval_schedules
+    ADD COLUMN IF NOT EXISTS misfire_policy misfirepolicy NOT NULL DEFAULT 'coalesce',
+    ADD COLUMN IF NOT EXISTS max_catch_up_runs INTEGER NOT NULL DEFAULT 3,
+    ADD COLUMN IF NOT EXISTS priority schedulepriority NOT NULL DEFAULT 'normal';
+
+ALTER TABLE window_schedules
+    ADD COLUMN IF NOT EXISTS misfire_policy misfirepolicy NOT NULL DEFAULT 'coalesce',
+    ADD COLUMN IF NOT EXISTS max_catch_up_runs INTEGER NOT NULL DEFAULT 3,
+    ADD COLUMN IF NOT EXISTS priority schedulepriority NOT NULL DEFAULT 'normal';
+
+ALTER TABLE jobs
+    ADD COLUMN IF NOT EXISTS scheduled_at TIMESTAMP,
+    ADD COLUMN IF NOT EXISTS missed_runs INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS response_sha256 VARCHAR(64),
+    ADD COLUMN IF NOT EXISTS response_truncated BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS http_version VARCHAR,
+    ADD COLUMN IF NOT EXISTS connect_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS tls_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS ttfb_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS download_ms DOUBLE PRECISION;
+
+ALTER TABLE attempts
+    ADD COLUMN IF NOT EXISTS response_sha256 VARCHAR(64),
+    ADD COLUMN IF NOT EXISTS response_truncated BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS http_version VARCHAR,
+    ADD COLUMN IF NOT EXISTS connect_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS tls_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS ttfb_ms DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS download_ms DOUBLE PRECISION;
+
+-- Resuming a schedule used to restart its run counter at 1, so schedules
+-- that were ever resumed repeat run numbers. Renumber their jobs in start
+-- order; no job or attempt is removed.
+UPDATE jobs
+SET run_number = renumbered.run_number
+FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY schedule_id ORDER BY started_at, id
+    ) AS run_number
+    FROM jobs
+    WHERE schedule_id IN (
+        SELECT schedule_id FROM jobs
+        GROUP BY schedule_id
+        HAVING COUNT(*) > COUNT(DISTINCT run_number)
+    )
+) renumbered
+WHERE jobs.id = renumbered.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_schedule_run ON jobs(schedule_id, run_number);
+DROP INDEX IF EXISTS idx_jobs_schedule_id;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_started_at_id ON jobs(started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_schedule_started_at ON jobs(schedule_id, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_started_at ON jobs(status, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_schedule_status_started_at ON jobs(schedule_id, status, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_latency_ms ON jobs(latency_ms);
+
+COMMIT;
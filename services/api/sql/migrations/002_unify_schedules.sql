@@ -0,0 +1,57 @@
+-- ============================================================================
+-- Merge interval_schedules and window_schedules into a single schedules table
+-- ============================================================================
+-- Existing rows keep their ids, so jobs.schedule_id and Temporal workflow ids
+-- stay valid. Interval rows get a NULL duration_seconds.
+-- ============================================================================
+
+BEGIN;
+
+DO $$ BEGIN
+    CREATE TYPE scheduletype AS ENUM (
+        'interval',
+        'window'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+CREATE TABLE IF NOT EXISTS schedules (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    name VARCHAR NOT NULL,
+    schedule_type scheduletype NOT NULL,
+    interval_seconds INTEGER NOT NULL,
+    duration_seconds INTEGER,
+    target_id UUID NOT NULL REFERENCES targets(id) ON DELETE CASCADE,
+    paused BOOLEAN NOT NULL DEFAULT FALSE,
+    temporal_workflow_id VARCHAR,
+    misfire_policy misfirepolicy NOT NULL DEFAULT 'coalesce',
+    max_catch_up_runs INTEGER NOT NULL DEFAULT 3,
+    priority schedulepriority NOT NULL DEFAULT 'normal',
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    CONSTRAINT ck_schedules_window_duration
+        CHECK (schedule_type <> 'window' OR duration_seconds IS NOT NULL)
+);
+
+INSERT INTO schedules (
+    id, name, schedule_type, interval_seconds, duration_seconds, target_id, paused,
+    temporal_workflow_id, misfire_policy, max_catch_up_runs, priority, created_at, updated_at
+)
+SELECT
+    id, name, 'interval', interval_seconds, NULL, target_id, paused,
+    temporal_workflow_id, misfire_policy, max_catch_up_runs, priority, created_at, updated_at
+FROM interval_schedules
+UNION ALL
+SELECT
+    id, name, 'window', interval_seconds, duration_seconds, target_id, paused,
+    temporal_workflow_id, misfire_policy, max_catch_up_runs, priority, created_at, updated_at
+FROM window_schedules
+ON CONFLICT (id) DO NOTHING;
+
+CREATE INDEX IF NOT EXISTS idx_schedules_target_id ON schedules(target_id);
+
+DROP TABLE interval_schedules;
+DROP TABLE window_schedules;
+
+COMMIT;
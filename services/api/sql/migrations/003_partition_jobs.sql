@@ -0,0 +1,79 @@
+-- ============================================================================
+-- Range-partition jobs and attempts by day
+-- ============================================================================
+-- jobs is partitioned on started_at; attempts gains job_started_at (its job's
+-- started_at) and is partitioned on it, so both tables share partition
+-- boundaries. Daily partitions are created for every day that has data plus
+-- the next week; the application keeps creating future partitions and drops
+-- expired ones (JOB_RETENTION_DAYS). Rows are copied, so run this during a
+-- maintenance window on large tables.
+-- ============================================================================
+
+BEGIN;
+
+ALTER TABLE attempts RENAME TO attempts_unpartitioned;
+ALTER TABLE jobs RENAME TO jobs_unpartitioned;
+ALTER INDEX IF EXISTS uq_jobs_schedule_run RENAME TO uq_jobs_unpartitioned_schedule_run;
+ALTER INDEX IF EXISTS idx_jobs_started_at_id RENAME TO idx_jobs_unpartitioned_started_at_id;
+ALTER INDEX IF EXISTS idx_jobs_schedule_started_at RENAME TO idx_jobs_unpartitioned_schedule_started_at;
+ALTER INDEX IF EXISTS idx_jobs_status_started_at RENAME TO idx_jobs_unpartitioned_status_started_at;
+ALTER INDEX IF EXISTS idx_jobs_schedule_status_started_at RENAME TO idx_jobs_unpartitioned_schedule_status_started_at;
+ALTER INDEX IF EXISTS idx_jobs_latency_ms RENAME TO idx_jobs_unpartitioned_latency_ms;
+ALTER INDEX IF EXISTS idx_attempts_job_id RENAME TO idx_attempts_unpartitioned_job_id;
+
+CREATE TABLE jobs (
+    LIKE jobs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id, started_at)
+) PARTITION BY RANGE (started_at);
+
+CREATE TABLE attempts (
+    LIKE attempts_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    job_started_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (id, job_started_at),
+    FOREIGN KEY (job_id, job_started_at) REFERENCES jobs(id, started_at) ON DELETE CASCADE
+) PARTITION BY RANGE (job_started_at);
+
+CREATE TABLE jobs_default PARTITION OF jobs DEFAULT;
+CREATE TABLE attempts_default PARTITION OF attempts DEFAULT;
+
+DO $$
+DECLARE
+    day DATE;
+BEGIN
+    FOR day IN
+        SELECT generate_series(
+            COALESCE((SELECT MIN(started_at)::date FROM jobs_unpartitioned), CURRENT_DATE),
+            CURRENT_DATE + 7,
+            INTERVAL '1 day'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE jobs_p%s PARTITION OF jobs FOR VALUES FROM (%L) TO (%L)',
+            to_char(day, 'YYYYMMDD'), day, day + 1
+        );
+        EXECUTE format(
+            'CREATE TABLE attempts_p%s PARTITION OF attempts FOR VALUES FROM (%L) TO (%L)',
+            to_char(day, 'YYYYMMDD'), day, day + 1
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO jobs SELECT * FROM jobs_unpartitioned;
+
+INSERT INTO attempts
+SELECT attempts_unpartitioned.*, jobs.started_at
+FROM attempts_unpartitioned
+JOIN jobs ON jobs.id = attempts_unpartitioned.job_id;
+
+CREATE UNIQUE INDEX uq_jobs_schedule_run ON jobs(schedule_id, run_number, started_at);
+CREATE INDEX idx_jobs_started_at_id ON jobs(started_at, id);
+CREATE INDEX idx_jobs_schedule_started_at ON jobs(schedule_id, started_at, id);
+CREATE INDEX idx_jobs_status_started_at ON jobs(status, started_at, id);
+CREATE INDEX idx_jobs_schedule_status_started_at ON jobs(schedule_id, status, started_at, id);
+CREATE INDEX idx_jobs_latency_ms ON jobs(latency_ms);
+CREATE INDEX idx_attempts_job_id ON attempts(job_id);
+
+DROP TABLE attempts_unpartitioned;
+DROP TABLE jobs_unpartitioned;
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- ============================================================================
+-- Stage claim-check payloads in Postgres
+-- ============================================================================
+-- Replaces the PAYLOAD_STORE_DIR file store, which only worked when the HTTP
+-- and DB activities of a run shared a directory. Blobs still on disk belong
+-- to runs that were in flight during the upgrade; drain workers first.
+-- ============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS payload_blobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_payload_blobs_created_at ON payload_blobs(created_at);
+
+COMMIT;
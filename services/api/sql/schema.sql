@@ -2,9 +2,11 @@
 -- API Scheduler Database Schema
 -- ============================================================================
 -- This file contains the complete database schema including:
--- - Enum types for HTTP methods and job statuses
--- - Tables for URLs, targets, schedules, jobs, and attempts
+-- - Enum types for HTTP methods, job statuses, misfire policies,
+--   schedule priorities and schedule types
+-- - Tables for URLs, targets, schedules, jobs, attempts and staged payloads
 -- - Indexes for query optimization
+-- - Range partitioning of jobs and attempts by start time
 -- - CASCADE constraints for automatic cleanup
 -- ============================================================================
 
@@ -42,6 +44,38 @@ EXCEPTION
     WHEN duplicate_object THEN null;
 END $$;
 
+-- Misfire Policies
+DO $$ BEGIN
+    CREATE TYPE misfirepolicy AS ENUM (
+        'skip',
+        'coalesce',
+        'catch_up'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+-- Schedule Priorities
+DO $$ BEGIN
+    CREATE TYPE schedulepriority AS ENUM (
+        'critical',
+        'normal',
+        'low'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+-- Schedule Types
+DO $$ BEGIN
+    CREATE TYPE scheduletype AS ENUM (
+        'interval',
+        'window'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
 -- ============================================================================
 -- 2. TABLES
 -- ============================================================================
@@ -76,58 +110,63 @@ CREATE TABLE IF NOT EXISTS targets (
     retry_count INTEGER NOT NULL DEFAULT 0,
     retry_delay_seconds INTEGER NOT NULL DEFAULT 1,
     follow_redirects BOOLEAN NOT NULL DEFAULT TRUE,
+    http2 BOOLEAN NOT NULL DEFAULT FALSE,
+    max_capture_bytes INTEGER,
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMP NOT NULL DEFAULT NOW()
 );
 
 CREATE INDEX IF NOT EXISTS idx_targets_name ON targets(name);
 
--- Interval Schedules Table
--- Schedules that run at fixed intervals
--- CASCADE: When target deleted, interval schedules are deleted
-CREATE TABLE IF NOT EXISTS interval_schedules (
+-- Schedules Table
+-- Interval and window schedules, discriminated by schedule_type
+-- Window schedules also carry duration_seconds
+-- CASCADE: When target deleted, schedules are deleted
+CREATE TABLE IF NOT EXISTS schedules (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     name VARCHAR NOT NULL,
+    schedule_type scheduletype NOT NULL,
     interval_seconds INTEGER NOT NULL,
+    duration_seconds INTEGER,
     target_id UUID NOT NULL REFERENCES targets(id) ON DELETE CASCADE,
     paused BOOLEAN NOT NULL DEFAULT FALSE,
     temporal_workflow_id VARCHAR,
+    misfire_policy misfirepolicy NOT NULL DEFAULT 'coalesce',
+    max_catch_up_runs INTEGER NOT NULL DEFAULT 3,
+    priority schedulepriority NOT NULL DEFAULT 'normal',
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    CONSTRAINT ck_schedules_window_duration
+        CHECK (schedule_type <> 'window' OR duration_seconds IS NOT NULL)
 );
 
-CREATE INDEX IF NOT EXISTS idx_interval_schedules_target_id ON interval_schedules(target_id);
-
--- Window Schedules Table
--- Schedules that run for a specific duration
--- CASCADE: When target deleted, window schedules are deleted
-CREATE TABLE IF NOT EXISTS window_schedules (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    name VARCHAR NOT NULL,
-    interval_seconds INTEGER NOT NULL,
-    target_id UUID NOT NULL REFERENCES targets(id) ON DELETE CASCADE,
-    duration_seconds INTEGER NOT NULL,
-    paused BOOLEAN NOT NULL DEFAULT FALSE,
-    temporal_workflow_id VARCHAR,
-    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
-
-CREATE INDEX IF NOT EXISTS idx_window_schedules_target_id ON window_schedules(target_id);
+CREATE INDEX IF NOT EXISTS idx_schedules_target_id ON schedules(target_id);
 
 -- Jobs Table
 -- Records of HTTP request executions
--- Note: schedule_id references either interval_schedules OR window_schedules
+-- Note: schedule_id references schedules(id)
 -- Deletion is handled at application level
+-- Partitioned by day on started_at; every primary/unique key includes it.
+-- Daily partitions are created ahead of time and dropped after
+-- JOB_RETENTION_DAYS by the application (db/partitions.py).
 CREATE TABLE IF NOT EXISTS jobs (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
     schedule_id UUID NOT NULL,
     run_number INTEGER NOT NULL,
     started_at TIMESTAMP NOT NULL,
+    scheduled_at TIMESTAMP,
+    missed_runs INTEGER NOT NULL DEFAULT 0,
     status jobstatus NOT NULL,
     status_code INTEGER,
     latency_ms DOUBLE PRECISION,
     response_size_bytes INTEGER,
+    response_sha256 VARCHAR(64),
+    response_truncated BOOLEAN NOT NULL DEFAULT FALSE,
+    http_version VARCHAR,
+    connect_ms DOUBLE PRECISION,
+    tls_ms DOUBLE PRECISION,
+    ttfb_ms DOUBLE PRECISION,
+    download_ms DOUBLE PRECISION,
     request_headers JSONB,
     request_body JSONB,
     response_headers JSONB,
@@ -137,31 +176,77 @@ CREATE TABLE IF NOT EXISTS jobs (
     redirect_count INTEGER NOT NULL DEFAULT 0,
     redirect_history JSONB,
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, started_at)
+) PARTITION BY RANGE (started_at);
 
-CREATE INDEX IF NOT EXISTS idx_jobs_schedule_id ON jobs(schedule_id);
+-- Catches rows outside the pre-created daily partitions
+CREATE TABLE IF NOT EXISTS jobs_default PARTITION OF jobs DEFAULT;
+
+-- One job per schedule run; makes job inserts idempotent (ON CONFLICT DO NOTHING)
+-- and serves schedule_id lookups ordered by run_number
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_schedule_run ON jobs(schedule_id, run_number, started_at);
+DROP INDEX IF EXISTS idx_jobs_schedule_id;
+
+-- Keyset pagination for run listings, ordered by (started_at, id) DESC.
+-- One index per supported filter combination; the time range narrows the
+-- started_at part of each, and backward scans serve the DESC order.
+CREATE INDEX IF NOT EXISTS idx_jobs_started_at_id ON jobs(started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_schedule_started_at ON jobs(schedule_id, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_started_at ON jobs(status, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_schedule_status_started_at ON jobs(schedule_id, status, started_at, id);
+-- Latency ranges are selective on their own and are combined with the indexes
+-- above through bitmap scans
+CREATE INDEX IF NOT EXISTS idx_jobs_latency_ms ON jobs(latency_ms);
 
 -- Attempts Table
 -- Records of retry attempts for jobs
 -- CASCADE: When job deleted, attempts are deleted
+-- Partitioned on the owning job's started_at so attempts share the jobs
+-- partition boundaries and expire with them
 CREATE TABLE IF NOT EXISTS attempts (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    job_id UUID NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    job_id UUID NOT NULL,
+    job_started_at TIMESTAMP NOT NULL,
     attempt_number INTEGER NOT NULL,
     started_at TIMESTAMP NOT NULL,
     status jobstatus NOT NULL,
     status_code INTEGER,
     latency_ms DOUBLE PRECISION,
     response_size_bytes INTEGER,
+    response_sha256 VARCHAR(64),
+    response_truncated BOOLEAN NOT NULL DEFAULT FALSE,
+    http_version VARCHAR,
+    connect_ms DOUBLE PRECISION,
+    tls_ms DOUBLE PRECISION,
+    ttfb_ms DOUBLE PRECISION,
+    download_ms DOUBLE PRECISION,
     response_headers JSONB,
     response_body JSONB,
     error_message VARCHAR,
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, job_started_at),
+    FOREIGN KEY (job_id, job_started_at) REFERENCES jobs(id, started_at) ON DELETE CASCADE
+) PARTITION BY RANGE (job_started_at);
+
+CREATE TABLE IF NOT EXISTS attempts_default PARTITION OF attempts DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_job_id ON attempts(job_id);
+
+-- Payload Blobs Table
+-- Request/response payloads staged between the HTTP activity and the
+-- activity that records the run, which may run on another worker. Rows are
+-- deleted once the run is recorded; leftovers are swept after
+-- PAYLOAD_STORE_TTL_SECONDS.
+CREATE TABLE IF NOT EXISTS payload_blobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMP NOT NULL DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_attempts_job_id ON attempts(job_id);
+CREATE INDEX IF NOT EXISTS idx_payload_blobs_created_at ON payload_blobs(created_at);
 
 -- ============================================================================
 -- CASCADE DELETION HIERARCHY
@@ -1,5 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from enums.service_role import ServiceRole
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -16,6 +18,41 @@ class Settings(BaseSettings):
     temporal_host: str = "localhost:7233"
     temporal_namespace: str = "default"
     temporal_task_queue: str = "api-scheduler-queue"
+    temporal_queue_routing: bool = False
+    role: ServiceRole = ServiceRole.BOTH
+    worker_max_concurrent_activities: int = 100
+    worker_max_concurrent_workflow_tasks: int = 100
+    worker_max_concurrent_activity_task_polls: int = 5
+    worker_max_concurrent_workflow_task_polls: int = 5
+    worker_metrics_port: int | None = 9100
+    worker_processes: int = 1
+    worker_graceful_shutdown_seconds: float = 30.0
+    worker_max_restarts: int = 5
+    worker_restart_backoff_max_seconds: float = 60.0
+    worker_task_queues: list[str] = []
+    workflow_max_ticks_per_run: int = 500
+    workflow_max_history_events: int = 10_000
+    workflow_fused_tick: bool = False
+    workflow_fixed_rate: bool = False
+    workflow_phase_spread: bool = False
+    workflow_jitter_ratio: float = 0.0
+
+    http_pool_max_connections: int = 100
+    http_pool_max_keepalive_connections: int = 20
+    http_pool_keepalive_expiry_seconds: float = 30.0
+    http_verify_ssl: bool = True
+    http_proxy: str | None = None
+    http_max_capture_bytes: int = 1_048_576
+    payload_store_ttl_seconds: float = 86_400.0
+    schedule_config_cache_ttl_seconds: float = 30.0
+    schedule_config_cache_max_entries: int = 10_000
+    runs_page_size: int = 50
+    runs_max_page_size: int = 500
+    job_write_batch_size: int = 100
+    job_write_max_delay_ms: float = 20.0
+    job_retention_days: int | None = None
+    job_partition_premake_days: int = 7
+    job_partition_maintenance_interval_seconds: float = 3600.0
 
     log_level: str = "INFO"
     loki_url: str | None = None
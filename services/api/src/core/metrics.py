@@ -53,6 +53,19 @@ job_duration_seconds = Histogram(
     buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
 )
 
+schedule_config_cache_lookups_total = Counter(
+    "schedule_config_cache_lookups_total",
+    "Worker-side schedule config cache lookups",
+    ["result"]
+)
+
+temporal_client_connect_seconds = Histogram(
+    "temporal_client_connect_seconds",
+    "Time to connect the shared Temporal client",
+    ["status"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
 process_cpu_percent = Gauge(
     "process_cpu_percent",
     "Process CPU usage percentage"
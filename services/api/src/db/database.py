@@ -1,21 +1,28 @@
+import asyncio
 import contextlib
+import json
 import logging
 import time
+from typing import Callable
+from uuid import UUID
 
-from sqlalchemy import event, pool
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, pool, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlmodel import SQLModel
 
 from core.config import settings
 from core.logging import get_logger
 from db.models.job import Job
+from db.models.payload_blob import PayloadBlob
 from db.models.schedule import Schedule
 from db.models.target import Target
 from db.models.url import URL
 
 logger = get_logger()
 
+CHANGE_CHANNEL = "api_scheduler_changes"
+
 logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 logging.getLogger('sqlalchemy.pool').setLevel(logging.WARNING)
 
@@ -86,6 +93,140 @@ async def get_session() -> AsyncSession:
             logger.debug("session_closed", pool_checked_out=engine.pool.checkedout())
 
 
+class ChangeListener:
+    """Fans out schedule/target/URL change notifications to in-process subscribers.
+
+    Writers queue changes on their session with ``notify_change``. On Postgres
+    they are sent with ``pg_notify`` inside the writing transaction, so other
+    replicas only hear about committed writes; the writing process dispatches
+    its own changes locally after commit. ``start`` holds one connection
+    LISTENing on ``CHANGE_CHANNEL`` and reconnects if it drops, sending a
+    ``resync`` change so subscribers can discard anything they may have missed.
+    """
+
+    def __init__(self, reconnect_delay_seconds: float = 5.0):
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._subscribers: list[Callable[[dict], None]] = []
+        self._connection: AsyncConnection | None = None
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, callback: Callable[[dict], None]) -> Callable[[], None]:
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def dispatch(self, change: dict):
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(
+                    "db_change_subscriber_error",
+                    change=change,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+
+    def _on_notification(self, connection, pid, channel, payload):
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            logger.warning("db_change_notification_invalid", payload=payload)
+            return
+        self.dispatch(change)
+
+    async def start(self):
+        if self._task is not None:
+            return
+        if engine.dialect.name != "postgresql":
+            logger.info("db_change_listener_disabled", dialect=engine.dialect.name)
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        first_connect = True
+        while True:
+            try:
+                self._connection = await engine.connect()
+                raw_connection = await self._connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                await driver_connection.add_listener(CHANGE_CHANNEL, self._on_notification)
+                logger.info("db_change_listener_started", channel=CHANGE_CHANNEL)
+                if not first_connect:
+                    self.dispatch({"entity": "*", "action": "resync"})
+
+                while not driver_connection.is_closed():
+                    await asyncio.sleep(self.reconnect_delay_seconds)
+                logger.warning("db_change_listener_connection_lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "db_change_listener_error",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+            finally:
+                await self._close_connection()
+            first_connect = False
+            await asyncio.sleep(self.reconnect_delay_seconds)
+
+    async def _close_connection(self):
+        if self._connection is None:
+            return
+        try:
+            await self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("db_change_listener_stopped")
+
+
+change_listener = ChangeListener()
+
+
+async def notify_change(session: AsyncSession, entity: str, entity_id: UUID, action: str):
+    change = {"entity": entity, "id": str(entity_id), "action": action}
+    # Outside Postgres nothing below begins a transaction, and a rollback
+    # without one fires no rollback events; begin one so the change is tied
+    # to the session's next commit or rollback.
+    if not session.in_transaction():
+        session.sync_session.begin()
+    session.sync_session.info.setdefault("pending_changes", []).append(change)
+    if engine.dialect.name == "postgresql":
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANGE_CHANNEL, "payload": json.dumps(change)},
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def dispatch_pending_changes(session):
+    for change in session.info.pop("pending_changes", []):
+        change_listener.dispatch(change)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_pending_changes(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop("pending_changes", None)
+
+
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
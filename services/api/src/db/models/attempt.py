@@ -5,7 +5,7 @@ from uuid import UUID
 from db.mixins.timestamp import TimestampMixin
 from db.mixins.uuid import UUIDMixin
 from enums.job_status import JobStatus
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, ForeignKeyConstraint, Index
 from sqlmodel import Field
 
 from .job import JobStatusEnum
@@ -13,14 +13,31 @@ from .job import JobStatusEnum
 
 class Attempt(UUIDMixin, TimestampMixin, table=True):
     __tablename__ = "attempts"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["job_id", "job_started_at"],
+            ["jobs.id", "jobs.started_at"],
+            ondelete="CASCADE",
+        ),
+        Index("idx_attempts_job_id", "job_id"),
+        {"postgresql_partition_by": "RANGE (job_started_at)"},
+    )
 
-    job_id: UUID = Field(nullable=False, index=True, foreign_key="jobs.id")
+    job_id: UUID = Field(nullable=False)
+    job_started_at: datetime = Field(nullable=False, primary_key=True)
     attempt_number: int = Field(nullable=False)
     started_at: datetime = Field(nullable=False)
     status: JobStatus = Field(sa_column=Column(JobStatusEnum(), nullable=False))
     status_code: int | None = Field(default=None)
     latency_ms: float | None = Field(default=None)
     response_size_bytes: int | None = Field(default=None)
+    response_sha256: str | None = Field(default=None)
+    response_truncated: bool = Field(default=False, nullable=False)
+    http_version: str | None = Field(default=None)
+    connect_ms: float | None = Field(default=None)
+    tls_ms: float | None = Field(default=None)
+    ttfb_ms: float | None = Field(default=None)
+    download_ms: float | None = Field(default=None)
     response_headers: Any = Field(default=None, sa_column=Column(JSON))
     response_body: Any = Field(default=None, sa_column=Column(JSON))
     error_message: str | None = Field(default=None)
@@ -5,7 +5,7 @@ from uuid import UUID
 from db.mixins.timestamp import TimestampMixin
 from db.mixins.uuid import UUIDMixin
 from enums.job_status import JobStatus
-from sqlalchemy import JSON, Column, TypeDecorator
+from sqlalchemy import JSON, Column, Index, TypeDecorator
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlmodel import Field
 
@@ -39,16 +39,34 @@ class JobStatusEnum(TypeDecorator):
 
 class Job(UUIDMixin, TimestampMixin, table=True):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("uq_jobs_schedule_run", "schedule_id", "run_number", "started_at", unique=True),
+        Index("idx_jobs_started_at_id", "started_at", "id"),
+        Index("idx_jobs_schedule_started_at", "schedule_id", "started_at", "id"),
+        Index("idx_jobs_status_started_at", "status", "started_at", "id"),
+        Index("idx_jobs_schedule_status_started_at", "schedule_id", "status", "started_at", "id"),
+        Index("idx_jobs_latency_ms", "latency_ms"),
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
 
-    schedule_id: UUID = Field(nullable=False, index=True)
+    schedule_id: UUID = Field(nullable=False)
     run_number: int = Field(nullable=False)
-    started_at: datetime = Field(nullable=False)
+    started_at: datetime = Field(nullable=False, primary_key=True)
+    scheduled_at: datetime | None = Field(default=None)
+    missed_runs: int = Field(default=0, nullable=False)
     status: JobStatus = Field(
         sa_column=Column(JobStatusEnum(), nullable=False)
     )
     status_code: int | None = Field(default=None)
     latency_ms: float | None = Field(default=None)
     response_size_bytes: int | None = Field(default=None)
+    response_sha256: str | None = Field(default=None)
+    response_truncated: bool = Field(default=False, nullable=False)
+    http_version: str | None = Field(default=None)
+    connect_ms: float | None = Field(default=None)
+    tls_ms: float | None = Field(default=None)
+    ttfb_ms: float | None = Field(default=None)
+    download_ms: float | None = Field(default=None)
     request_headers: Any = Field(default=None, sa_column=Column(JSON))
     request_body: Any = Field(default=None, sa_column=Column(JSON))
     response_headers: Any = Field(default=None, sa_column=Column(JSON))
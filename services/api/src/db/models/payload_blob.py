@@ -0,0 +1,15 @@
+from typing import Any
+
+from db.mixins.timestamp import TimestampMixin
+from db.mixins.uuid import UUIDMixin
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import Field
+
+
+class PayloadBlob(UUIDMixin, TimestampMixin, table=True):
+    __tablename__ = "payload_blobs"
+    __table_args__ = (
+        Index("idx_payload_blobs_created_at", "created_at"),
+    )
+
+    payload: Any = Field(default=None, sa_column=Column(JSON, nullable=False))
@@ -1,48 +1,60 @@
-from abc import ABC
 from uuid import UUID
 
+from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field
 
 from db.mixins.timestamp import TimestampMixin
 from db.mixins.uuid import UUIDMixin
+from enums.misfire_policy import MisfirePolicy
+from enums.schedule_priority import SchedulePriority
+from enums.schedule_type import ScheduleType
 
 
-class Schedule(UUIDMixin, TimestampMixin, ABC):
+class Schedule(UUIDMixin, TimestampMixin, table=True):
+    __tablename__ = "schedules"
+
     name: str = Field(nullable=False)
+    schedule_type: ScheduleType = Field(
+        sa_type=SAEnum(
+            ScheduleType,
+            name="scheduletype",
+            values_callable=lambda types: [schedule_type.value for schedule_type in types],
+        ),
+        nullable=False,
+    )
     interval_seconds: int = Field(nullable=False)
+    duration_seconds: int | None = Field(default=None, nullable=True)
     target_id: UUID = Field(foreign_key="targets.id",
                             nullable=False, index=True)
     paused: bool = Field(default=False, nullable=False)
     temporal_workflow_id: str | None = Field(default=None, nullable=True)
+    misfire_policy: MisfirePolicy = Field(
+        default=MisfirePolicy.COALESCE,
+        sa_type=SAEnum(
+            MisfirePolicy,
+            name="misfirepolicy",
+            values_callable=lambda policies: [policy.value for policy in policies],
+        ),
+        nullable=False,
+    )
+    max_catch_up_runs: int = Field(default=3, nullable=False)
+    priority: SchedulePriority = Field(
+        default=SchedulePriority.NORMAL,
+        sa_type=SAEnum(
+            SchedulePriority,
+            name="schedulepriority",
+            values_callable=lambda priorities: [priority.value for priority in priorities],
+        ),
+        nullable=False,
+    )
 
     def to_pydantic_model(self):
-        raise NotImplementedError("to_pydantic_model must be implemented")
-
-    def get_workflow_type(self) -> str:
-        raise NotImplementedError("get_workflow_type must be implemented")
-
-
-class IntervalSchedule(Schedule, table=True):
-    __tablename__ = "interval_schedules"
-
-    def to_pydantic_model(self):
-        from models.schedule import \
-            IntervalSchedule as IntervalSchedulePydantic
-        schedule_data = self.model_dump()
-        return IntervalSchedulePydantic(**schedule_data)
-
-    def get_workflow_type(self) -> str:
-        return "interval"
-
-
-class WindowSchedule(Schedule, table=True):
-    __tablename__ = "window_schedules"
-    duration_seconds: int = Field(nullable=False)
-
-    def to_pydantic_model(self):
+        from models.schedule import IntervalSchedule as IntervalSchedulePydantic
         from models.schedule import WindowSchedule as WindowSchedulePydantic
         schedule_data = self.model_dump()
-        return WindowSchedulePydantic(**schedule_data)
+        if self.schedule_type == ScheduleType.WINDOW:
+            return WindowSchedulePydantic(**schedule_data)
+        return IntervalSchedulePydantic(**schedule_data)
 
     def get_workflow_type(self) -> str:
-        return "window"
+        return self.schedule_type.value
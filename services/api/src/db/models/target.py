@@ -20,6 +20,8 @@ class Target(UUIDMixin, TimestampMixin, table=True):
     retry_count: int = Field(default=0, nullable=False)
     retry_delay_seconds: int = Field(default=1, nullable=False)
     follow_redirects: bool = Field(default=True, nullable=False)
+    http2: bool = Field(default=False, nullable=False)
+    max_capture_bytes: int | None = Field(default=None, nullable=True)
 
     def to_pydantic_model(self, url_string: str):
         from urllib.parse import urlparse
@@ -0,0 +1,223 @@
+import asyncio
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import text
+
+from core.config import settings
+from core.logging import get_logger
+from db import database
+
+logger = get_logger()
+
+# Daily range partitions. Attempts are partitioned on their job's started_at,
+# so a day's attempts always live and expire alongside that day's jobs.
+PARTITIONED_TABLES = {"jobs": "started_at", "attempts": "job_started_at"}
+# Dropped in this order: attempts reference jobs.
+RETENTION_ORDER = ("attempts", "jobs")
+MAINTENANCE_LOCK_ID = 0x6A6F6273
+PARTITION_DATE_FORMAT = "%Y%m%d"
+
+
+def partition_name(table: str, day: date) -> str:
+    return f"{table}_p{day.strftime(PARTITION_DATE_FORMAT)}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def partition_day(table: str, name: str) -> date | None:
+    prefix = f"{table}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(name[len(prefix):], PARTITION_DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def create_partition_sql(table: str, day: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, day)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+    )
+
+
+def expired_partitions(table: str, names: list[str], cutoff: date) -> list[str]:
+    """Partitions of ``table`` holding only rows started before ``cutoff``."""
+    return sorted(
+        name for name in names
+        if (day := partition_day(table, name)) is not None and day + timedelta(days=1) <= cutoff
+    )
+
+
+async def list_partitions(connection, table: str) -> list[str]:
+    result = await connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    return [name for (name,) in result.all()]
+
+
+def day_range_sql(table: str) -> str:
+    column = PARTITIONED_TABLES[table]
+    return f"{column} >= :start AND {column} < :end"
+
+
+def day_bounds(day: date) -> dict:
+    start = datetime.combine(day, datetime.min.time())
+    return {"start": start, "end": start + timedelta(days=1)}
+
+
+async def default_has_rows(connection, table: str, day: date) -> bool:
+    return bool(await connection.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default_partition_name(table)} WHERE {day_range_sql(table)})"),
+        day_bounds(day),
+    ))
+
+
+async def create_day_partitions(connection, day: date, tables: list[str]) -> None:
+    """Creates ``day``'s partitions of ``tables``.
+
+    ``CREATE TABLE ... PARTITION OF`` fails while the DEFAULT partition holds
+    rows in the new range, e.g. after the maintenance loop was down. The
+    day's rows of both tables are then staged in temp tables and re-inserted
+    once the partitions exist. Attempts are staged first and restored last:
+    they reference jobs, and deleting jobs would cascade to them.
+    """
+    bounds = day_bounds(day)
+    staged = []
+    if any([await default_has_rows(connection, table, day) for table in tables]):
+        for table in RETENTION_ORDER:
+            staging = f"{partition_name(table, day)}_staging"
+            await connection.execute(text(
+                f"CREATE TEMP TABLE {staging} (LIKE {table}) ON COMMIT DROP"))
+            await connection.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {table} WHERE {day_range_sql(table)} RETURNING *) "
+                    f"INSERT INTO {staging} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+            staged.append((table, staging))
+        logger.warning("partition_default_rows_moved", day=day.isoformat())
+
+    for table in tables:
+        await connection.execute(text(create_partition_sql(table, day)))
+
+    for table, staging in reversed(staged):
+        await connection.execute(text(f"INSERT INTO {table} SELECT * FROM {staging}"))
+        await connection.execute(text(f"DROP TABLE {staging}"))
+
+
+async def create_partitions(connection, today: date, premake_days: int) -> list[str]:
+    existing = {table: set(await list_partitions(connection, table)) for table in PARTITIONED_TABLES}
+    for table in PARTITIONED_TABLES:
+        await connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)} PARTITION OF {table} DEFAULT"
+        ))
+
+    created = []
+    for offset in range(premake_days + 1):
+        day = today + timedelta(days=offset)
+        missing = [
+            table for table in PARTITIONED_TABLES
+            if partition_name(table, day) not in existing[table]
+        ]
+        if missing:
+            await create_day_partitions(connection, day, missing)
+            created += [partition_name(table, day) for table in missing]
+    return created
+
+
+async def drop_expired_partitions(connection, today: date, retention_days: int) -> list[str]:
+    cutoff = today - timedelta(days=retention_days)
+    dropped = []
+    for table in RETENTION_ORDER:
+        # Late writes for days whose partition is already gone land in the
+        # default partition; it stays small, so a plain DELETE is fine there.
+        await connection.execute(
+            text(
+                f"DELETE FROM {default_partition_name(table)} "
+                f"WHERE {PARTITIONED_TABLES[table]} < :cutoff"
+            ),
+            {"cutoff": datetime.combine(cutoff, datetime.min.time())},
+        )
+        for name in expired_partitions(table, await list_partitions(connection, table), cutoff):
+            # A jobs partition referenced by the attempts foreign key cannot be
+            # dropped while attached; detaching checks its attempts are gone.
+            await connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            await connection.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
+
+
+async def run_locked(step, *args):
+    """Runs ``step(connection, *args)`` in its own transaction under the
+    maintenance advisory lock; returns ``None`` if another replica holds it."""
+    async with database.engine.begin() as connection:
+        locked = await connection.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+            {"lock_id": MAINTENANCE_LOCK_ID},
+        )
+        if not locked:
+            logger.info("partition_maintenance_locked", step=step.__name__)
+            return None
+        return await step(connection, *args)
+
+
+async def maintain_partitions(today: date | None = None) -> dict:
+    """Creates the next ``job_partition_premake_days`` daily partitions and,
+    when ``job_retention_days`` is set, drops partitions past retention.
+
+    Each step runs in its own transaction under an advisory lock, so
+    replicas running it at the same time skip instead of racing on DDL, and
+    a failure creating partitions does not hold up retention. No-op outside
+    Postgres.
+    """
+    if database.engine.dialect.name != "postgresql":
+        return {"skipped": True}
+
+    today = today or datetime.now(UTC).date()
+    steps = {"created": (create_partitions, settings.job_partition_premake_days)}
+    if settings.job_retention_days is not None:
+        steps["dropped"] = (drop_expired_partitions, settings.job_retention_days)
+
+    results = {}
+    for key, (step, arg) in steps.items():
+        try:
+            results[key] = await run_locked(step, today, arg)
+        except Exception as e:
+            results[key] = None
+            logger.error(
+                "partition_maintenance_step_failed",
+                step=step.__name__,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True
+            )
+
+    logger.info("partition_maintenance_completed", **results)
+    return results
+
+
+async def run_partition_maintenance(interval_seconds: float):
+    logger.info("partition_maintenance_started", interval_seconds=interval_seconds)
+
+    while True:
+        try:
+            await maintain_partitions()
+        except Exception as e:
+            logger.error(
+                "partition_maintenance_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True
+            )
+
+        await asyncio.sleep(interval_seconds)
@@ -4,6 +4,7 @@ from core.logging import get_logger
 from db.database import get_session
 from db.models.job import Job as JobModel
 from models.job import Job as JobPydantic
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import delete, select
 
@@ -111,6 +112,18 @@ class JobRepository:
                 logger.error("get_all_jobs_error", error=str(e), error_type=type(e).__name__, exc_info=True)
                 raise Exception(str(e))
 
+    async def get_last_run_number(self, schedule_id: UUID) -> int:
+        async with get_session() as session:
+            try:
+                result = await session.execute(
+                    select(func.max(JobModel.run_number))
+                    .where(JobModel.schedule_id == schedule_id)
+                )
+                return result.scalar() or 0
+            except SQLAlchemyError as e:
+                logger.error("get_last_run_number_db_error", schedule_id=str(schedule_id), error=str(e), error_type=type(e).__name__, exc_info=True)
+                raise Exception(f"Database error occurred: {str(e)}")
+
     async def delete_jobs_by_schedule_id(self, schedule_id: UUID):
         logger.info("delete_jobs_by_schedule_started", schedule_id=str(schedule_id))
         async with get_session() as session:
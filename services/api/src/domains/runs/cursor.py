@@ -0,0 +1,24 @@
+import base64
+import json
+from datetime import UTC, datetime
+from uuid import UUID
+
+
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def encode_cursor(started_at: datetime, run_id: UUID) -> str:
+    payload = json.dumps([to_naive_utc(started_at).isoformat(), str(run_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, run_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(started_at), UUID(run_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,40 @@
+from db.models.job import Job as JobModel
+from sqlalchemy.orm import Bundle
+
+JOBS = JobModel.__table__
+KEY_FIELDS = ("id", "started_at")
+DETAIL_FIELDS = (
+    "request_headers",
+    "request_body",
+    "response_headers",
+    "response_body",
+    "redirect_history",
+)
+SUMMARY_FIELDS = tuple(
+    column.name for column in JOBS.c if column.name not in DETAIL_FIELDS
+)
+
+
+def parse_fields(values: list[str] | None, allowed: tuple[str, ...]) -> list[str] | None:
+    """Flatten repeated and comma-separated field names, rejecting unknown ones."""
+    if not values:
+        return None
+    fields = [name.strip() for value in values for name in value.split(",") if name.strip()]
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def run_projection(fields: list[str] | None = None, include: list[str] | None = None) -> Bundle:
+    """Columns to read for a run listing.
+
+    ``fields`` narrows the summary columns (all of them by default) and
+    ``include`` adds heavy JSON columns, which are otherwise never read. The
+    keyset columns are always selected.
+    """
+    names = list(KEY_FIELDS)
+    for name in [*(fields or SUMMARY_FIELDS), *(include or ())]:
+        if name not in names:
+            names.append(name)
+    return Bundle("run", *(JOBS.c[name] for name in names))
@@ -2,16 +2,20 @@ import asyncio
 from datetime import datetime
 from uuid import UUID
 
+from core.config import settings
 from core.logging import get_logger
 from db.database import get_session
 from db.models.attempt import Attempt
 from db.models.job import Job as JobModel
-from db.models.schedule import IntervalSchedule, WindowSchedule
+from db.models.schedule import Schedule
 from enums.job_status import JobStatus
-from sqlalchemy import case, func
+from sqlalchemy import func, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 
+from .cursor import to_naive_utc
+from .projection import run_projection
+
 logger = get_logger()
 
 
@@ -57,117 +61,86 @@ class RunRepository:
     async def get_runs_by_schedule_id(
         self,
         schedule_id: UUID,
-        status_filter: JobStatus | None = None,
+        status_filter: list[JobStatus] | None = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        **kwargs,
     ):
-        async with get_session() as session:
-            try:
-                interval_subquery = select(
-                    IntervalSchedule.id,
-                    IntervalSchedule.name
-                ).subquery()
-
-                window_subquery = select(
-                    WindowSchedule.id,
-                    WindowSchedule.name
-                ).subquery()
-
-                name_expr = case(
-                    (JobModel.schedule_id == interval_subquery.c.id,
-                     interval_subquery.c.name),
-                    (JobModel.schedule_id == window_subquery.c.id,
-                     window_subquery.c.name),
-                    else_=None
-                ).label('name')
-
-                query = select(JobModel, name_expr).where(
-                    JobModel.schedule_id == schedule_id
-                ).outerjoin(
-                    interval_subquery, JobModel.schedule_id == interval_subquery.c.id
-                ).outerjoin(
-                    window_subquery, JobModel.schedule_id == window_subquery.c.id
-                )
-
-                if status_filter:
-                    query = query.where(JobModel.status == status_filter)
-
-                if start_time:
-                    query = query.where(JobModel.started_at >= start_time)
-
-                if end_time:
-                    query = query.where(JobModel.started_at <= end_time)
-
-                query = query.order_by(JobModel.run_number.desc())
-
-                result = await session.execute(query)
-                rows = result.all()
-
-                jobs = []
-                for row in rows:
-                    job = row[0]
-                    name = row[1]
-                    jobs.append((job, name))
-
-                return jobs
-            except SQLAlchemyError as e:
-                raise Exception(f"Database error occurred: {str(e)}")
-            except Exception as e:
-                raise Exception(str(e))
+        return await self.get_all_runs(
+            status_filter, start_time, end_time, schedule_ids=[schedule_id], **kwargs)
 
     async def get_all_runs(
         self,
-        status_filter: JobStatus | None = None,
+        status_filter: list[JobStatus] | None = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        schedule_ids: list[UUID] | None = None,
+        min_latency_ms: float | None = None,
+        max_latency_ms: float | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
+        limit: int | None = None,
+        fields: list[str] | None = None,
+        include: list[str] | None = None,
     ):
+        """One page of runs, newest first, keyed on ``(started_at, id)``.
+
+        Returns the page and the ``(started_at, id)`` key to pass as ``cursor``
+        for the next one, or ``None`` on the last page. Only the columns from
+        ``run_projection(fields, include)`` are read, so request/response
+        bodies and headers stay in the database unless included.
+        """
+        limit = min(limit or settings.runs_page_size, settings.runs_max_page_size)
+        if isinstance(status_filter, JobStatus):
+            status_filter = [status_filter]
+
         async with get_session() as session:
             try:
-                interval_subquery = select(
-                    IntervalSchedule.id,
-                    IntervalSchedule.name
-                ).subquery()
-
-                window_subquery = select(
-                    WindowSchedule.id,
-                    WindowSchedule.name
-                ).subquery()
-
-                name_expr = case(
-                    (JobModel.schedule_id == interval_subquery.c.id,
-                     interval_subquery.c.name),
-                    (JobModel.schedule_id == window_subquery.c.id,
-                     window_subquery.c.name),
-                    else_=None
-                ).label('name')
-
-                query = select(JobModel, name_expr).outerjoin(
-                    interval_subquery, JobModel.schedule_id == interval_subquery.c.id
-                ).outerjoin(
-                    window_subquery, JobModel.schedule_id == window_subquery.c.id
-                )
+                query = select(
+                    run_projection(fields, include), Schedule.name.label('name')
+                ).outerjoin(Schedule, JobModel.schedule_id == Schedule.id)
+
+                if schedule_ids:
+                    query = query.where(JobModel.schedule_id.in_(schedule_ids))
 
                 if status_filter:
-                    query = query.where(JobModel.status == status_filter)
+                    query = query.where(JobModel.status.in_(status_filter))
 
                 if start_time:
-                    query = query.where(JobModel.started_at >= start_time)
+                    query = query.where(JobModel.started_at >= to_naive_utc(start_time))
 
                 if end_time:
-                    query = query.where(JobModel.started_at <= end_time)
+                    query = query.where(JobModel.started_at <= to_naive_utc(end_time))
+
+                if min_latency_ms is not None:
+                    query = query.where(JobModel.latency_ms >= min_latency_ms)
+
+                if max_latency_ms is not None:
+                    query = query.where(JobModel.latency_ms <= max_latency_ms)
+
+                if cursor:
+                    started_at, run_id = cursor
+                    # The plain bound lets Postgres prune partitions newer than
+                    # the cursor; the row comparison alone does not.
+                    query = query.where(
+                        JobModel.started_at <= to_naive_utc(started_at),
+                        tuple_(JobModel.started_at, JobModel.id)
+                        < tuple_(to_naive_utc(started_at), run_id),
+                    )
 
-                query = query.order_by(JobModel.run_number.desc())
+                query = query.order_by(
+                    JobModel.started_at.desc(), JobModel.id.desc()
+                ).limit(limit + 1)
 
                 result = await session.execute(query)
                 rows = result.all()
 
-                jobs = []
-                for row in rows:
-                    job = row[0]
-                    name = row[1]
-                    jobs.append((job, name))
+                jobs = [(row[0], row[1]) for row in rows[:limit]]
+                next_cursor = None
+                if len(rows) > limit:
+                    last = jobs[-1][0]
+                    next_cursor = (last.started_at, last.id)
 
-                return jobs
+                return jobs, next_cursor
             except SQLAlchemyError as e:
                 raise Exception(f"Database error occurred: {str(e)}")
             except Exception as e:
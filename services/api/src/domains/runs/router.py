@@ -2,65 +2,73 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from domains.runs.schemas import RunResponse
+from domains.runs.cursor import decode_cursor
+from domains.runs.projection import DETAIL_FIELDS, SUMMARY_FIELDS, parse_fields
+from domains.runs.schemas import RunListResponse, RunResponse
 from domains.runs.service import RunService
 from enums.job_status import JobStatus
 from fastapi import APIRouter, HTTPException, Query, status
-from models.response import HTTPResponse
+from models.response import HTTPResponse, list_response
 
 router = APIRouter(prefix="/runs", tags=["runs"])
 service = RunService()
 
 
+def parse_statuses(values: List[str] | None) -> List[JobStatus] | None:
+    """Case-insensitive status filter; unknown values are ignored as before."""
+    statuses = []
+    for value in values or []:
+        try:
+            statuses.append(JobStatus(value.lower()))
+        except ValueError:
+            pass
+    return statuses or None
+
+
 @router.get(
     "",
-    response_model=HTTPResponse[List[RunResponse]],
+    response_model=HTTPResponse[List[RunListResponse]],
     response_model_exclude_none=True,
     tags=["get all runs"],
     status_code=status.HTTP_200_OK,
 )
 async def get_all_runs(
-    schedule_id: UUID | None = Query(None),
-    status_filter: str | None = Query(None, alias="status"),
-    start_time: str | None = Query(None),
-    end_time: str | None = Query(None),
+    schedule_id: List[UUID] | None = Query(None),
+    status_filter: List[str] | None = Query(None, alias="status"),
+    start_time: datetime | None = Query(None),
+    end_time: datetime | None = Query(None),
+    min_latency_ms: float | None = Query(None, ge=0),
+    max_latency_ms: float | None = Query(None, ge=0),
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1),
+    fields: List[str] | None = Query(None),
+    include: List[str] | None = Query(None),
 ):
     try:
-        status_enum = None
-        if status_filter:
-            try:
-                status_enum = JobStatus(status_filter.lower())
-            except ValueError:
-                pass
-
-        start_dt = None
-        end_dt = None
-        if start_time:
-            try:
-                start_dt = datetime.fromisoformat(
-                    start_time.replace("Z", "+00:00"))
-            except Exception:
-                pass
-        if end_time:
-            try:
-                end_dt = datetime.fromisoformat(
-                    end_time.replace("Z", "+00:00"))
-            except Exception:
-                pass
+        cursor_key = decode_cursor(cursor) if cursor else None
+        fields = parse_fields(fields, SUMMARY_FIELDS)
+        include = parse_fields(include, DETAIL_FIELDS)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-        if schedule_id:
-            run_pydantics = await service.get_runs_by_schedule_id(
-                schedule_id, status_enum, start_dt, end_dt
-            )
-        else:
-            run_pydantics = await service.get_all_runs(status_enum, start_dt, end_dt)
-        run_responses = [RunResponse(**r.model_dump()) for r in run_pydantics]
-        return HTTPResponse(
-            success=True,
-            status_code=status.HTTP_200_OK,
-            message="Runs retrieved successfully",
-            data=run_responses,
+    try:
+        runs, next_cursor = await service.get_all_runs(
+            parse_statuses(status_filter),
+            start_time,
+            end_time,
+            schedule_ids=schedule_id,
+            min_latency_ms=min_latency_ms,
+            max_latency_ms=max_latency_ms,
+            cursor=cursor_key,
+            limit=limit,
+            fields=fields,
+            include=include,
         )
+        return list_response(
+            RunListResponse, runs, "Runs retrieved successfully", next_cursor)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
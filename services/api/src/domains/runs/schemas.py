@@ -3,10 +3,28 @@ from typing import Any
 from uuid import UUID
 
 from enums.job_status import JobStatus
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
+# httpcore resolves the host inside its TCP connect, so DNS is not timed separately.
+CONNECT_MS_DESCRIPTION = "DNS lookup plus TCP connect time; null when a pooled connection was reused"
 
-class AttemptResponse(BaseModel):
+
+class ResponseBodyMixin(BaseModel):
+    """Coerces stored response bodies that are not JSON-compatible to strings."""
+
+    @field_validator('response_body', mode='before', check_fields=False)
+    @classmethod
+    def validate_response_body(cls, v):
+        if v is None:
+            return v
+        if isinstance(v, (dict, str)):
+            return v
+        if isinstance(v, (list, int, float, bool)):
+            return v
+        return str(v)
+
+
+class AttemptResponse(ResponseBodyMixin):
     id: UUID
     attempt_number: int
     started_at: datetime
@@ -14,34 +32,39 @@ class AttemptResponse(BaseModel):
     status_code: int | None
     latency_ms: float | None
     response_size_bytes: int | None
+    response_sha256: str | None = None
+    response_truncated: bool | None = None
+    http_version: str | None = None
+    connect_ms: float | None = Field(None, description=CONNECT_MS_DESCRIPTION)
+    tls_ms: float | None = None
+    ttfb_ms: float | None = None
+    download_ms: float | None = None
     response_headers: dict[str, str] | None
     response_body: dict[str, Any] | str | None
     error_message: str | None
     created_at: datetime
     updated_at: datetime
 
-    @field_validator('response_body', mode='before')
-    @classmethod
-    def validate_response_body(cls, v):
-        if v is None:
-            return v
-        if isinstance(v, (dict, str)):
-            return v
-        if isinstance(v, (list, int, float, bool)):
-            return v
-        return str(v)
-
 
-class RunResponse(BaseModel):
+class RunResponse(ResponseBodyMixin):
     id: UUID
     schedule_id: UUID
     name: str | None = None
     run_number: int
     started_at: datetime
+    scheduled_at: datetime | None = None
+    missed_runs: int | None = None
     status: JobStatus
     status_code: int | None
     latency_ms: float | None
     response_size_bytes: int | None
+    response_sha256: str | None = None
+    response_truncated: bool | None = None
+    http_version: str | None = None
+    connect_ms: float | None = Field(None, description=CONNECT_MS_DESCRIPTION)
+    tls_ms: float | None = None
+    ttfb_ms: float | None = None
+    download_ms: float | None = None
     request_headers: dict[str, str] | None
     request_body: dict[str, Any] | None
     response_headers: dict[str, str] | None
@@ -54,13 +77,33 @@ class RunResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator('response_body', mode='before')
-    @classmethod
-    def validate_response_body(cls, v):
-        if v is None:
-            return v
-        if isinstance(v, (dict, str)):
-            return v
-        if isinstance(v, (list, int, float, bool)):
-            return v
-        return str(v)
+
+class RunListResponse(ResponseBodyMixin):
+    id: UUID
+    started_at: datetime
+    schedule_id: UUID | None = None
+    name: str | None = None
+    run_number: int | None = None
+    scheduled_at: datetime | None = None
+    missed_runs: int | None = None
+    status: JobStatus | None = None
+    status_code: int | None = None
+    latency_ms: float | None = None
+    response_size_bytes: int | None = None
+    response_sha256: str | None = None
+    response_truncated: bool | None = None
+    http_version: str | None = None
+    connect_ms: float | None = Field(None, description=CONNECT_MS_DESCRIPTION)
+    tls_ms: float | None = None
+    ttfb_ms: float | None = None
+    download_ms: float | None = None
+    request_headers: dict[str, str] | None = None
+    request_body: dict[str, Any] | None = None
+    response_headers: dict[str, str] | None = None
+    response_body: dict[str, Any] | str | None = None
+    error_message: str | None = None
+    redirected: bool | None = None
+    redirect_count: int | None = None
+    redirect_history: list[dict[str, Any]] | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
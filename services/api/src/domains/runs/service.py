@@ -3,7 +3,13 @@ from uuid import UUID
 
 from enums.job_status import JobStatus
 
+from pydantic import TypeAdapter
+
+from .cursor import encode_cursor
 from .repository import RunRepository
+from .schemas import RunListResponse
+
+RUN_LIST_ADAPTER = TypeAdapter(list[RunListResponse])
 
 
 class RunService:
@@ -26,45 +32,38 @@ class RunService:
         except Exception as e:
             raise Exception(str(e))
 
+    def _to_page(self, runs, next_key):
+        result = RUN_LIST_ADAPTER.validate_python(
+            [{**db_run._asdict(), "name": name} for db_run, name in runs])
+        return result, encode_cursor(*next_key) if next_key else None
+
     async def get_runs_by_schedule_id(
         self,
         schedule_id: UUID,
-        status_filter: JobStatus | None = None,
+        status_filter: list[JobStatus] | None = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        **kwargs,
     ):
         try:
-            runs = await self.repository.get_runs_by_schedule_id(
-                schedule_id, status_filter, start_time, end_time
+            runs, next_key = await self.repository.get_runs_by_schedule_id(
+                schedule_id, status_filter, start_time, end_time, **kwargs
             )
-            result = []
-            for db_run, name in runs:
-                run_pydantic = db_run.to_pydantic_model()
-                run_dict = run_pydantic.model_dump()
-                run_dict['name'] = name
-                from models.job import Job as JobPydantic
-                result.append(JobPydantic(**run_dict))
-            return result
+            return self._to_page(runs, next_key)
         except Exception as e:
             raise Exception(str(e))
 
     async def get_all_runs(
         self,
-        status_filter: JobStatus | None = None,
+        status_filter: list[JobStatus] | None = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        **kwargs,
     ):
         try:
-            runs = await self.repository.get_all_runs(
-                status_filter, start_time, end_time
+            runs, next_key = await self.repository.get_all_runs(
+                status_filter, start_time, end_time, **kwargs
             )
-            result = []
-            for db_run, name in runs:
-                run_pydantic = db_run.to_pydantic_model()
-                run_dict = run_pydantic.model_dump()
-                run_dict['name'] = name
-                from models.job import Job as JobPydantic
-                result.append(JobPydantic(**run_dict))
-            return result
+            return self._to_page(runs, next_key)
         except Exception as e:
             raise Exception(str(e))
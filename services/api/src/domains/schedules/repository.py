@@ -3,10 +3,8 @@ from uuid import UUID
 
 from core.decorators import log
 from core.logging import get_logger
-from db.database import get_session
-from db.models.schedule import IntervalSchedule as IntervalScheduleModel
+from db.database import get_session, notify_change
 from db.models.schedule import Schedule as ScheduleModel
-from db.models.schedule import WindowSchedule as WindowScheduleModel
 from models.schedule import Schedule as SchedulePydantic
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import delete, select
@@ -21,6 +19,7 @@ class ScheduleRepository:
             try:
                 db_schedule = schedule.to_db_model()
                 session.add(db_schedule)
+                await notify_change(session, "schedule", db_schedule.id, "created")
                 await session.commit()
                 await session.refresh(db_schedule)
                 logger.info("schedule_created", schedule_id=str(
@@ -39,29 +38,15 @@ class ScheduleRepository:
     async def get_schedule_by_id(self, schedule_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                interval_schedule = interval_result.scalar_one_or_none()
+                schedule = result.scalar_one_or_none()
 
-                if interval_schedule:
-                    logger.debug("interval_schedule_found",
-                                 schedule_id=str(schedule_id))
-                    return interval_schedule
-
-                window_result = await session.execute(
-                    select(WindowScheduleModel).where(
-                        WindowScheduleModel.id == schedule_id
-                    )
-                )
-                window_schedule = window_result.scalar_one_or_none()
-
-                if window_schedule:
-                    logger.debug("window_schedule_found",
-                                 schedule_id=str(schedule_id))
-                    return window_schedule
+                if schedule:
+                    logger.debug("schedule_found", schedule_id=str(schedule_id),
+                                 schedule_type=schedule.schedule_type.value)
+                    return schedule
 
                 logger.warning("schedule_not_found",
                                schedule_id=str(schedule_id))
@@ -80,14 +65,8 @@ class ScheduleRepository:
     async def get_all_schedules(self):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(select(IntervalScheduleModel))
-                interval_schedules = interval_result.scalars().all()
-
-                window_result = await session.execute(select(WindowScheduleModel))
-                window_schedules = window_result.scalars().all()
-
-                all_schedules = list(interval_schedules) + \
-                    list(window_schedules)
+                result = await session.execute(select(ScheduleModel))
+                all_schedules = list(result.scalars().all())
                 logger.info("get_all_schedules_success",
                             count=len(all_schedules))
                 return all_schedules
@@ -104,21 +83,10 @@ class ScheduleRepository:
     async def get_schedules_by_target_id(self, target_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.target_id == target_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.target_id == target_id)
                 )
-                interval_schedules = interval_result.scalars().all()
-
-                window_result = await session.execute(
-                    select(WindowScheduleModel).where(
-                        WindowScheduleModel.target_id == target_id
-                    )
-                )
-                window_schedules = window_result.scalars().all()
-
-                schedules = list(interval_schedules) + list(window_schedules)
+                schedules = list(result.scalars().all())
                 logger.info("get_schedules_by_target_success",
                             target_id=str(target_id), count=len(schedules))
                 return schedules
@@ -135,23 +103,18 @@ class ScheduleRepository:
     async def delete_schedules_by_target_id(self, target_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    delete(IntervalScheduleModel).where(
-                        IntervalScheduleModel.target_id == target_id
-                    ).returning(IntervalScheduleModel.id)
-                )
-                interval_count = len(interval_result.all())
-
-                window_result = await session.execute(
-                    delete(WindowScheduleModel).where(
-                        WindowScheduleModel.target_id == target_id
-                    ).returning(WindowScheduleModel.id)
+                result = await session.execute(
+                    delete(ScheduleModel).where(
+                        ScheduleModel.target_id == target_id
+                    ).returning(ScheduleModel.id)
                 )
-                window_count = len(window_result.all())
+                deleted_ids = list(result.scalars().all())
 
+                for schedule_id in deleted_ids:
+                    await notify_change(session, "schedule", schedule_id, "deleted")
                 await session.commit()
                 logger.info("delete_schedules_by_target_success", target_id=str(
-                    target_id), deleted_count=interval_count + window_count)
+                    target_id), deleted_count=len(deleted_ids))
             except SQLAlchemyError as e:
                 logger.error("delete_schedules_by_target_db_error", target_id=str(
                     target_id), error=str(e), error_type=type(e).__name__, exc_info=True)
@@ -165,20 +128,10 @@ class ScheduleRepository:
     async def delete_schedule(self, schedule_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                schedule = interval_result.scalar_one_or_none()
-
-                if not schedule:
-                    window_result = await session.execute(
-                        select(WindowScheduleModel).where(
-                            WindowScheduleModel.id == schedule_id
-                        )
-                    )
-                    schedule = window_result.scalar_one_or_none()
+                schedule = result.scalar_one_or_none()
 
                 if not schedule:
                     logger.warning("delete_schedule_not_found",
@@ -187,6 +140,7 @@ class ScheduleRepository:
                         f"Schedule with id {schedule_id} not found")
 
                 await session.delete(schedule)
+                await notify_change(session, "schedule", schedule_id, "deleted")
                 await session.commit()
                 logger.info("delete_schedule_success",
                             schedule_id=str(schedule_id))
@@ -205,20 +159,10 @@ class ScheduleRepository:
     async def pause_schedule(self, schedule_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                schedule = interval_result.scalar_one_or_none()
-
-                if not schedule:
-                    window_result = await session.execute(
-                        select(WindowScheduleModel).where(
-                            WindowScheduleModel.id == schedule_id
-                        )
-                    )
-                    schedule = window_result.scalar_one_or_none()
+                schedule = result.scalar_one_or_none()
 
                 if not schedule:
                     logger.warning("pause_schedule_not_found",
@@ -227,8 +171,8 @@ class ScheduleRepository:
                         f"Schedule with id {schedule_id} not found")
 
                 schedule.paused = True
-                schedule.temporal_workflow_id = None
                 session.add(schedule)
+                await notify_change(session, "schedule", schedule_id, "paused")
                 await session.commit()
                 await session.refresh(schedule)
                 logger.info("pause_schedule_success",
@@ -248,20 +192,10 @@ class ScheduleRepository:
     async def resume_schedule(self, schedule_id: UUID):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                schedule = interval_result.scalar_one_or_none()
-
-                if not schedule:
-                    window_result = await session.execute(
-                        select(WindowScheduleModel).where(
-                            WindowScheduleModel.id == schedule_id
-                        )
-                    )
-                    schedule = window_result.scalar_one_or_none()
+                schedule = result.scalar_one_or_none()
 
                 if not schedule:
                     logger.warning("resume_schedule_not_found",
@@ -271,6 +205,7 @@ class ScheduleRepository:
 
                 schedule.paused = False
                 session.add(schedule)
+                await notify_change(session, "schedule", schedule_id, "resumed")
                 await session.commit()
                 await session.refresh(schedule)
                 logger.info("resume_schedule_success",
@@ -290,20 +225,10 @@ class ScheduleRepository:
     async def update_schedule(self, schedule_id: UUID, schedule: SchedulePydantic):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                existing_schedule = interval_result.scalar_one_or_none()
-
-                if not existing_schedule:
-                    window_result = await session.execute(
-                        select(WindowScheduleModel).where(
-                            WindowScheduleModel.id == schedule_id
-                        )
-                    )
-                    existing_schedule = window_result.scalar_one_or_none()
+                existing_schedule = result.scalar_one_or_none()
 
                 if not existing_schedule:
                     logger.warning("update_schedule_not_found",
@@ -312,7 +237,14 @@ class ScheduleRepository:
                         f"Schedule with id {schedule_id} not found")
 
                 existing_schedule.interval_seconds = schedule.interval_seconds
+                if schedule.misfire_policy is not None:
+                    existing_schedule.misfire_policy = schedule.misfire_policy
+                if schedule.max_catch_up_runs is not None:
+                    existing_schedule.max_catch_up_runs = schedule.max_catch_up_runs
+                if schedule.priority is not None:
+                    existing_schedule.priority = schedule.priority
                 session.add(existing_schedule)
+                await notify_change(session, "schedule", schedule_id, "updated")
                 await session.commit()
                 await session.refresh(existing_schedule)
                 logger.info("update_schedule_success",
@@ -332,20 +264,10 @@ class ScheduleRepository:
     async def update_workflow_id(self, schedule_id: UUID, workflow_id: str):
         async with get_session() as session:
             try:
-                interval_result = await session.execute(
-                    select(IntervalScheduleModel).where(
-                        IntervalScheduleModel.id == schedule_id
-                    )
+                result = await session.execute(
+                    select(ScheduleModel).where(ScheduleModel.id == schedule_id)
                 )
-                schedule = interval_result.scalar_one_or_none()
-
-                if not schedule:
-                    window_result = await session.execute(
-                        select(WindowScheduleModel).where(
-                            WindowScheduleModel.id == schedule_id
-                        )
-                    )
-                    schedule = window_result.scalar_one_or_none()
+                schedule = result.scalar_one_or_none()
 
                 if not schedule:
                     logger.warning("update_workflow_id_not_found",
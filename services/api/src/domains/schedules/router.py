@@ -5,14 +5,16 @@ from typing import List
 from uuid import UUID
 
 from core.decorators import log
-from domains.runs.schemas import RunResponse
+from domains.runs.cursor import decode_cursor
+from domains.runs.projection import DETAIL_FIELDS, SUMMARY_FIELDS, parse_fields
+from domains.runs.schemas import RunListResponse
 from domains.runs.service import RunService
 from domains.schedules.schemas import (IntervalScheduleRequest,
                                        ScheduleResponse, WindowScheduleRequest)
 from domains.schedules.service import ScheduleService
 from enums.job_status import JobStatus
 from fastapi import APIRouter, Body, HTTPException, Query, status
-from models.response import HTTPResponse
+from models.response import HTTPResponse, list_response
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 service = ScheduleService()
@@ -59,14 +61,9 @@ async def create_schedule(schedule_data: dict = Body(...)):
 @log(operation_name="api.GET /schedules")
 async def get_all_schedules():
     try:
-        schedule_pydantics = await service.get_all_schedules()
-        schedule_responses = [s.to_response() for s in schedule_pydantics]
-        return HTTPResponse(
-            success=True,
-            status_code=status.HTTP_200_OK,
-            message="Schedules retrieved successfully",
-            data=schedule_responses,
-        )
+        schedule_responses = await service.get_all_schedules()
+        return list_response(
+            ScheduleResponse, schedule_responses, "Schedules retrieved successfully")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -232,7 +229,7 @@ async def delete_schedule(id: UUID):
 
 @router.get(
     "/{id}/runs",
-    response_model=HTTPResponse[List],
+    response_model=HTTPResponse[List[RunListResponse]],
     response_model_exclude_none=True,
     tags=["get schedule runs"],
     status_code=status.HTTP_200_OK,
@@ -240,45 +237,33 @@ async def delete_schedule(id: UUID):
 @log(operation_name="api.GET /schedules/{id}/runs", log_args=False)
 async def get_schedule_runs(
     id: UUID,
-    status_filter: str | None = Query(None, alias="status"),
-    start_time: str | None = Query(None),
-    end_time: str | None = Query(None),
+    status_filter: List[JobStatus] | None = Query(None, alias="status"),
+    start_time: datetime | None = Query(None),
+    end_time: datetime | None = Query(None),
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1),
+    fields: List[str] | None = Query(None),
+    include: List[str] | None = Query(None),
 ):
     try:
-        run_service = RunService()
-
-        status_enum = None
-        if status_filter:
-            try:
-                status_enum = JobStatus(status_filter.lower())
-            except ValueError:
-                pass
+        cursor_key = decode_cursor(cursor) if cursor else None
+        fields = parse_fields(fields, SUMMARY_FIELDS)
+        include = parse_fields(include, DETAIL_FIELDS)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-        start_dt = None
-        end_dt = None
-        if start_time:
-            try:
-                start_dt = datetime.fromisoformat(
-                    start_time.replace("Z", "+00:00"))
-            except Exception:
-                pass
-        if end_time:
-            try:
-                end_dt = datetime.fromisoformat(
-                    end_time.replace("Z", "+00:00"))
-            except Exception:
-                pass
+    try:
+        run_service = RunService()
 
-        run_pydantics = await run_service.get_runs_by_schedule_id(
-            id, status_enum, start_dt, end_dt
-        )
-        run_responses = [RunResponse(**r.model_dump()) for r in run_pydantics]
-        return HTTPResponse(
-            success=True,
-            status_code=status.HTTP_200_OK,
-            message="Runs retrieved successfully",
-            data=run_responses,
+        runs, next_cursor = await run_service.get_runs_by_schedule_id(
+            id, status_filter, start_time, end_time, cursor=cursor_key, limit=limit,
+            fields=fields, include=include,
         )
+        return list_response(
+            RunListResponse, runs, "Runs retrieved successfully", next_cursor)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
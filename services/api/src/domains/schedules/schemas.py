@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from enums.misfire_policy import MisfirePolicy
+from enums.schedule_priority import SchedulePriority
 from models.schedule import IntervalSchedule, WindowSchedule
 
 
@@ -15,6 +17,17 @@ class ScheduleRequestBase(BaseModel):
     interval_seconds: int = Field(
         ..., gt=0, description="Interval in seconds between runs"
     )
+    misfire_policy: MisfirePolicy = Field(
+        MisfirePolicy.COALESCE,
+        description="How runs missed while workers were down are handled",
+    )
+    max_catch_up_runs: int = Field(
+        3, ge=0, description="Missed runs replayed under the catch_up policy"
+    )
+    priority: SchedulePriority = Field(
+        SchedulePriority.NORMAL,
+        description="Priority class of the task queue the schedule's requests run on",
+    )
 
     def to_model(self):
         raise NotImplementedError("ScheduleRequest must be subclassed")
@@ -45,6 +58,9 @@ class IntervalScheduleResponse(BaseModel):
     target_id: UUID
     interval_seconds: int
     paused: bool
+    misfire_policy: MisfirePolicy | None = None
+    max_catch_up_runs: int | None = None
+    priority: SchedulePriority | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -56,6 +72,9 @@ class WindowScheduleResponse(BaseModel):
     interval_seconds: int
     duration_seconds: int
     paused: bool
+    misfire_policy: MisfirePolicy | None = None
+    max_catch_up_runs: int | None = None
+    priority: SchedulePriority | None = None
     created_at: datetime
     updated_at: datetime
 
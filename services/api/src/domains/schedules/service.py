@@ -2,16 +2,62 @@ from typing import List
 from uuid import UUID
 
 from core.decorators import log
+from core.logging import get_logger
 from domains.jobs.repository import JobRepository
 from models.schedule import Schedule
-from temporal.client import get_temporal_client, start_schedule_workflow
+from temporal.client import (get_temporal_client, start_schedule_workflow,
+                             temporal_client_manager)
+from temporalio.client import WorkflowExecutionStatus
+from temporalio.service import RPCError, RPCStatusCode
 
 from .repository import ScheduleRepository
+from .schemas import IntervalScheduleResponse, WindowScheduleResponse
+
+logger = get_logger()
+
+RESPONSE_TYPES = {
+    "interval": IntervalScheduleResponse,
+    "window": WindowScheduleResponse,
+}
 
 
 class ScheduleService:
     repository = ScheduleRepository()
 
+    async def _signal_workflow(self, db_schedule, signal: str, *args) -> bool:
+        try:
+            client = await get_temporal_client()
+            handle = client.get_workflow_handle(db_schedule.temporal_workflow_id)
+            await handle.signal(signal, *args)
+            return True
+        except Exception as e:
+            temporal_client_manager.handle_error(e)
+            logger.warning(
+                "schedule_workflow_signal_failed",
+                schedule_id=str(db_schedule.id),
+                signal=signal,
+                error=str(e),
+            )
+            return False
+
+    async def _terminate_workflow(self, schedule_id: UUID):
+        from temporal.client import terminate_schedule_workflow
+        client = await get_temporal_client()
+        try:
+            await terminate_schedule_workflow(schedule_id, client)
+        except RPCError as e:
+            if e.status != RPCStatusCode.NOT_FOUND:
+                temporal_client_manager.handle_error(e)
+                raise
+
+    async def _restart_workflow(self, schedule_id: UUID, db_schedule, client):
+        last_run_number = await JobRepository().get_last_run_number(schedule_id)
+        workflow_id = await start_schedule_workflow(
+            schedule_id, db_schedule.get_workflow_type(), client,
+            run_number=last_run_number + 1,
+        )
+        await self.repository.update_workflow_id(schedule_id, workflow_id)
+
     @log(operation_name="service.create_schedule", log_args=False)
     async def create_schedule(self, schedule: Schedule):
         try:
@@ -26,6 +72,7 @@ class ScheduleService:
 
             return db_schedule.to_pydantic_model()
         except Exception as e:
+            temporal_client_manager.handle_error(e)
             raise Exception(str(e))
 
     @log(operation_name="service.get_schedule_by_id", log_args=False)
@@ -40,7 +87,11 @@ class ScheduleService:
     async def get_all_schedules(self):
         try:
             db_schedules = await self.repository.get_all_schedules()
-            return [db_schedule.to_pydantic_model() for db_schedule in db_schedules]
+            return [
+                RESPONSE_TYPES[db_schedule.get_workflow_type()].model_validate(
+                    db_schedule, from_attributes=True)
+                for db_schedule in db_schedules
+            ]
         except Exception as e:
             raise Exception(str(e))
 
@@ -54,8 +105,8 @@ class ScheduleService:
                 client = await get_temporal_client()
                 try:
                     await terminate_schedule_workflow(schedule_id, client)
-                except Exception:
-                    pass
+                except Exception as e:
+                    temporal_client_manager.handle_error(e)
 
             job_repo = JobRepository()
             await job_repo.delete_jobs_by_schedule_id(schedule_id)
@@ -68,17 +119,13 @@ class ScheduleService:
     @log(operation_name="service.pause_schedule", log_args=False)
     async def pause_schedule(self, schedule_id: UUID):
         try:
-            db_schedule = await self.repository.get_schedule_by_id(schedule_id)
+            db_schedule = await self.repository.pause_schedule(schedule_id)
 
-            if db_schedule.temporal_workflow_id:
-                from temporal.client import terminate_schedule_workflow
-                client = await get_temporal_client()
-                try:
-                    await terminate_schedule_workflow(schedule_id, client)
-                except Exception:
-                    pass
+            if db_schedule.temporal_workflow_id and not await self._signal_workflow(
+                    db_schedule, "pause"):
+                # Resume restarts a workflow that is no longer running.
+                await self._terminate_workflow(schedule_id)
 
-            db_schedule = await self.repository.pause_schedule(schedule_id)
             return db_schedule.to_pydantic_model()
         except Exception as e:
             raise Exception(str(e))
@@ -93,25 +140,36 @@ class ScheduleService:
                 try:
                     workflow_id = f"schedule-{schedule_id}"
                     handle = client.get_workflow_handle(workflow_id)
-                    await handle.describe()
-                except Exception:
-                    workflow_id = await start_schedule_workflow(
-                        schedule_id, db_schedule.get_workflow_type(), client
-                    )
-                    await self.repository.update_workflow_id(schedule_id, workflow_id)
+                    description = await handle.describe()
+                    if description.status != WorkflowExecutionStatus.RUNNING:
+                        raise Exception(f"Workflow {workflow_id} is not running")
+                    await handle.signal("resume")
+                except Exception as e:
+                    temporal_client_manager.handle_error(e)
+                    await self._restart_workflow(schedule_id, db_schedule, client)
             else:
-                workflow_id = await start_schedule_workflow(
-                    schedule_id, db_schedule.get_workflow_type(), client
-                )
-                await self.repository.update_workflow_id(schedule_id, workflow_id)
+                await self._restart_workflow(schedule_id, db_schedule, client)
             return db_schedule.to_pydantic_model()
         except Exception as e:
+            temporal_client_manager.handle_error(e)
             raise Exception(str(e))
 
     @log(operation_name="service.update_schedule", log_args=False)
     async def update_schedule(self, schedule_id: UUID, schedule: Schedule):
         try:
             db_schedule = await self.repository.update_schedule(schedule_id, schedule)
+
+            if db_schedule.temporal_workflow_id:
+                await self._signal_workflow(
+                    db_schedule, "update_schedule",
+                    {
+                        "interval_seconds": db_schedule.interval_seconds,
+                        "misfire_policy": db_schedule.misfire_policy.value,
+                        "max_catch_up_runs": db_schedule.max_catch_up_runs,
+                        "priority": db_schedule.priority.value,
+                    },
+                )
+
             return db_schedule.to_pydantic_model()
         except Exception as e:
             raise Exception(str(e))
@@ -2,7 +2,7 @@ import asyncio
 from uuid import UUID
 
 from core.logging import get_logger
-from db.database import get_session
+from db.database import get_session, notify_change
 from db.models.target import Target as TargetModel
 from db.models.url import URL as URLModel
 from domains.schedules.repository import ScheduleRepository
@@ -75,6 +75,7 @@ class TargetRepository:
                     db_target.headers = {}
 
                 session.add(db_target)
+                await notify_change(session, "target", db_target.id, "created")
                 await session.commit()
                 await session.refresh(db_target)
                 await session.refresh(db_url)
@@ -160,6 +161,7 @@ class TargetRepository:
                 existing_target.url_id = db_url.id
 
                 session.add(existing_target)
+                await notify_change(session, "target", target_id, "updated")
                 await session.commit()
                 await session.refresh(existing_target)
                 await session.refresh(db_url)
@@ -209,6 +211,7 @@ class TargetRepository:
                 logger.debug("deleting_target_record",
                              target_id=str(target_id))
                 await session.delete(target)
+                await notify_change(session, "target", target_id, "deleted")
                 await session.commit()
 
                 logger.info("delete_target_success", target_id=str(target_id))
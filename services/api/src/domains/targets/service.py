@@ -2,6 +2,7 @@ from uuid import UUID
 
 from core.logging import get_logger
 from models.target import Target
+from temporal.client import get_temporal_client, temporal_client_manager
 
 from .repository import TargetRepository
 
@@ -11,6 +12,21 @@ logger = get_logger()
 class TargetService:
     repository = TargetRepository()
 
+    async def _refresh_schedule_workflows(self, schedules):
+        workflow_ids = [s.temporal_workflow_id for s in schedules if s.temporal_workflow_id]
+        if not workflow_ids:
+            return
+        try:
+            client = await get_temporal_client()
+            for workflow_id in workflow_ids:
+                try:
+                    await client.get_workflow_handle(workflow_id).signal("refresh_config")
+                except Exception as e:
+                    temporal_client_manager.handle_error(e)
+                    logger.warning("service_refresh_schedule_workflow_failed", workflow_id=workflow_id, error=str(e))
+        except Exception as e:
+            logger.warning("service_refresh_schedule_workflows_failed", error=str(e))
+
     async def get_target_by_id(self, target_id: UUID):
         logger.debug("service_get_target_by_id", target_id=str(target_id))
         try:
@@ -45,6 +61,8 @@ class TargetService:
         logger.info("service_update_target", target_id=str(target_id), url=target.url)
         try:
             db_target, url = await self.repository.update_target(target_id, target)
+            schedules = await self.repository.schedule_repository.get_schedules_by_target_id(target_id)
+            await self._refresh_schedule_workflows(schedules)
             return db_target.to_pydantic_model(url.get_url_string())
         except Exception as e:
             logger.error("service_update_target_error", target_id=str(target_id), error=str(e))
@@ -53,7 +71,9 @@ class TargetService:
     async def delete_target(self, target_id: UUID):
         logger.info("service_delete_target", target_id=str(target_id))
         try:
+            schedules = await self.repository.schedule_repository.get_schedules_by_target_id(target_id)
             db_target, url = await self.repository.delete_target(target_id)
+            await self._refresh_schedule_workflows(schedules)
             return db_target.to_pydantic_model(url.get_url_string())
         except Exception as e:
             logger.error("service_delete_target_error", target_id=str(target_id), error=str(e))
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from db.database import get_session
+from db.database import get_session, notify_change
 from db.models.url import URL as URLModel
 from sqlmodel import delete, select
 
@@ -33,6 +33,7 @@ class URLRepository:
                 await session.execute(
                     delete(URLModel).where(URLModel.id == url_id)
                 )
+                await notify_change(session, "url", url_id, "deleted")
                 await session.commit()
             except Exception as e:
                 raise Exception(f"Error deleting url: {str(e)}")
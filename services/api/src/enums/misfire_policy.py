@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class MisfirePolicy(str, Enum):
+    SKIP = "skip"
+    COALESCE = "coalesce"
+    CATCH_UP = "catch_up"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class SchedulePriority(str, Enum):
+    CRITICAL = "critical"
+    NORMAL = "normal"
+    LOW = "low"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ServiceRole(str, Enum):
+    API = "api"
+    WORKER = "worker"
+    BOTH = "both"
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 
 import structlog
 import uvicorn
@@ -8,20 +8,26 @@ from core.config import settings
 from core.db_monitor import monitor_db_pool
 from core.logging import setup_logging
 from core.otel import setup_opentelemetry
-from db.database import engine
+from db.database import change_listener, engine
+from db.partitions import run_partition_maintenance
 from domains.health.router import router as health_router
 from domains.runs.router import router as runs_router
 from domains.schedules.router import router as schedules_router
 from domains.targets.router import router as targets_router
+from enums.service_role import ServiceRole
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from middleware.logging import LoggingMiddleware
 from middleware.observability import ObservabilityMiddleware
+from temporal.client import temporal_client_manager
 from temporal.worker_service import temporal_worker_lifespan
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.role == ServiceRole.WORKER:
+        raise RuntimeError("ROLE=worker serves no API; start the worker with src/worker.py")
+
     logger = setup_logging(
         log_level=settings.log_level,
     )
@@ -35,19 +41,27 @@ async def lifespan(app: FastAPI):
         "application_starting",
         service=settings.otel_service_name,
         environment="development" if settings.dev else "production",
+        role=settings.role.value,
     )
 
     monitor_task = asyncio.create_task(monitor_db_pool(engine, interval_seconds=30))
+    partition_task = asyncio.create_task(run_partition_maintenance(
+        settings.job_partition_maintenance_interval_seconds))
+    await change_listener.start()
 
-    async with temporal_worker_lifespan():
+    runs_worker = settings.role != ServiceRole.API
+    async with temporal_worker_lifespan() if runs_worker else nullcontext():
         logger.info("application_ready")
         yield
         logger.info("application_shutting_down")
-        monitor_task.cancel()
-        try:
-            await monitor_task
-        except asyncio.CancelledError:
-            pass
+        for task in (monitor_task, partition_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await change_listener.stop()
+        temporal_client_manager.close()
 
 
 def create_app():
@@ -15,6 +15,13 @@ class Attempt(BaseModel):
     status_code: int | None = None
     latency_ms: float | None = None
     response_size_bytes: int | None = None
+    response_sha256: str | None = None
+    response_truncated: bool = False
+    http_version: str | None = None
+    connect_ms: float | None = None
+    tls_ms: float | None = None
+    ttfb_ms: float | None = None
+    download_ms: float | None = None
     response_headers: dict[str, str] | None = None
     response_body: dict[str, Any] | str | None = None
     error_message: str | None = None
@@ -16,10 +16,19 @@ class Job(BaseModel):
     name: str | None = None
     run_number: int | None = None
     started_at: datetime | None = None
+    scheduled_at: datetime | None = None
+    missed_runs: int = 0
     status: JobStatus | None = None
     status_code: int | None = None
     latency_ms: float | None = None
     response_size_bytes: int | None = None
+    response_sha256: str | None = None
+    response_truncated: bool = False
+    http_version: str | None = None
+    connect_ms: float | None = None
+    tls_ms: float | None = None
+    ttfb_ms: float | None = None
+    download_ms: float | None = None
     request_headers: dict[str, str] | None = None
     request_body: dict[str, Any] | None = None
     response_headers: dict[str, str] | None = None
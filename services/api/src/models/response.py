@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
+from fastapi import Response, status
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -13,3 +14,30 @@ class HTTPResponse(BaseModel, Generic[T]):
     status_code: int
     message: str
     data: Optional[T] = None
+    next_cursor: Optional[str] = None
+
+
+def list_response(
+    item_type: type,
+    items: list,
+    message: str,
+    next_cursor: str | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """JSON response for a list of items that are already response models.
+
+    The envelope is built without revalidating the items and serialized by
+    pydantic-core in one pass, skipping FastAPI's response_model validation.
+    """
+    envelope = HTTPResponse[List[item_type]].model_construct(
+        success=True,
+        status_code=status_code,
+        message=message,
+        data=items,
+        next_cursor=next_cursor,
+    )
+    return Response(
+        content=envelope.model_dump_json(exclude_none=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -7,8 +7,10 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
-from db.models.schedule import IntervalSchedule as IntervalScheduleModel
-from db.models.schedule import WindowSchedule as WindowScheduleModel
+from db.models.schedule import Schedule as ScheduleModel
+from enums.misfire_policy import MisfirePolicy
+from enums.schedule_priority import SchedulePriority
+from enums.schedule_type import ScheduleType
 
 if TYPE_CHECKING:
     from domains.schedules.schemas import (IntervalScheduleResponse,
@@ -21,6 +23,9 @@ class Schedule(BaseModel, ABC):
     target_id: UUID | None = None
     interval_seconds: int | None = None
     paused: bool | None = None
+    misfire_policy: MisfirePolicy | None = None
+    max_catch_up_runs: int | None = None
+    priority: SchedulePriority | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -35,7 +40,7 @@ class IntervalSchedule(Schedule):
     @override
     def to_db_model(self):
         schedule_data = self.model_dump(exclude_none=True)
-        return IntervalScheduleModel(**schedule_data)
+        return ScheduleModel(schedule_type=ScheduleType.INTERVAL, **schedule_data)
 
     @override
     def to_response(self):
@@ -50,7 +55,7 @@ class WindowSchedule(Schedule):
     @override
     def to_db_model(self):
         schedule_data = self.model_dump(exclude_none=True)
-        return WindowScheduleModel(**schedule_data)
+        return ScheduleModel(schedule_type=ScheduleType.WINDOW, **schedule_data)
 
     @override
     def to_response(self):
@@ -25,6 +25,8 @@ class Target(BaseModel):
     retry_count: int = Field(default=0, ge=0, le=10)
     retry_delay_seconds: int = Field(default=1, ge=0, le=60)
     follow_redirects: bool = Field(default=True)
+    http2: bool = Field(default=False)
+    max_capture_bytes: int | None = Field(default=None, ge=0)
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -1,80 +1,113 @@
 import asyncio
+import time
 from datetime import UTC, datetime
 from uuid import UUID
 
 import httpx
+from core.config import settings
 from core.logging import get_logger
 from db.database import get_session
-from db.models.job import Job as JobModel
-from db.models.schedule import IntervalSchedule, WindowSchedule
+from db.models.job import Job
+from db.models.schedule import Schedule
 from db.models.target import Target
 from db.models.url import URL
 from enums.http_methods import HTTPMethods
 from enums.job_status import JobStatus
+from enums.misfire_policy import MisfirePolicy
+from enums.schedule_priority import SchedulePriority
 from models.job import Job as JobPydantic
+from sqlalchemy import func, select
+from temporal.config_cache import schedule_config_cache
+from temporal.http_pool import http_client_pool
+from temporal.http_trace import RequestPhaseTracer
+from temporal.job_writer import JobWriteBuffer, attempt_row, job_row
+from temporal.legacy_workflows import LEGACY_WORKFLOW_TYPES
+from temporal.payload_store import (PAYLOAD_MISSING, merge_payload, payload_store,
+                                    split_payload)
+from temporal.response_capture import ResponseCapture
+from temporal.timeouts import schedule_tick_timeout
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
 logger = get_logger()
 
+job_write_buffer = JobWriteBuffer(lambda: get_session())
+
+
+def schedule_config_query(schedule_id: UUID):
+    return (
+        select(
+            Schedule.target_id,
+            Schedule.paused,
+            Schedule.interval_seconds,
+            Schedule.misfire_policy,
+            Schedule.max_catch_up_runs,
+            Schedule.priority,
+            Schedule.duration_seconds,
+            Target,
+            URL,
+        )
+        .where(Schedule.id == schedule_id)
+        .outerjoin(Target, Target.id == Schedule.target_id)
+        .outerjoin(URL, URL.id == Target.url_id)
+    )
+
 
 @activity.defn
 async def get_schedule_and_target(schedule_id: UUID) -> dict:
     logger.info("activity_get_schedule_and_target_started", schedule_id=str(schedule_id))
-    
-    async with get_session() as session:
-        from sqlmodel import select
-
-        try:
-            interval_result = await session.execute(
-                select(IntervalSchedule).where(IntervalSchedule.id == schedule_id)
-            )
-            interval_schedule = interval_result.scalar_one_or_none()
 
-            window_result = await session.execute(
-                select(WindowSchedule).where(WindowSchedule.id == schedule_id)
-            )
-            window_schedule = window_result.scalar_one_or_none()
+    cached = schedule_config_cache.get(schedule_id)
+    if cached is not None:
+        logger.debug("activity_schedule_config_cache_hit", schedule_id=str(schedule_id))
+        return cached
 
-            schedule = interval_schedule or window_schedule
-            if not schedule:
+    async with get_session() as session:
+        try:
+            result = await session.execute(schedule_config_query(schedule_id))
+            row = result.first()
+            if not row:
                 logger.warning("activity_schedule_deleted", schedule_id=str(schedule_id))
                 return {"deleted": True}
 
-            if schedule.paused:
+            (
+                target_id, paused, interval_seconds, misfire_policy, max_catch_up_runs,
+                priority, duration_seconds, target, url,
+            ) = row
+
+            if paused:
                 logger.info("activity_schedule_paused", schedule_id=str(schedule_id))
+                schedule_config_cache.put(schedule_id, {"paused": True}, target_id=target_id)
                 return {"paused": True}
 
-            target_result = await session.execute(
-                select(Target).where(Target.id == schedule.target_id)
-            )
-            target = target_result.scalar_one_or_none()
             if not target:
-                logger.error("activity_target_not_found", schedule_id=str(schedule_id), target_id=str(schedule.target_id))
-                raise ValueError(f"Target {schedule.target_id} not found")
+                logger.error("activity_target_not_found", schedule_id=str(schedule_id), target_id=str(target_id))
+                raise ValueError(f"Target {target_id} not found")
 
-            url_result = await session.execute(
-                select(URL).where(URL.id == target.url_id)
-            )
-            url = url_result.scalar_one_or_none()
             if not url:
                 logger.error("activity_url_not_found", schedule_id=str(schedule_id), url_id=str(target.url_id))
                 raise ValueError(f"URL {target.url_id} not found")
 
             schedule_dict = {
-                "interval_seconds": schedule.interval_seconds,
+                "interval_seconds": interval_seconds,
+                "misfire_policy": MisfirePolicy(misfire_policy).value,
+                "max_catch_up_runs": max_catch_up_runs,
+                "priority": SchedulePriority(priority).value,
             }
-            if hasattr(schedule, "duration_seconds"):
-                schedule_dict["duration_seconds"] = schedule.duration_seconds
+            if duration_seconds is not None:
+                schedule_dict["duration_seconds"] = duration_seconds
+
+            url_string = url.get_url_string()
 
             logger.info(
                 "activity_get_schedule_and_target_success",
                 schedule_id=str(schedule_id),
-                target_id=str(schedule.target_id),
-                url=url.get_url_string(),
+                target_id=str(target_id),
+                url=url_string,
                 method=target.method.value
             )
 
-            return {
+            schedule_data = {
                 "paused": False,
                 "schedule": schedule_dict,
                 "target": {
@@ -85,9 +118,14 @@ async def get_schedule_and_target(schedule_id: UUID) -> dict:
                     "retry_count": target.retry_count,
                     "retry_delay_seconds": target.retry_delay_seconds,
                     "follow_redirects": target.follow_redirects,
+                    "http2": target.http2,
+                    "max_capture_bytes": target.max_capture_bytes,
                 },
-                "url": url.get_url_string(),
+                "url": url_string,
             }
+            schedule_config_cache.put(
+                schedule_id, schedule_data, target_id=target_id, url_id=url.id)
+            return schedule_data
         except Exception as e:
             logger.error(
                 "activity_get_schedule_and_target_error",
@@ -99,8 +137,7 @@ async def get_schedule_and_target(schedule_id: UUID) -> dict:
             raise
 
 
-@activity.defn
-async def execute_http_request(
+async def send_http_request(
     url: str,
     method: str,
     headers: dict | None,
@@ -109,8 +146,12 @@ async def execute_http_request(
     retry_count: int = 0,
     retry_delay_seconds: int = 1,
     follow_redirects: bool = True,
+    http2: bool = False,
+    max_capture_bytes: int | None = None,
 ) -> dict:
-    import asyncio
+    """Sends the request with retries; returns the full result in memory."""
+    if max_capture_bytes is None:
+        max_capture_bytes = settings.http_max_capture_bytes
 
     logger.info(
         "activity_http_request_started",
@@ -118,16 +159,23 @@ async def execute_http_request(
         method=method,
         timeout_seconds=timeout_seconds,
         retry_count=retry_count,
-        follow_redirects=follow_redirects
+        follow_redirects=follow_redirects,
+        http2=http2,
+        max_capture_bytes=max_capture_bytes,
     )
 
     start_time = datetime.now(UTC)
+    start_clock = time.perf_counter()
     status = JobStatus.SUCCESS
     status_code = None
     latency_ms = None
     response_size_bytes = None
+    response_sha256 = None
+    response_truncated = False
+    http_version = None
     response_headers = None
     response_body = None
+    phase_timings = RequestPhaseTracer().to_dict()
     error_message = None
     last_exception = None
     redirect_history = []
@@ -136,103 +184,134 @@ async def execute_http_request(
 
     for attempt in range(retry_count + 1):
         attempt_start = datetime.now(UTC)
+        attempt_clock = time.perf_counter()
+        tracer = RequestPhaseTracer()
         attempt_status = JobStatus.SUCCESS
         attempt_status_code = None
         attempt_latency = None
         attempt_size = None
+        attempt_sha256 = None
+        attempt_truncated = False
+        attempt_http_version = None
         attempt_resp_headers = None
         attempt_resp_body = None
         attempt_error = None
 
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout_seconds,
-                follow_redirects=follow_redirects,
-            ) as client:
-                http_method = getattr(client, method.lower(), client.get)
-                method_lower = method.lower()
-
-                if method_lower in ("get", "head", "delete", "options"):
-                    kwargs = {"headers": headers or {}}
-                    if body:
-                        kwargs["params"] = body
-                else:
-                    kwargs = {"headers": headers or {}}
-                    if body:
-                        kwargs["json"] = body
-
-                response = await http_method(url, **kwargs)
-                
-                logger.debug(
-                    "http_request_completed",
+            client = http_client_pool.get_client(
+                follow_redirects=follow_redirects, http2=http2)
+            method_lower = method.lower()
+
+            if method_lower in ("get", "head", "delete", "options"):
+                kwargs = {
+                    "headers": headers or {},
+                    "timeout": timeout_seconds,
+                    "extensions": {"trace": tracer},
+                }
+                if body:
+                    kwargs["params"] = body
+            else:
+                kwargs = {
+                    "headers": headers or {},
+                    "timeout": timeout_seconds,
+                    "extensions": {"trace": tracer},
+                }
+                if body:
+                    kwargs["json"] = body
+
+            request = client.build_request(method.upper(), url, **kwargs)
+            response = await client.send(request, stream=True)
+            capture = ResponseCapture(max_capture_bytes)
+            try:
+                await capture.consume(response)
+            finally:
+                await response.aclose()
+            attempt_resp_body = capture.decode_body(response.encoding)
+
+            logger.debug(
+                "http_request_completed",
+                url=url,
+                method=method,
+                attempt=attempt + 1,
+                status_code=response.status_code
+            )
+
+            # Track redirect history from response
+            if hasattr(response, 'history') and response.history:
+                # follow_redirects=True: history contains intermediate redirects
+                for redirect_response in response.history:
+                    redirect_history.append({
+                        "url": str(redirect_response.url),
+                        "status_code": redirect_response.status_code,
+                    })
+            elif response.is_redirect and not follow_redirects:
+                # follow_redirects=False: current response is the redirect
+                location = response.headers.get('location', '')
+                if location:
+                    redirect_history.append({
+                        "url": location,
+                        "status_code": response.status_code,
+                    })
+
+            attempt_end_clock = time.perf_counter()
+            attempt_latency = (attempt_end_clock - attempt_clock) * 1000
+            attempt_status_code = response.status_code
+            attempt_size = capture.size_bytes
+            attempt_sha256 = capture.sha256
+            attempt_truncated = capture.truncated
+            attempt_http_version = response.http_version
+            attempt_resp_headers = dict(response.headers)
+
+            if capture.truncated:
+                logger.info(
+                    "http_response_truncated",
                     url=url,
-                    method=method,
                     attempt=attempt + 1,
-                    status_code=response.status_code
+                    size_bytes=capture.size_bytes,
+                    captured_bytes=capture.captured_bytes,
                 )
 
-                # Track redirect history from response
-                if hasattr(response, 'history') and response.history:
-                    # follow_redirects=True: history contains intermediate redirects
-                    for redirect_response in response.history:
-                        redirect_history.append({
-                            "url": str(redirect_response.url),
-                            "status_code": redirect_response.status_code,
-                        })
-                elif response.is_redirect and not follow_redirects:
-                    # follow_redirects=False: current response is the redirect
-                    location = response.headers.get('location', '')
-                    if location:
-                        redirect_history.append({
-                            "url": location,
-                            "status_code": response.status_code,
-                        })
-
-                attempt_end = datetime.now(UTC)
-                attempt_latency = (
-                    attempt_end - attempt_start).total_seconds() * 1000
-                attempt_status_code = response.status_code
-                attempt_size = len(response.content)
-                attempt_resp_headers = dict(response.headers)
-                try:
-                    attempt_resp_body = response.json()
-                except Exception:
-                    attempt_resp_body = response.text
-
-                if attempt_status_code >= 500:
-                    attempt_status = JobStatus.HTTP_5XX
-                elif attempt_status_code >= 400:
-                    attempt_status = JobStatus.HTTP_4XX
-
-                status = attempt_status
-                status_code = attempt_status_code
-                latency_ms = (attempt_end - start_time).total_seconds() * 1000
-                response_size_bytes = attempt_size
-                response_headers = attempt_resp_headers
-                response_body = attempt_resp_body
-
-                attempts.append({
-                    "attempt_number": attempt + 1,
-                    "started_at": attempt_start.replace(tzinfo=None),
-                    "status": attempt_status.value,
-                    "status_code": attempt_status_code,
-                    "latency_ms": attempt_latency,
-                    "response_size_bytes": attempt_size,
-                    "response_headers": attempt_resp_headers,
-                    "response_body": attempt_resp_body,
-                    "error_message": attempt_error,
-                })
-
-                if attempt_status_code >= 500 and attempt < retry_count:
-                    await asyncio.sleep(retry_delay_seconds)
-                    continue
-                break
+            if attempt_status_code >= 500:
+                attempt_status = JobStatus.HTTP_5XX
+            elif attempt_status_code >= 400:
+                attempt_status = JobStatus.HTTP_4XX
+
+            status = attempt_status
+            status_code = attempt_status_code
+            latency_ms = (attempt_end_clock - start_clock) * 1000
+            response_size_bytes = attempt_size
+            response_sha256 = attempt_sha256
+            response_truncated = attempt_truncated
+            http_version = attempt_http_version
+            response_headers = attempt_resp_headers
+            response_body = attempt_resp_body
+            phase_timings = tracer.to_dict()
+
+            attempts.append({
+                "attempt_number": attempt + 1,
+                "started_at": attempt_start.replace(tzinfo=None),
+                "status": attempt_status.value,
+                "status_code": attempt_status_code,
+                "latency_ms": attempt_latency,
+                "response_size_bytes": attempt_size,
+                "response_sha256": attempt_sha256,
+                "response_truncated": attempt_truncated,
+                "http_version": attempt_http_version,
+                "response_headers": attempt_resp_headers,
+                "response_body": attempt_resp_body,
+                "error_message": attempt_error,
+                **phase_timings,
+            })
+
+            if attempt_status_code >= 500 and attempt < retry_count:
+                await asyncio.sleep(retry_delay_seconds)
+                continue
+            break
 
         except httpx.TimeoutException as e:
             last_exception = e
-            attempt_end = datetime.now(UTC)
-            attempt_latency = (
-                attempt_end - attempt_start).total_seconds() * 1000
+            attempt_end_clock = time.perf_counter()
+            attempt_latency = (attempt_end_clock - attempt_clock) * 1000
             attempt_status = JobStatus.TIMEOUT
             attempt_error = f"Request timed out after {timeout_seconds} seconds"
             
@@ -255,21 +334,22 @@ async def execute_http_request(
                 "response_headers": None,
                 "response_body": None,
                 "error_message": attempt_error,
+                **tracer.to_dict(),
             })
 
             if attempt < retry_count:
                 await asyncio.sleep(retry_delay_seconds)
                 continue
             status = attempt_status
-            latency_ms = (attempt_end - start_time).total_seconds() * 1000
+            latency_ms = (attempt_end_clock - start_clock) * 1000
+            phase_timings = tracer.to_dict()
             error_message = attempt_error
             break
 
         except httpx.ConnectError as e:
             last_exception = e
-            attempt_end = datetime.now(UTC)
-            attempt_latency = (
-                attempt_end - attempt_start).total_seconds() * 1000
+            attempt_end_clock = time.perf_counter()
+            attempt_latency = (attempt_end_clock - attempt_clock) * 1000
             error_str = str(e).lower()
             dns_patterns = [
                 "name resolution",
@@ -305,21 +385,22 @@ async def execute_http_request(
                 "response_headers": None,
                 "response_body": None,
                 "error_message": attempt_error,
+                **tracer.to_dict(),
             })
 
             if attempt < retry_count:
                 await asyncio.sleep(retry_delay_seconds)
                 continue
             status = attempt_status
-            latency_ms = (attempt_end - start_time).total_seconds() * 1000
+            latency_ms = (attempt_end_clock - start_clock) * 1000
+            phase_timings = tracer.to_dict()
             error_message = attempt_error
             break
 
         except Exception as e:
             last_exception = e
-            attempt_end = datetime.now(UTC)
-            attempt_latency = (
-                attempt_end - attempt_start).total_seconds() * 1000
+            attempt_end_clock = time.perf_counter()
+            attempt_latency = (attempt_end_clock - attempt_clock) * 1000
             attempt_status = JobStatus.ERROR
             attempt_error = str(e)
             
@@ -344,13 +425,15 @@ async def execute_http_request(
                 "response_headers": None,
                 "response_body": None,
                 "error_message": attempt_error,
+                **tracer.to_dict(),
             })
 
             if attempt < retry_count:
                 await asyncio.sleep(retry_delay_seconds)
                 continue
             status = attempt_status
-            latency_ms = (attempt_end - start_time).total_seconds() * 1000
+            latency_ms = (attempt_end_clock - start_clock) * 1000
+            phase_timings = tracer.to_dict()
             error_message = attempt_error
             break
 
@@ -373,8 +456,12 @@ async def execute_http_request(
         "status_code": status_code,
         "latency_ms": latency_ms,
         "response_size_bytes": response_size_bytes,
+        "response_sha256": response_sha256,
+        "response_truncated": response_truncated,
+        "http_version": http_version,
         "response_headers": response_headers,
         "response_body": response_body,
+        **phase_timings,
         "error_message": error_message,
         "started_at": start_time.replace(tzinfo=None),
         "request_headers": headers,
@@ -394,14 +481,72 @@ async def execute_http_request(
     return result
 
 
+async def stage_payload(request_result: dict) -> dict:
+    """Moves the heavy fields to the payload store, returning the summary that
+    goes through workflow history. Falls back to the full result if the store
+    is unavailable."""
+    summary, heavy = split_payload(request_result)
+    try:
+        summary["payload_ref"] = await payload_store.put(heavy)
+    except Exception as e:
+        logger.error(
+            "activity_payload_stage_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return request_result
+
+    return summary
+
+
+@activity.defn
+async def execute_http_request(
+    url: str,
+    method: str,
+    headers: dict | None,
+    body: dict | None,
+    timeout_seconds: int = 30,
+    retry_count: int = 0,
+    retry_delay_seconds: int = 1,
+    follow_redirects: bool = True,
+    http2: bool = False,
+    max_capture_bytes: int | None = None,
+) -> dict:
+    result = await send_http_request(
+        url, method, headers, body, timeout_seconds, retry_count, retry_delay_seconds,
+        follow_redirects, http2, max_capture_bytes,
+    )
+    return await stage_payload(result)
+
+
+async def recorded_job_id(schedule_id: UUID, run_number: int) -> UUID | None:
+    async with get_session() as session:
+        result = await session.execute(
+            select(Job.id).where(Job.schedule_id == schedule_id, Job.run_number == run_number)
+        )
+        return result.scalars().first()
+
+
+async def next_run_number(schedule_id: UUID) -> int:
+    async with get_session() as session:
+        result = await session.execute(
+            select(func.max(Job.run_number)).where(Job.schedule_id == schedule_id)
+        )
+        return (result.scalar() or 0) + 1
+
+
+def called_from_legacy_workflow() -> bool:
+    return activity.in_activity() and activity.info().workflow_type in LEGACY_WORKFLOW_TYPES
+
+
 @activity.defn
 async def create_job_record(
     schedule_id: UUID,
     run_number: int,
     request_result: dict,
+    scheduled_at: str | None = None,
+    missed_runs: int = 0,
 ) -> UUID:
-    from db.models.attempt import Attempt
-
     logger.info(
         "activity_create_job_record_started",
         schedule_id=str(schedule_id),
@@ -409,87 +554,129 @@ async def create_job_record(
         status=request_result.get("status")
     )
 
-    async with get_session() as session:
-        started_at = request_result["started_at"]
-        if isinstance(started_at, str):
-            started_at = datetime.fromisoformat(
-                started_at.replace("Z", "+00:00"))
-            if started_at.tzinfo:
-                started_at = started_at.replace(tzinfo=None)
-
-        status = request_result["status"]
-        if isinstance(status, JobStatus):
-            status_value = status.value
-        elif isinstance(status, str):
-            status_lower = status.lower()
-            try:
-                status_enum = JobStatus(status_lower)
-                status_value = status_enum.value
-            except ValueError:
-                status_value = JobStatus.ERROR.value
-        else:
-            status_value = JobStatus.ERROR.value
-
-        job = JobModel(
-            schedule_id=schedule_id,
-            run_number=run_number,
-            started_at=started_at,
-            status=JobStatus(status_value),
-            status_code=request_result.get("status_code"),
-            latency_ms=request_result.get("latency_ms"),
-            response_size_bytes=request_result.get("response_size_bytes"),
-            request_headers=request_result.get("request_headers"),
-            request_body=request_result.get("request_body"),
-            response_headers=request_result.get("response_headers"),
-            response_body=request_result.get("response_body"),
-            error_message=request_result.get("error_message"),
-            redirected=request_result.get("redirected", False),
-            redirect_count=request_result.get("redirect_count", 0),
-            redirect_history=request_result.get("redirect_history"),
-        )
-        session.add(job)
-        await session.commit()
-        await session.refresh(job)
-
-        attempts = request_result.get("attempts", [])
-        for attempt_data in attempts:
-            attempt_started_at = attempt_data["started_at"]
-            if isinstance(attempt_started_at, str):
-                attempt_started_at = datetime.fromisoformat(
-                    attempt_started_at.replace("Z", "+00:00"))
-                if attempt_started_at.tzinfo:
-                    attempt_started_at = attempt_started_at.replace(
-                        tzinfo=None)
-
-            attempt_status = attempt_data["status"]
-            if isinstance(attempt_status, str):
-                try:
-                    attempt_status = JobStatus(attempt_status.lower())
-                except ValueError:
-                    attempt_status = JobStatus.ERROR
-
-            attempt = Attempt(
-                job_id=job.id,
-                attempt_number=attempt_data["attempt_number"],
-                started_at=attempt_started_at,
-                status=attempt_status,
-                status_code=attempt_data.get("status_code"),
-                latency_ms=attempt_data.get("latency_ms"),
-                response_size_bytes=attempt_data.get("response_size_bytes"),
-                response_headers=attempt_data.get("response_headers"),
-                response_body=attempt_data.get("response_body"),
-                error_message=attempt_data.get("error_message"),
+    payload_ref = request_result.get("payload_ref")
+    if payload_ref:
+        heavy = await payload_store.get(payload_ref)
+        if heavy is None:
+            # A retry after a successful write finds the blob already deleted.
+            job_id = await recorded_job_id(schedule_id, run_number)
+            if job_id is not None:
+                return job_id
+            logger.error(
+                "activity_payload_missing",
+                schedule_id=str(schedule_id),
+                run_number=run_number,
+                payload_ref=payload_ref,
             )
-            session.add(attempt)
+            raise ApplicationError(
+                f"Payload {payload_ref} not found; it expired or was deleted",
+                type=PAYLOAD_MISSING,
+                non_retryable=True,
+            )
+        request_result = merge_payload(request_result, heavy)
+
+    if called_from_legacy_workflow():
+        run_number = await next_run_number(schedule_id)
+
+    job_id = await save_job_record(
+        schedule_id, run_number, request_result, scheduled_at, missed_runs)
 
-        await session.commit()
-        
-        logger.info(
-            "activity_create_job_record_success",
+    if payload_ref:
+        await payload_store.delete(payload_ref)
+
+    return job_id
+
+
+async def save_job_record(
+    schedule_id: UUID,
+    run_number: int,
+    request_result: dict,
+    scheduled_at: str | None = None,
+    missed_runs: int = 0,
+) -> UUID:
+    row = job_row(schedule_id, run_number, request_result, scheduled_at, missed_runs)
+    attempts = [
+        attempt_row(row, attempt_data)
+        for attempt_data in request_result.get("attempts", [])
+    ]
+
+    job_id = await job_write_buffer.submit(row, attempts)
+
+    logger.info(
+        "activity_create_job_record_success",
+        schedule_id=str(schedule_id),
+        run_number=run_number,
+        job_id=str(job_id),
+        attempts_count=len(attempts)
+    )
+
+    return job_id
+
+
+@activity.defn
+async def run_schedule_tick(
+    schedule_id: UUID,
+    run_number: int,
+    scheduled_at: str | None = None,
+    missed_runs: int = 0,
+) -> dict:
+    logger.info(
+        "activity_run_schedule_tick_started",
+        schedule_id=str(schedule_id),
+        run_number=run_number,
+    )
+
+    schedule_data = await get_schedule_and_target(schedule_id)
+    if schedule_data.get("deleted") or schedule_data.get("paused"):
+        return schedule_data
+
+    target = schedule_data["target"]
+    tick = {
+        "paused": False,
+        "schedule": schedule_data["schedule"],
+        "target": target,
+    }
+
+    if activity.in_activity():
+        budget = activity.info().start_to_close_timeout
+        if budget is not None and budget < schedule_tick_timeout(target):
+            logger.info(
+                "activity_run_schedule_tick_deferred",
+                schedule_id=str(schedule_id),
+                run_number=run_number,
+                budget_seconds=budget.total_seconds(),
+            )
+            tick["deferred"] = True
+            return tick
+
+    # The result stays in memory; the payload store is only needed if the
+    # record has to be written by a separate create_job_record activity.
+    request_result = await send_http_request(
+        url=schedule_data["url"],
+        method=target["method"],
+        headers=target["headers"],
+        body=target["body"],
+        timeout_seconds=target.get("timeout_seconds", 30),
+        retry_count=target.get("retry_count", 0),
+        retry_delay_seconds=target.get("retry_delay_seconds", 1),
+        follow_redirects=target.get("follow_redirects", True),
+        http2=target.get("http2", False),
+        max_capture_bytes=target.get("max_capture_bytes"),
+    )
+
+    try:
+        tick["job_id"] = await save_job_record(
+            schedule_id, run_number, request_result, scheduled_at, missed_runs)
+        tick["persisted"] = True
+    except Exception as e:
+        logger.warning(
+            "activity_run_schedule_tick_persist_deferred",
             schedule_id=str(schedule_id),
             run_number=run_number,
-            job_id=str(job.id),
-            attempts_count=len(attempts)
+            error=str(e),
+            error_type=type(e).__name__,
         )
-        
-        return job.id
+        tick["persisted"] = False
+        tick["request_result"] = await stage_payload(request_result)
+
+    return tick
@@ -1,29 +1,86 @@
+import asyncio
+import time
+from datetime import timedelta
 from uuid import UUID
 
 from temporalio.client import Client
+from temporalio.service import RPCError, RPCStatusCode
 from temporalio.worker import Worker
 
 from core.config import settings
 from core.logging import get_logger
+from core.metrics import temporal_client_connect_seconds
 from temporal.activities import (create_job_record, execute_http_request,
-                                 get_schedule_and_target)
+                                 get_schedule_and_target, run_schedule_tick)
+from temporal.task_queues import (DB_QUEUE, WORKFLOW_QUEUE, select_task_queues,
+                                  split_slots, task_queue)
+from temporal.legacy_workflows import (LegacyIntervalScheduleWorkflow,
+                                       LegacyWindowScheduleWorkflow)
 from temporal.workflows import IntervalScheduleWorkflow, WindowScheduleWorkflow
 
 logger = get_logger()
 
 
+class TemporalClientManager:
+    """Process-wide Temporal client, connected on first use.
+
+    Concurrent callers share one connection attempt. A failed connect is not
+    cached, and ``handle_error`` drops the client when the server is
+    unreachable so the next call reconnects.
+    """
+
+    def __init__(self):
+        self._client: Client | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Client:
+        if self._client is not None:
+            return self._client
+
+        async with self._lock:
+            if self._client is None:
+                self._client = await self._connect()
+        return self._client
+
+    async def _connect(self) -> Client:
+        logger.debug("temporal_client_connecting", host=settings.temporal_host, namespace=settings.temporal_namespace)
+        started = time.perf_counter()
+        try:
+            client = await Client.connect(
+                target_host=settings.temporal_host,
+                namespace=settings.temporal_namespace,
+            )
+        except Exception as e:
+            temporal_client_connect_seconds.labels(status="failure").observe(time.perf_counter() - started)
+            logger.error("temporal_client_connect_failed", error=str(e), error_type=type(e).__name__)
+            raise
+        duration = time.perf_counter() - started
+        temporal_client_connect_seconds.labels(status="success").observe(duration)
+        logger.info("temporal_client_connected", duration_ms=round(duration * 1000, 2))
+        return client
+
+    def handle_error(self, error: Exception) -> None:
+        if isinstance(error, RPCError) and error.status == RPCStatusCode.UNAVAILABLE:
+            logger.warning("temporal_client_reset", error=str(error))
+            self._client = None
+
+    def close(self) -> None:
+        self._client = None
+        self._lock = asyncio.Lock()
+
+
+temporal_client_manager = TemporalClientManager()
+
+
 async def get_temporal_client() -> Client:
-    logger.debug("temporal_client_connecting", host=settings.temporal_host, namespace=settings.temporal_namespace)
-    client = await Client.connect(
-        target_host=settings.temporal_host,
-        namespace=settings.temporal_namespace,
-    )
-    logger.info("temporal_client_connected")
-    return client
+    return await temporal_client_manager.get()
 
 
 async def start_schedule_workflow(
-    schedule_id: UUID, schedule_type: str, client: Client | None = None
+    schedule_id: UUID,
+    schedule_type: str,
+    client: Client | None = None,
+    run_number: int = 1,
 ) -> str:
     logger.info("temporal_workflow_starting", schedule_id=str(schedule_id), schedule_type=schedule_type)
     
@@ -41,9 +98,26 @@ async def start_schedule_workflow(
         logger.error("temporal_unknown_schedule_type", schedule_type=schedule_type)
         raise ValueError(f"Unknown schedule type: {schedule_type}")
 
+    args = [
+        schedule_id,
+        run_number,
+        settings.workflow_max_ticks_per_run,
+        settings.workflow_max_history_events,
+        settings.workflow_fused_tick,
+    ]
+    if workflow is WindowScheduleWorkflow:
+        args.append(None)
+    args += [
+        settings.workflow_fixed_rate,
+        None,
+        settings.workflow_phase_spread,
+        settings.workflow_jitter_ratio,
+        settings.temporal_queue_routing,
+    ]
+
     handle = await client.start_workflow(
         workflow.run,
-        schedule_id,
+        args=args,
         id=workflow_id,
         task_queue=task_queue,
     )
@@ -67,10 +141,56 @@ async def terminate_schedule_workflow(
     logger.info("temporal_workflow_terminated", schedule_id=str(schedule_id), workflow_id=workflow_id)
 
 
-async def create_worker() -> Worker:
+WORKFLOWS = [
+    IntervalScheduleWorkflow,
+    WindowScheduleWorkflow,
+    LegacyIntervalScheduleWorkflow,
+    LegacyWindowScheduleWorkflow,
+]
+DB_ACTIVITIES = [get_schedule_and_target, create_job_record]
+HTTP_ACTIVITIES = [execute_http_request, run_schedule_tick]
+# Legacy workflows schedule their activities on the workflow's own queue.
+LEGACY_ACTIVITIES = [get_schedule_and_target, execute_http_request, create_job_record]
+
+
+def worker_registrations(name: str) -> dict:
+    if name == WORKFLOW_QUEUE:
+        return {"workflows": WORKFLOWS, "activities": LEGACY_ACTIVITIES}
+    if name == DB_QUEUE:
+        return {"activities": DB_ACTIVITIES}
+    return {"activities": HTTP_ACTIVITIES}
+
+
+async def create_workers() -> list[Worker]:
+    """One worker per task queue this process serves.
+
+    Without queue routing a single worker polls ``temporal_task_queue`` for
+    everything. With it, workflows, DB activities and each HTTP priority and
+    timeout class get their own queue, and ``worker_task_queues`` limits which
+    of them this process polls. ``worker_max_concurrent_activities`` caps the
+    whole process, so it is split across the workers.
+    """
     import logging
-    
-    logger.info("temporal_worker_creating", task_queue=settings.temporal_task_queue)
+
+    if settings.temporal_queue_routing:
+        queues = {
+            task_queue(settings.temporal_task_queue, name): worker_registrations(name)
+            for name in select_task_queues(settings.worker_task_queues)
+        }
+    else:
+        queues = {
+            settings.temporal_task_queue: {
+                "workflows": WORKFLOWS,
+                "activities": DB_ACTIVITIES + HTTP_ACTIVITIES,
+            }
+        }
+
+    activity_slots = split_slots(settings.worker_max_concurrent_activities, len(queues))
+    logger.info(
+        "temporal_worker_creating",
+        task_queues=list(queues),
+        max_concurrent_activities=dict(zip(queues, activity_slots)),
+    )
     client = await get_temporal_client()
 
     workflow_logger = logging.getLogger("temporalio.workflow")
@@ -79,16 +199,19 @@ async def create_worker() -> Worker:
     activity_logger = logging.getLogger("temporalio.activity")
     activity_logger.setLevel(logging.INFO)
 
-    worker = Worker(
-        client,
-        task_queue=settings.temporal_task_queue,
-        workflows=[IntervalScheduleWorkflow, WindowScheduleWorkflow],
-        activities=[
-            get_schedule_and_target,
-            execute_http_request,
-            create_job_record,
-        ],
-    )
+    workers = [
+        Worker(
+            client,
+            task_queue=queue,
+            **registrations,
+            max_concurrent_activities=slots,
+            max_concurrent_workflow_tasks=settings.worker_max_concurrent_workflow_tasks,
+            max_concurrent_activity_task_polls=settings.worker_max_concurrent_activity_task_polls,
+            max_concurrent_workflow_task_polls=settings.worker_max_concurrent_workflow_task_polls,
+            graceful_shutdown_timeout=timedelta(seconds=settings.worker_graceful_shutdown_seconds),
+        )
+        for (queue, registrations), slots in zip(queues.items(), activity_slots)
+    ]
     
-    logger.info("temporal_worker_created")
-    return worker
+    logger.info("temporal_worker_created", workers=len(workers))
+    return workers
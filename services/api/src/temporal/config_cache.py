@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from core.config import settings
+from core.logging import get_logger
+from core.metrics import schedule_config_cache_lookups_total
+from db.database import change_listener
+
+logger = get_logger()
+
+
+class ScheduleConfigCache:
+    """In-worker TTL/LRU cache of ``get_schedule_and_target`` results.
+
+    Entries are keyed on schedule id and indexed by target and URL id so a
+    change to any of the three, delivered through ``change_listener``, drops
+    every dependent entry.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int | None = None):
+        self.ttl_seconds = settings.schedule_config_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = settings.schedule_config_cache_max_entries if max_entries is None else max_entries
+        self._entries: OrderedDict[UUID, tuple[float, dict, UUID | None, UUID | None]] = OrderedDict()
+        self._by_target: dict[UUID, set[UUID]] = {}
+        self._by_url: dict[UUID, set[UUID]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, schedule_id: UUID) -> dict | None:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(schedule_id)
+        if entry is None:
+            schedule_config_cache_lookups_total.labels(result="miss").inc()
+            return None
+
+        expires_at, value, _, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(schedule_id)
+            schedule_config_cache_lookups_total.labels(result="expired").inc()
+            return None
+
+        self._entries.move_to_end(schedule_id)
+        schedule_config_cache_lookups_total.labels(result="hit").inc()
+        return value
+
+    def put(
+        self,
+        schedule_id: UUID,
+        value: dict,
+        target_id: UUID | None = None,
+        url_id: UUID | None = None,
+    ):
+        if not self.enabled:
+            return
+
+        self._remove(schedule_id)
+        self._entries[schedule_id] = (
+            time.monotonic() + self.ttl_seconds, value, target_id, url_id)
+        if target_id is not None:
+            self._by_target.setdefault(target_id, set()).add(schedule_id)
+        if url_id is not None:
+            self._by_url.setdefault(url_id, set()).add(schedule_id)
+
+        while len(self._entries) > self.max_entries:
+            oldest_id = next(iter(self._entries))
+            self._remove(oldest_id)
+
+    def invalidate_schedule(self, schedule_id: UUID):
+        if self._remove(schedule_id):
+            logger.debug("schedule_config_cache_invalidated", schedule_id=str(schedule_id))
+
+    def invalidate_target(self, target_id: UUID):
+        for schedule_id in list(self._by_target.get(target_id, ())):
+            self.invalidate_schedule(schedule_id)
+
+    def invalidate_url(self, url_id: UUID):
+        for schedule_id in list(self._by_url.get(url_id, ())):
+            self.invalidate_schedule(schedule_id)
+
+    def handle_change(self, change: dict):
+        entity = change.get("entity")
+        if entity == "*":
+            self.clear()
+            return
+
+        entity_id = UUID(change["id"])
+        if entity == "schedule":
+            self.invalidate_schedule(entity_id)
+        elif entity == "target":
+            self.invalidate_target(entity_id)
+        elif entity == "url":
+            self.invalidate_url(entity_id)
+
+    def clear(self):
+        self._entries.clear()
+        self._by_target.clear()
+        self._by_url.clear()
+
+    def _remove(self, schedule_id: UUID) -> bool:
+        entry = self._entries.pop(schedule_id, None)
+        if entry is None:
+            return False
+
+        _, _, target_id, url_id = entry
+        for index, key in ((self._by_target, target_id), (self._by_url, url_id)):
+            dependents = index.get(key)
+            if dependents is not None:
+                dependents.discard(schedule_id)
+                if not dependents:
+                    del index[key]
+        return True
+
+
+schedule_config_cache = ScheduleConfigCache()
+change_listener.subscribe(schedule_config_cache.handle_change)
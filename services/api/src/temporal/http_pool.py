@@ -0,0 +1,84 @@
+import importlib.util
+
+import httpx
+
+from core.config import settings
+from core.logging import get_logger
+
+logger = get_logger()
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    def __init__(self):
+        self._clients: dict[tuple, httpx.AsyncClient] = {}
+        self._http2_warning_logged = False
+
+    def _build_client(
+        self, follow_redirects: bool, verify: bool, proxy: str | None, http2: bool
+    ) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+            keepalive_expiry=settings.http_pool_keepalive_expiry_seconds,
+        )
+        return httpx.AsyncClient(
+            follow_redirects=follow_redirects,
+            verify=verify,
+            proxy=proxy,
+            limits=limits,
+            http2=http2,
+        )
+
+    def get_client(
+        self,
+        follow_redirects: bool = True,
+        verify: bool | None = None,
+        proxy: str | None = None,
+        http2: bool = False,
+    ) -> httpx.AsyncClient:
+        if verify is None:
+            verify = settings.http_verify_ssl
+        if proxy is None:
+            proxy = settings.http_proxy
+        if http2 and not HTTP2_AVAILABLE:
+            if not self._http2_warning_logged:
+                logger.warning("http_client_pool_http2_unavailable", fallback="HTTP/1.1")
+                self._http2_warning_logged = True
+            http2 = False
+
+        key = (follow_redirects, verify, proxy, http2)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._build_client(follow_redirects, verify, proxy, http2)
+            self._clients[key] = client
+            logger.info(
+                "http_client_pool_client_created",
+                follow_redirects=follow_redirects,
+                verify=verify,
+                proxy=proxy,
+                http2=http2,
+                pool_size=len(self._clients),
+            )
+        return client
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(
+                    "http_client_pool_close_error",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        if clients:
+            logger.info("http_client_pool_closed", clients_closed=len(clients))
+
+
+http_client_pool = HTTPClientPool()
@@ -0,0 +1,50 @@
+import time
+
+PHASE_FIELDS = ("connect_ms", "tls_ms", "ttfb_ms", "download_ms")
+
+
+class RequestPhaseTracer:
+    """httpcore trace hook that accumulates per-phase durations on the monotonic clock.
+
+    httpcore resolves the host inside ``connect_tcp``, so ``connect_ms`` covers
+    DNS + TCP. Phases are summed across redirect hops and are left as ``None``
+    when a pooled connection was reused.
+    """
+
+    def __init__(self):
+        self._started: dict[str, float] = {}
+        self._request_started: float | None = None
+        self.connect_ms: float | None = None
+        self.tls_ms: float | None = None
+        self.ttfb_ms: float | None = None
+        self.download_ms: float | None = None
+
+    async def __call__(self, event_name: str, info: dict):
+        now = time.perf_counter()
+        operation, _, stage = event_name.rpartition(".")
+        _, _, step = operation.partition(".")
+
+        if stage == "started":
+            self._started[operation] = now
+            if step == "send_request_headers":
+                self._request_started = now
+            return
+
+        if step == "receive_response_headers" and self._request_started is not None:
+            self.ttfb_ms = (self.ttfb_ms or 0.0) + (now - self._request_started) * 1000
+            self._request_started = None
+
+        started = self._started.pop(operation, None)
+        if started is None:
+            return
+        elapsed_ms = (now - started) * 1000
+
+        if step == "connect_tcp":
+            self.connect_ms = (self.connect_ms or 0.0) + elapsed_ms
+        elif step == "start_tls":
+            self.tls_ms = (self.tls_ms or 0.0) + elapsed_ms
+        elif step == "receive_response_body":
+            self.download_ms = (self.download_ms or 0.0) + elapsed_ms
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in PHASE_FIELDS}
@@ -0,0 +1,262 @@
+import asyncio
+from datetime import datetime
+from typing import Callable
+from uuid import UUID, uuid4
+
+from core.config import settings
+from core.logging import get_logger
+from db.models.attempt import Attempt
+from db.models.job import Job
+from db import database
+from enums.job_status import JobStatus
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+logger = get_logger()
+
+JOBS = Job.__table__
+ATTEMPT_INSERT = insert(Attempt.__table__)
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def job_insert():
+    dialect_insert = UPSERT_DIALECTS.get(database.engine.dialect.name)
+    if dialect_insert is None:
+        raise Exception(f"Unsupported database dialect: {database.engine.dialect.name}")
+    return (
+        dialect_insert(JOBS)
+        .on_conflict_do_nothing(
+            index_elements=[JOBS.c.schedule_id, JOBS.c.run_number, JOBS.c.started_at])
+        .returning(JOBS.c.schedule_id, JOBS.c.run_number, JOBS.c.id)
+    )
+
+
+def run_key(schedule_id, run_number: int) -> tuple[str, int]:
+    return str(schedule_id), run_number
+
+
+def parse_timestamp(value) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo:
+        value = value.replace(tzinfo=None)
+    return value
+
+
+def parse_status(value) -> JobStatus:
+    if isinstance(value, JobStatus):
+        return value
+    try:
+        return JobStatus(value.lower())
+    except (AttributeError, ValueError):
+        return JobStatus.ERROR
+
+
+def job_row(
+    schedule_id: UUID,
+    run_number: int,
+    result: dict,
+    scheduled_at: str | None = None,
+    missed_runs: int = 0,
+) -> dict:
+    now = datetime.now()
+    return {
+        "id": uuid4(),
+        "created_at": now,
+        "updated_at": now,
+        "schedule_id": schedule_id,
+        "run_number": run_number,
+        "started_at": parse_timestamp(result["started_at"]),
+        "scheduled_at": parse_timestamp(scheduled_at) if scheduled_at else None,
+        "missed_runs": missed_runs,
+        "status": parse_status(result["status"]),
+        "status_code": result.get("status_code"),
+        "latency_ms": result.get("latency_ms"),
+        "response_size_bytes": result.get("response_size_bytes"),
+        "response_sha256": result.get("response_sha256"),
+        "response_truncated": result.get("response_truncated", False),
+        "http_version": result.get("http_version"),
+        "connect_ms": result.get("connect_ms"),
+        "tls_ms": result.get("tls_ms"),
+        "ttfb_ms": result.get("ttfb_ms"),
+        "download_ms": result.get("download_ms"),
+        "request_headers": result.get("request_headers"),
+        "request_body": result.get("request_body"),
+        "response_headers": result.get("response_headers"),
+        "response_body": result.get("response_body"),
+        "error_message": result.get("error_message"),
+        "redirected": result.get("redirected", False),
+        "redirect_count": result.get("redirect_count", 0),
+        "redirect_history": result.get("redirect_history"),
+    }
+
+
+def attempt_row(job: dict, attempt: dict) -> dict:
+    now = datetime.now()
+    return {
+        "id": uuid4(),
+        "created_at": now,
+        "updated_at": now,
+        "job_id": job["id"],
+        "job_started_at": job["started_at"],
+        "attempt_number": attempt["attempt_number"],
+        "started_at": parse_timestamp(attempt["started_at"]),
+        "status": parse_status(attempt["status"]),
+        "status_code": attempt.get("status_code"),
+        "latency_ms": attempt.get("latency_ms"),
+        "response_size_bytes": attempt.get("response_size_bytes"),
+        "response_sha256": attempt.get("response_sha256"),
+        "response_truncated": attempt.get("response_truncated", False),
+        "http_version": attempt.get("http_version"),
+        "connect_ms": attempt.get("connect_ms"),
+        "tls_ms": attempt.get("tls_ms"),
+        "ttfb_ms": attempt.get("ttfb_ms"),
+        "download_ms": attempt.get("download_ms"),
+        "response_headers": attempt.get("response_headers"),
+        "response_body": attempt.get("response_body"),
+        "error_message": attempt.get("error_message"),
+    }
+
+
+class JobWriteBuffer:
+    """Coalesces job/attempt inserts from concurrent activities into batched transactions.
+
+    ``submit`` only returns once the transaction holding the record has
+    committed, so an activity never completes before its row is durable. A
+    batch flushes when it reaches ``max_batch_size`` or ``max_delay_ms`` after
+    its first record. A job is written once per ``(schedule_id, run_number)``:
+    existing runs are looked up before inserting, because the unique index
+    must include the partition key ``started_at`` and a re-executed request
+    has a new one. A retried write is a no-op that resolves to the existing
+    job's id. If a
+    batch fails, its records are retried one by one so a single bad row fails
+    only its own activity. Batches are written in their own task, so
+    cancelling the activity that triggered a flush does not abandon the
+    other records in the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        max_batch_size: int | None = None,
+        max_delay_ms: float | None = None,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_size = settings.job_write_batch_size if max_batch_size is None else max_batch_size
+        self.max_delay_ms = settings.job_write_max_delay_ms if max_delay_ms is None else max_delay_ms
+        self._pending: list[tuple] = []
+        self._timer: asyncio.Task | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    async def submit(self, job: dict, attempts: list[dict]) -> UUID:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((job, attempts, future))
+
+        if len(self._pending) >= self.max_batch_size or self.max_delay_ms <= 0:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+        return await future
+
+    async def _flush_after_delay(self):
+        await asyncio.sleep(self.max_delay_ms / 1000)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self):
+        """Writes the pending batch and waits for every batch in flight."""
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._write_batch(batch))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+        if self._writes:
+            await asyncio.shield(asyncio.gather(*self._writes, return_exceptions=True))
+
+    async def _write_batch(self, batch: list[tuple]):
+        try:
+            try:
+                await self._write(batch)
+            except Exception as e:
+                if len(batch) == 1:
+                    self._fail(batch, e)
+                    return
+                logger.warning(
+                    "job_write_batch_failed",
+                    batch_size=len(batch),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                for record in batch:
+                    try:
+                        await self._write([record])
+                    except Exception as record_error:
+                        self._fail([record], record_error)
+                return
+
+            logger.debug("job_write_batch_flushed", batch_size=len(batch))
+        finally:
+            self._fail(batch, RuntimeError("Job write was interrupted"))
+
+    async def _existing_job_ids(self, session, keys: list[tuple[str, int]]) -> dict:
+        if not keys:
+            return {}
+        result = await session.execute(
+            select(JOBS.c.schedule_id, JOBS.c.run_number, JOBS.c.id).where(
+                tuple_(JOBS.c.schedule_id, JOBS.c.run_number).in_(
+                    [(UUID(schedule_id), run_number) for schedule_id, run_number in keys]
+                )
+            )
+        )
+        return {
+            run_key(schedule_id, run_number): job_id
+            for schedule_id, run_number, job_id in result.all()
+        }
+
+    async def _write(self, batch: list[tuple]):
+        keys = [run_key(job["schedule_id"], job["run_number"]) for job, _, _ in batch]
+
+        async with self.session_factory() as session:
+            job_ids = await self._existing_job_ids(session, list(dict.fromkeys(keys)))
+
+            new_jobs = {}
+            for (job, _, _), key in zip(batch, keys):
+                if key not in job_ids:
+                    new_jobs.setdefault(key, job)
+
+            inserted = set()
+            if new_jobs:
+                result = await session.execute(job_insert(), list(new_jobs.values()))
+                for schedule_id, run_number, job_id in result.all():
+                    job_ids[run_key(schedule_id, run_number)] = job_id
+                    inserted.add(job_id)
+                # Lost a race with a concurrent write of the same run.
+                job_ids.update(await self._existing_job_ids(
+                    session, [key for key in new_jobs if key not in job_ids]))
+
+            if len(inserted) < len(batch):
+                logger.info("job_write_duplicates_skipped", count=len(batch) - len(inserted))
+
+            attempts = [
+                attempt
+                for job, job_attempts, _ in batch
+                if job["id"] in inserted
+                for attempt in job_attempts
+            ]
+            if attempts:
+                await session.execute(ATTEMPT_INSERT, attempts)
+            await session.commit()
+
+        for (_, _, future), key in zip(batch, keys):
+            if not future.done():
+                future.set_result(job_ids[key])
+
+    def _fail(self, batch: list[tuple], error: Exception):
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(error)
@@ -0,0 +1,147 @@
+"""Schedule workflows as they were first deployed, kept for executions still running.
+
+The current workflows in ``temporal.workflows`` issue a different sequence of
+commands and are registered as ``IntervalScheduleWorkflowV2`` /
+``WindowScheduleWorkflowV2``. Executions started before that change are still
+typed ``IntervalScheduleWorkflow`` / ``WindowScheduleWorkflow`` and must
+replay against this code, so do not change it. Remove this module once
+
+    temporal workflow list --query 'WorkflowType IN ("IntervalScheduleWorkflow",
+        "WindowScheduleWorkflow") AND ExecutionStatus = "Running"'
+
+comes back empty. Terminating a legacy execution and resuming its schedule
+through the API restarts it as a V2 workflow.
+"""
+from datetime import timedelta
+from uuid import UUID
+
+from temporalio import workflow
+
+# These restart run_number at 1 on every resume, so create_job_record gives
+# their runs the schedule's next free run number instead of deduplicating.
+LEGACY_WORKFLOW_TYPES = ("IntervalScheduleWorkflow", "WindowScheduleWorkflow")
+
+
+@workflow.defn(name="IntervalScheduleWorkflow")
+class LegacyIntervalScheduleWorkflow:
+    @workflow.run
+    async def run(self, schedule_id: UUID) -> None:
+        run_number = 1
+
+        while True:
+            schedule_data = await workflow.execute_activity(
+                "get_schedule_and_target",
+                args=(schedule_id,),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+
+            if schedule_data.get("deleted"):
+                return
+
+            if schedule_data.get("paused"):
+                await workflow.sleep(timedelta(seconds=30))
+                continue
+
+            schedule = schedule_data["schedule"]
+            target = schedule_data["target"]
+            url = schedule_data["url"]
+
+            request_result = await workflow.execute_activity(
+                "execute_http_request",
+                args=(
+                    url,
+                    target["method"],
+                    target["headers"],
+                    target["body"],
+                    target.get("timeout_seconds", 30),
+                    target.get("retry_count", 0),
+                    target.get("retry_delay_seconds", 1),
+                    target.get("follow_redirects", True),
+                ),
+                start_to_close_timeout=timedelta(seconds=target.get(
+                    "timeout_seconds", 30) * (target.get("retry_count", 0) + 1) + 60),
+            )
+
+            await workflow.execute_activity(
+                "create_job_record",
+                args=(schedule_id, run_number, request_result),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+
+            run_number += 1
+            await workflow.sleep(timedelta(seconds=schedule["interval_seconds"]))
+
+
+@workflow.defn(name="WindowScheduleWorkflow")
+class LegacyWindowScheduleWorkflow:
+    @workflow.run
+    async def run(self, schedule_id: UUID) -> None:
+        schedule_data = await workflow.execute_activity(
+            "get_schedule_and_target",
+            schedule_id,
+            start_to_close_timeout=timedelta(seconds=10),
+        )
+
+        if schedule_data.get("deleted"):
+            return
+
+        if schedule_data.get("paused"):
+            return
+
+        schedule = schedule_data["schedule"]
+        target = schedule_data["target"]
+        url = schedule_data["url"]
+
+        if "duration_seconds" not in schedule:
+            return
+
+        duration = timedelta(seconds=schedule["duration_seconds"])
+        interval = timedelta(seconds=schedule["interval_seconds"])
+        end_time = workflow.now() + duration
+        run_number = 1
+
+        while workflow.now() < end_time:
+            current_schedule_data = await workflow.execute_activity(
+                "get_schedule_and_target",
+                schedule_id,
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+
+            if current_schedule_data.get("deleted"):
+                return
+
+            if current_schedule_data.get("paused"):
+                break
+
+            current_target = current_schedule_data["target"]
+            current_url = current_schedule_data["url"]
+
+            request_result = await workflow.execute_activity(
+                "execute_http_request",
+                args=(
+                    current_url,
+                    current_target["method"],
+                    current_target["headers"],
+                    current_target["body"],
+                    current_target.get("timeout_seconds", 30),
+                    current_target.get("retry_count", 0),
+                    current_target.get("retry_delay_seconds", 1),
+                    current_target.get("follow_redirects", True),
+                ),
+                start_to_close_timeout=timedelta(seconds=current_target.get(
+                    "timeout_seconds", 30) * (current_target.get("retry_count", 0) + 1) + 60),
+            )
+
+            await workflow.execute_activity(
+                "create_job_record",
+                args=(schedule_id, run_number, request_result),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+
+            run_number += 1
+
+            next_run_time = workflow.now() + interval
+            if next_run_time < end_time:
+                await workflow.sleep(interval)
+            else:
+                break
@@ -0,0 +1,114 @@
+import json
+import time
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, select
+
+from core.config import settings
+from core.logging import get_logger
+from db.database import get_session
+from db.models.payload_blob import PayloadBlob
+
+logger = get_logger()
+
+HEAVY_FIELDS = ("request_headers", "request_body", "response_headers", "response_body")
+HEAVY_ATTEMPT_FIELDS = ("response_headers", "response_body")
+PAYLOAD_MISSING = "PayloadMissing"
+SWEEP_INTERVAL_SECONDS = 600
+
+
+class PayloadStore:
+    """Postgres-backed blob store for request/response payloads.
+
+    Activities stage heavy payloads here and pass only the returned key
+    through workflow history (claim-check). The HTTP activity and the
+    activity that records the run may run on different workers, so blobs
+    live in the shared database. Blobs never read back, e.g. for runs whose
+    workflow was terminated, are swept from ``put`` once they are
+    ``payload_store_ttl_seconds`` old.
+    """
+
+    def __init__(self):
+        self._next_sweep = 0.0
+
+    async def put(self, payload: dict) -> str:
+        await self._maybe_sweep()
+        blob = PayloadBlob(payload=json.loads(json.dumps(payload, default=str)))
+        async with get_session() as session:
+            session.add(blob)
+            await session.commit()
+        return blob.id.hex
+
+    async def get(self, key: str) -> dict | None:
+        blob_id = self._blob_id(key)
+        if blob_id is None:
+            return None
+        async with get_session() as session:
+            result = await session.execute(
+                select(PayloadBlob.payload).where(PayloadBlob.id == blob_id))
+            return result.scalars().first()
+
+    async def delete(self, key: str):
+        blob_id = self._blob_id(key)
+        if blob_id is None:
+            return
+        async with get_session() as session:
+            await session.execute(delete(PayloadBlob).where(PayloadBlob.id == blob_id))
+            await session.commit()
+
+    async def sweep(self, max_age_seconds: float) -> int:
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        async with get_session() as session:
+            result = await session.execute(
+                delete(PayloadBlob).where(PayloadBlob.created_at < cutoff))
+            await session.commit()
+            return result.rowcount
+
+    async def _maybe_sweep(self):
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + SWEEP_INTERVAL_SECONDS
+        try:
+            removed = await self.sweep(settings.payload_store_ttl_seconds)
+        except Exception as e:
+            logger.warning("payload_store_sweep_failed", error=str(e), error_type=type(e).__name__)
+            return
+        if removed:
+            logger.info("payload_store_swept", removed=removed)
+
+    @staticmethod
+    def _blob_id(key: str) -> UUID | None:
+        try:
+            return UUID(key)
+        except ValueError:
+            return None
+
+
+def split_payload(request_result: dict) -> tuple[dict, dict]:
+    summary = {k: v for k, v in request_result.items() if k not in HEAVY_FIELDS}
+    heavy = {k: request_result.get(k) for k in HEAVY_FIELDS}
+
+    summary["attempts"] = []
+    heavy["attempts"] = []
+    for attempt in request_result.get("attempts", []):
+        summary["attempts"].append(
+            {k: v for k, v in attempt.items() if k not in HEAVY_ATTEMPT_FIELDS})
+        heavy["attempts"].append(
+            {k: attempt.get(k) for k in HEAVY_ATTEMPT_FIELDS})
+
+    return summary, heavy
+
+
+def merge_payload(summary: dict, heavy: dict) -> dict:
+    merged = {**summary, **{k: heavy.get(k) for k in HEAVY_FIELDS}}
+    heavy_attempts = heavy.get("attempts", [])
+    merged["attempts"] = [
+        {**attempt, **(heavy_attempts[i] if i < len(heavy_attempts) else {})}
+        for i, attempt in enumerate(summary.get("attempts", []))
+    ]
+    return merged
+
+
+payload_store = PayloadStore()
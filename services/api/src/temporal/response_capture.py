@@ -0,0 +1,56 @@
+import hashlib
+import json
+
+import httpx
+
+
+class ResponseCapture:
+    """Streams a response body, keeping at most ``max_capture_bytes`` of it.
+
+    The true size and a SHA-256 of the full body are always recorded; bytes past
+    the cap are hashed and dropped, so ``max_capture_bytes`` bounds the memory held.
+    """
+
+    def __init__(self, max_capture_bytes: int):
+        self.max_capture_bytes = max_capture_bytes
+        self.size_bytes = 0
+        self.truncated = False
+        self._digest = hashlib.sha256()
+        self._buffer = bytearray()
+
+    @property
+    def captured_bytes(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    async def consume(self, response: httpx.Response):
+        async for chunk in response.aiter_bytes():
+            self.size_bytes += len(chunk)
+            self._digest.update(chunk)
+
+            remaining = self.max_capture_bytes - self.captured_bytes
+            if remaining <= 0:
+                self.truncated = True
+                continue
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+            self._buffer += chunk
+
+    def read_bytes(self) -> bytes:
+        return bytes(self._buffer)
+
+    def decode_body(self, encoding: str | None):
+        if self.captured_bytes == 0:
+            return "" if self.size_bytes == 0 else None
+
+        data = self.read_bytes()
+        if not self.truncated:
+            try:
+                return json.loads(data)
+            except ValueError:
+                pass
+        return data.decode(encoding or "utf-8", errors="replace")
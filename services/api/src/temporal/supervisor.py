@@ -0,0 +1,220 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.config import settings
+from core.logging import get_logger, setup_logging
+
+logger = get_logger()
+
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+RESTART_BACKOFF_SECONDS = 1.0
+# A child that stayed up this long is healthy again; its backoff starts over.
+STABLE_UPTIME_SECONDS = 300.0
+
+
+def run_event_loop(main):
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+def run_child() -> None:
+    from temporal.worker_service import run_worker_process
+
+    raise SystemExit(run_event_loop(run_worker_process(serve_metrics=False)))
+
+
+def restart_delay(failures: int) -> float:
+    """Backoff before restarting a child after its ``failures``-th crash in a row."""
+    return min(
+        RESTART_BACKOFF_SECONDS * 2 ** (failures - 1),
+        settings.worker_restart_backoff_max_seconds,
+    )
+
+
+class WorkerSupervisor:
+    """Runs ``processes`` worker processes on one machine and keeps them alive.
+
+    Each child is a fresh interpreter (spawn) with its own event loop, Temporal
+    client and pools. SIGTERM/SIGINT are forwarded so children drain in-flight
+    activities before exiting. Crashed children are restarted with exponential
+    backoff; after ``worker_max_restarts`` crashes in a row the supervisor
+    drains the rest and exits non-zero. It serves ``/health`` and aggregated
+    ``/metrics`` for all children on ``worker_metrics_port``.
+    """
+
+    def __init__(self, processes: int):
+        self.processes = processes
+        self.context = multiprocessing.get_context("spawn")
+        self.children: list = [None] * processes
+        self.restarts = [0] * processes
+        self.failures = [0] * processes
+        self.started_at = [0.0] * processes
+        self.respawn_at: list[float | None] = [None] * processes
+        self.stopping = threading.Event()
+
+    def run(self) -> int:
+        setup_logging(log_level=settings.log_level)
+        metrics_dir = None
+        if MULTIPROC_ENV not in os.environ:
+            metrics_dir = tempfile.mkdtemp(prefix="api-scheduler-metrics-")
+            os.environ[MULTIPROC_ENV] = metrics_dir
+        try:
+            return self.supervise_children()
+        finally:
+            if metrics_dir is not None:
+                os.environ.pop(MULTIPROC_ENV, None)
+                shutil.rmtree(metrics_dir, ignore_errors=True)
+
+    def supervise_children(self) -> int:
+        """Spawns the worker children and restarts them until shutdown."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: self.stopping.set())
+
+        server = self.start_health_server() if settings.worker_metrics_port else None
+        logger.info("worker_supervisor_started", processes=self.processes)
+
+        for index in range(self.processes):
+            self.spawn(index)
+
+        exit_code = 0
+        while not self.stopping.wait(1):
+            if not self.supervise(time.monotonic()):
+                exit_code = 1
+                break
+
+        self.drain()
+        if server:
+            server.shutdown()
+        logger.info("worker_supervisor_stopped", exit_code=exit_code)
+        return exit_code
+
+    def supervise(self, now: float) -> bool:
+        """Respawns children whose backoff elapsed and schedules restarts for
+        crashed ones; returns False once a child exceeds the restart limit."""
+        for index, child in enumerate(self.children):
+            if self.respawn_at[index] is not None:
+                if now >= self.respawn_at[index]:
+                    self.respawn_at[index] = None
+                    self.spawn(index)
+                continue
+            if child.is_alive():
+                continue
+
+            self.reap(child)
+            logger.error(
+                "worker_supervisor_child_exited",
+                index=index,
+                pid=child.pid,
+                exitcode=child.exitcode,
+            )
+            if now - self.started_at[index] >= STABLE_UPTIME_SECONDS:
+                self.failures[index] = 0
+            self.failures[index] += 1
+            if self.failures[index] > settings.worker_max_restarts:
+                logger.error(
+                    "worker_supervisor_restart_limit_reached",
+                    index=index,
+                    failures=self.failures[index],
+                )
+                return False
+
+            delay = restart_delay(self.failures[index])
+            self.restarts[index] += 1
+            self.respawn_at[index] = now + delay
+            logger.warning(
+                "worker_supervisor_child_restart_scheduled",
+                index=index,
+                delay_seconds=delay,
+                failures=self.failures[index],
+            )
+        return True
+
+    def spawn(self, index: int) -> None:
+        child = self.context.Process(target=run_child, name=f"worker-{index}")
+        child.start()
+        self.children[index] = child
+        self.started_at[index] = time.monotonic()
+        logger.info("worker_supervisor_child_started", index=index, pid=child.pid)
+
+    def reap(self, child) -> None:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(child.pid)
+
+    def drain(self) -> None:
+        logger.info("worker_supervisor_draining", processes=self.processes)
+        for child in self.children:
+            if child.is_alive():
+                os.kill(child.pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + settings.worker_graceful_shutdown_seconds + 10
+        for child in self.children:
+            child.join(max(deadline - time.monotonic(), 0))
+            if child.is_alive():
+                logger.warning("worker_supervisor_child_killed", pid=child.pid)
+                child.kill()
+                child.join()
+            self.reap(child)
+
+    def health(self) -> dict:
+        processes = [
+            {
+                "index": index,
+                "pid": child.pid,
+                "alive": child.is_alive(),
+                "restarts": self.restarts[index],
+            }
+            for index, child in enumerate(self.children)
+            if child is not None
+        ]
+        healthy = len(processes) == self.processes and all(p["alive"] for p in processes)
+        return {"status": "healthy" if healthy else "degraded", "processes": processes}
+
+    def metrics(self) -> bytes:
+        from prometheus_client import CollectorRegistry, generate_latest, multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+
+    def start_health_server(self) -> ThreadingHTTPServer:
+        supervisor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/health":
+                    health = supervisor.health()
+                    status = 200 if health["status"] == "healthy" else 503
+                    body = json.dumps(health).encode()
+                    content_type = "application/json"
+                elif self.path == "/metrics":
+                    from prometheus_client import CONTENT_TYPE_LATEST
+
+                    status, body, content_type = 200, supervisor.metrics(), CONTENT_TYPE_LATEST
+                else:
+                    status, body, content_type = 404, b"", "text/plain"
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("0.0.0.0", settings.worker_metrics_port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
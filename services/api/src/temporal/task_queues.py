@@ -0,0 +1,61 @@
+from enums.schedule_priority import SchedulePriority
+from temporal.timeouts import DEFAULT_REQUEST_TIMEOUT_SECONDS
+
+WORKFLOW_QUEUE = "workflow"
+DB_QUEUE = "db"
+HTTP_QUEUE = "http"
+TIMEOUT_CLASSES = ("fast", "slow")
+SLOW_REQUEST_BUDGET_SECONDS = 10
+
+
+def timeout_class(target: dict | None) -> str:
+    """``slow`` when a target's worst-case request budget (all retries) exceeds the threshold."""
+    target = target or {}
+    budget = target.get("timeout_seconds", DEFAULT_REQUEST_TIMEOUT_SECONDS) * (
+        target.get("retry_count", 0) + 1)
+    return "slow" if budget > SLOW_REQUEST_BUDGET_SECONDS else "fast"
+
+
+def db_task_queue(base: str) -> str:
+    return f"{base}-{DB_QUEUE}"
+
+
+def http_task_queue(base: str, schedule_data: dict | None) -> str:
+    schedule_data = schedule_data or {}
+    priority = schedule_data.get("schedule", {}).get("priority", SchedulePriority.NORMAL.value)
+    return f"{base}-{HTTP_QUEUE}-{priority}-{timeout_class(schedule_data.get('target'))}"
+
+
+def task_queue_names() -> list[str]:
+    return [WORKFLOW_QUEUE, DB_QUEUE] + [
+        f"{HTTP_QUEUE}-{priority.value}-{timeout}"
+        for priority in SchedulePriority
+        for timeout in TIMEOUT_CLASSES
+    ]
+
+
+def select_task_queues(selected: list[str]) -> list[str]:
+    """Queue names matching ``selected``; ``http`` or ``http-critical`` select every queue under it."""
+    names = task_queue_names()
+    if not selected:
+        return names
+    unknown = [
+        entry for entry in selected
+        if not any(name == entry or name.startswith(f"{entry}-") for name in names)
+    ]
+    if unknown:
+        raise ValueError(f"Unknown task queues: {', '.join(unknown)}")
+    return [
+        name for name in names
+        if any(name == entry or name.startswith(f"{entry}-") for entry in selected)
+    ]
+
+
+def task_queue(base: str, name: str) -> str:
+    return base if name == WORKFLOW_QUEUE else f"{base}-{name}"
+
+
+def split_slots(total: int, queues: int) -> list[int]:
+    """Splits a process-wide slot limit across per-queue workers, at least one each."""
+    base, extra = divmod(total, queues)
+    return [max(1, base + (1 if index < extra else 0)) for index in range(queues)]
@@ -0,0 +1,13 @@
+from datetime import timedelta
+
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30
+
+
+def http_request_timeout(target: dict | None) -> timedelta:
+    target = target or {}
+    return timedelta(seconds=target.get(
+        "timeout_seconds", DEFAULT_REQUEST_TIMEOUT_SECONDS) * (target.get("retry_count", 0) + 1) + 60)
+
+
+def schedule_tick_timeout(target: dict | None) -> timedelta:
+    return http_request_timeout(target) + timedelta(seconds=20)
@@ -1,29 +1,36 @@
 import asyncio
+import signal
 from contextlib import asynccontextmanager
 
-from core.logging import get_logger
-from temporal.client import create_worker
+from core.config import settings
+from core.logging import get_logger, setup_logging
+from core.otel import setup_opentelemetry
+from db.database import change_listener
+from prometheus_client import start_http_server
+from temporal.activities import job_write_buffer
+from temporal.client import create_workers
+from temporal.http_pool import http_client_pool
 
 logger = get_logger()
 
 
 class TemporalWorkerService:
     def __init__(self):
-        self.worker = None
+        self.workers = []
         self.worker_task = None
 
     async def start(self):
-        if self.worker is not None:
+        if self.workers:
             logger.warning("temporal_worker_already_started")
             return
 
         try:
             logger.info("temporal_worker_starting")
-            self.worker = await create_worker()
-            self.worker_task = asyncio.create_task(self.worker.run())
+            self.workers = await create_workers()
+            self.worker_task = asyncio.create_task(self._run())
             logger.info(
                 "temporal_worker_started",
-                worker_id=id(self.worker),
+                workers=len(self.workers),
                 task_id=id(self.worker_task),
             )
         except Exception as e:
@@ -35,16 +42,21 @@ class TemporalWorkerService:
             )
             raise
 
+    async def _run(self):
+        await asyncio.gather(*(worker.run() for worker in self.workers))
+
     async def stop(self):
-        if self.worker is None:
+        if not self.workers:
             return
 
         try:
             logger.info("temporal_worker_stopping")
-            await self.worker.shutdown()
+            await asyncio.gather(*(worker.shutdown() for worker in self.workers))
             if self.worker_task:
                 await self.worker_task
-            self.worker = None
+            await job_write_buffer.flush()
+            await http_client_pool.close()
+            self.workers = []
             self.worker_task = None
             logger.info("temporal_worker_stopped")
         except Exception as e:
@@ -64,3 +76,51 @@ async def temporal_worker_lifespan():
     await temporal_worker_service.start()
     yield
     await temporal_worker_service.stop()
+
+
+async def run_worker_process(serve_metrics: bool = True) -> int:
+    """Run the worker without the API until SIGINT/SIGTERM; returns the exit code."""
+    logger = setup_logging(
+        log_level=settings.log_level,
+    )
+
+    setup_opentelemetry(
+        service_name=f"{settings.otel_service_name}-worker",
+        otel_endpoint=settings.otel_endpoint,
+    )
+
+    logger.info(
+        "worker_process_starting",
+        task_queue=settings.temporal_task_queue,
+        queue_routing=settings.temporal_queue_routing,
+        task_queues=settings.worker_task_queues,
+        max_concurrent_activities=settings.worker_max_concurrent_activities,
+        max_concurrent_workflow_tasks=settings.worker_max_concurrent_workflow_tasks,
+    )
+
+    if serve_metrics and settings.worker_metrics_port:
+        start_http_server(settings.worker_metrics_port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await change_listener.start()
+    await temporal_worker_service.start()
+
+    stop_task = asyncio.create_task(stop.wait())
+    await asyncio.wait(
+        {stop_task, temporal_worker_service.worker_task},
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    crashed = not stop.is_set()
+    if crashed:
+        stop_task.cancel()
+        logger.error("worker_process_worker_exited")
+
+    logger.info("worker_process_stopping")
+    await temporal_worker_service.stop()
+    await change_listener.stop()
+    logger.info("worker_process_stopped")
+    return 1 if crashed else 0
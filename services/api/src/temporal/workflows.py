@@ -1,68 +1,371 @@
-from datetime import timedelta
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from temporalio import workflow
 
+with workflow.unsafe.imports_passed_through():
+    from enums.misfire_policy import MisfirePolicy
+    from temporal.task_queues import db_task_queue, http_task_queue
+    from temporal.timeouts import http_request_timeout, schedule_tick_timeout
 
-@workflow.defn
-class IntervalScheduleWorkflow:
-    @workflow.run
-    async def run(self, schedule_id: UUID) -> None:
-        run_number = 1
+DEFAULT_MAX_TICKS_PER_RUN = 500
+DEFAULT_MAX_HISTORY_EVENTS = 10_000
+# Cached config, including ``paused``, is re-read from the DB at least this
+# often, so a lost pause/resume/update signal only delays the change.
+CONFIG_RECHECK_INTERVAL = timedelta(minutes=5)
 
-        while True:
-            schedule_data = await workflow.execute_activity(
-                "get_schedule_and_target",
-                args=(schedule_id,),
+
+def should_continue_as_new(ticks: int, max_ticks: int, max_history_events: int) -> bool:
+    info = workflow.info()
+    return (
+        ticks >= max_ticks
+        or info.get_current_history_length() >= max_history_events
+        or info.is_continue_as_new_suggested()
+    )
+
+
+def advance_fire_time(
+    previous: datetime, interval: timedelta, now: datetime, fixed_rate: bool
+) -> datetime:
+    """Next intended fire time after a tick that was meant to fire at ``previous``.
+
+    Fixed-delay waits a full interval after the tick finishes. Fixed-rate keeps
+    the ``previous + k * interval`` grid and skips slots already missed instead
+    of firing them back to back.
+    """
+    if not fixed_rate:
+        return now + interval
+    next_fire = previous + interval
+    if next_fire <= now:
+        next_fire += interval * ((now - next_fire) // interval + 1)
+    return next_fire
+
+
+def resolve_misfire(
+    schedule: dict, next_fire: datetime, late_by: timedelta, now: datetime
+) -> tuple[datetime, int, int, bool]:
+    """Apply the schedule's misfire policy to a tick that woke up ``late_by`` after its slot.
+
+    Returns the slot to run, how many slots are dropped, how many further slots to
+    replay back to back, and whether to wait for the next slot instead of running now.
+    """
+    interval = timedelta(seconds=schedule["interval_seconds"])
+    missed = late_by // interval
+    if missed <= 0:
+        return next_fire, 0, 0, False
+
+    policy = schedule.get("misfire_policy", MisfirePolicy.COALESCE.value)
+    if policy == MisfirePolicy.SKIP.value:
+        return advance_fire_time(next_fire, interval, now, True), missed + 1, 0, True
+
+    replay = 0
+    if policy == MisfirePolicy.CATCH_UP.value:
+        replay = min(missed, schedule.get("max_catch_up_runs", 0))
+    return next_fire + interval * (missed - replay), missed - replay, replay, False
+
+
+def phase_offset(schedule_id: UUID, interval: timedelta) -> timedelta:
+    digest = hashlib.sha256(str(schedule_id).encode()).digest()
+    return interval * (int.from_bytes(digest[:8], "big") / 2**64)
+
+
+def phased_fire_time(schedule_id: UUID, interval: timedelta, now: datetime) -> datetime:
+    """First slot at or after ``now`` on this schedule's hashed phase of the interval grid."""
+    anchor = datetime(1970, 1, 1, tzinfo=now.tzinfo) + phase_offset(schedule_id, interval)
+    return anchor - interval * ((anchor - now) // interval)
+
+
+def jitter(interval: timedelta, jitter_ratio: float) -> timedelta:
+    if jitter_ratio <= 0:
+        return timedelta(0)
+    return interval * (workflow.random().random() * jitter_ratio)
+
+
+def activity_queues(queue_routing: bool, schedule_data: dict | None) -> tuple[str | None, str | None]:
+    """DB and HTTP task queues for a tick; ``None`` keeps activities on the workflow's queue."""
+    if not queue_routing:
+        return None, None
+    base = workflow.info().task_queue
+    return db_task_queue(base), http_task_queue(base, schedule_data)
+
+
+async def fetch_schedule_data(schedule_id: UUID, queue_routing: bool) -> dict:
+    return await workflow.execute_activity(
+        "get_schedule_and_target",
+        args=(schedule_id,),
+        task_queue=activity_queues(queue_routing, None)[0],
+        start_to_close_timeout=timedelta(seconds=10),
+    )
+
+
+async def sleep_until(fire_at: datetime) -> None:
+    delay = fire_at - workflow.now()
+    if delay > timedelta(0):
+        await workflow.sleep(delay)
+
+
+async def run_tick(
+    schedule_id: UUID,
+    run_number: int,
+    fused_tick: bool,
+    schedule_data: dict | None,
+    scheduled_at: datetime,
+    missed_runs: int = 0,
+    queue_routing: bool = False,
+) -> dict:
+    scheduled_at = scheduled_at.isoformat()
+    db_queue, http_queue = activity_queues(queue_routing, schedule_data)
+
+    if fused_tick:
+        tick_result = await workflow.execute_activity(
+            "run_schedule_tick",
+            args=(schedule_id, run_number, scheduled_at, missed_runs),
+            task_queue=http_queue,
+            start_to_close_timeout=schedule_tick_timeout(
+                (schedule_data or {}).get("target")),
+        )
+        if tick_result.get("persisted") is False:
+            await workflow.execute_activity(
+                "create_job_record",
+                args=(
+                    schedule_id, run_number, tick_result["request_result"], scheduled_at,
+                    missed_runs,
+                ),
+                task_queue=db_queue,
                 start_to_close_timeout=timedelta(seconds=10),
             )
+        return tick_result
+
+    if schedule_data is None:
+        schedule_data = await fetch_schedule_data(schedule_id, queue_routing)
+
+        if schedule_data.get("deleted") or schedule_data.get("paused"):
+            return schedule_data
+        http_queue = activity_queues(queue_routing, schedule_data)[1]
+
+    target = schedule_data["target"]
+    url = schedule_data["url"]
+
+    request_result = await workflow.execute_activity(
+        "execute_http_request",
+        args=(
+            url,
+            target["method"],
+            target["headers"],
+            target["body"],
+            target.get("timeout_seconds", 30),
+            target.get("retry_count", 0),
+            target.get("retry_delay_seconds", 1),
+            target.get("follow_redirects", True),
+            target.get("http2", False),
+            target.get("max_capture_bytes"),
+        ),
+        task_queue=http_queue,
+        start_to_close_timeout=http_request_timeout(target),
+    )
+
+    await workflow.execute_activity(
+        "create_job_record",
+        args=(schedule_id, run_number, request_result, scheduled_at, missed_runs),
+        task_queue=db_queue,
+        start_to_close_timeout=timedelta(seconds=10),
+    )
+
+    return schedule_data
+
+
+class ScheduleSignals:
+    """Pause/resume/config signals shared by the schedule workflows.
+
+    Config loaded by a tick is kept on the workflow and reused until a
+    signal invalidates it or it is ``CONFIG_RECHECK_INTERVAL`` old, so ticks
+    rarely re-read the schedule and a paused workflow blocks on a condition,
+    re-checking the DB only once per interval.
+    """
+
+    def __init__(self):
+        self._paused = False
+        self._schedule_data: dict | None = None
+        self._config_loaded_at: datetime | None = None
+
+    def _load_config(self, schedule_data: dict) -> None:
+        self._schedule_data = schedule_data
+        self._config_loaded_at = workflow.now()
+
+    def _cached_config(self) -> dict | None:
+        if (
+            self._schedule_data is not None
+            and workflow.now() - self._config_loaded_at >= CONFIG_RECHECK_INTERVAL
+        ):
+            self._schedule_data = None
+        return self._schedule_data
+
+    def _store_tick(self, config: dict | None, tick: dict) -> None:
+        if config is None:
+            self._load_config(tick)
+        else:
+            self._schedule_data = tick
+
+    @workflow.signal
+    def pause(self) -> None:
+        self._paused = True
+
+    @workflow.signal
+    def resume(self) -> None:
+        self._paused = False
+        self._schedule_data = None
 
+    @workflow.signal
+    def update_schedule(self, schedule: dict) -> None:
+        if self._schedule_data and "schedule" in self._schedule_data:
+            self._schedule_data = {
+                **self._schedule_data,
+                "schedule": {**self._schedule_data["schedule"], **schedule},
+            }
+
+    @workflow.signal
+    def refresh_config(self) -> None:
+        self._schedule_data = None
+
+
+# New workflow type names: executions of the original workflows replay
+# against temporal.legacy_workflows instead.
+@workflow.defn(name="IntervalScheduleWorkflowV2")
+class IntervalScheduleWorkflow(ScheduleSignals):
+    @workflow.run
+    async def run(
+        self,
+        schedule_id: UUID,
+        run_number: int = 1,
+        max_ticks: int = DEFAULT_MAX_TICKS_PER_RUN,
+        max_history_events: int = DEFAULT_MAX_HISTORY_EVENTS,
+        fused_tick: bool = False,
+        fixed_rate: bool = False,
+        next_fire_time: str | None = None,
+        phase_spread: bool = False,
+        jitter_ratio: float = 0.0,
+        queue_routing: bool = False,
+    ) -> None:
+        ticks = 0
+        next_fire = (
+            datetime.fromisoformat(next_fire_time) if next_fire_time else workflow.now()
+        )
+
+        if phase_spread and next_fire_time is None:
+            schedule_data = await fetch_schedule_data(schedule_id, queue_routing)
             if schedule_data.get("deleted"):
                 return
+            if not schedule_data.get("paused"):
+                self._load_config(schedule_data)
+                next_fire = phased_fire_time(
+                    schedule_id,
+                    timedelta(seconds=schedule_data["schedule"]["interval_seconds"]),
+                    workflow.now(),
+                )
+                await sleep_until(next_fire)
+        fire_at = next_fire
+        schedule: dict | None = None
+        missed_runs = catch_up = 0
 
-            if schedule_data.get("paused"):
-                await workflow.sleep(timedelta(seconds=30))
+        while True:
+            if ticks and should_continue_as_new(ticks, max_ticks, max_history_events):
+                workflow.continue_as_new(args=[
+                    schedule_id, run_number, max_ticks, max_history_events, fused_tick,
+                    fixed_rate, next_fire.isoformat(), phase_spread, jitter_ratio,
+                    queue_routing,
+                ])
+
+            if self._paused:
+                try:
+                    await workflow.wait_condition(
+                        lambda: not self._paused, timeout=CONFIG_RECHECK_INTERVAL)
+                except asyncio.TimeoutError:
+                    schedule_data = await fetch_schedule_data(schedule_id, queue_routing)
+                    if schedule_data.get("deleted"):
+                        return
+                    if schedule_data.get("paused"):
+                        continue
+                    self._paused = False
+                    self._load_config(schedule_data)
+                next_fire = fire_at = workflow.now()
                 continue
 
-            schedule = schedule_data["schedule"]
-            target = schedule_data["target"]
-            url = schedule_data["url"]
+            if schedule is None and workflow.now() > fire_at:
+                # Late first fire after a restart or continue-as-new: the misfire
+                # policy needs the schedule before any tick has returned it.
+                schedule_data = self._cached_config()
+                if schedule_data is None:
+                    schedule_data = await fetch_schedule_data(schedule_id, queue_routing)
+                    if schedule_data.get("deleted"):
+                        return
+                    if schedule_data.get("paused"):
+                        self._paused = True
+                        continue
+                    self._load_config(schedule_data)
+                schedule = schedule_data["schedule"]
 
-            request_result = await workflow.execute_activity(
-                "execute_http_request",
-                args=(
-                    url,
-                    target["method"],
-                    target["headers"],
-                    target["body"],
-                    target.get("timeout_seconds", 30),
-                    target.get("retry_count", 0),
-                    target.get("retry_delay_seconds", 1),
-                    target.get("follow_redirects", True),
-                ),
-                start_to_close_timeout=timedelta(seconds=target.get(
-                    "timeout_seconds", 30) * (target.get("retry_count", 0) + 1) + 60),
-            )
+            if schedule and not catch_up:
+                now = workflow.now()
+                next_fire, skipped, catch_up, wait = resolve_misfire(
+                    schedule, next_fire, now - fire_at, now)
+                if skipped or catch_up:
+                    missed_runs += skipped
+                    fire_at = next_fire
+                if wait:
+                    await sleep_until(fire_at)
+                    continue
+            ticks += 1
 
-            await workflow.execute_activity(
-                "create_job_record",
-                args=(schedule_id, run_number, request_result),
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+            config = self._cached_config()
+            tick = await run_tick(
+                schedule_id, run_number, fused_tick, config, fire_at,
+                missed_runs, queue_routing)
+
+            if tick.get("deleted"):
+                return
+
+            if tick.get("paused"):
+                self._paused = True
+                continue
+
+            self._store_tick(config, tick)
+
+            if tick.get("deferred"):
+                continue
 
             run_number += 1
-            await workflow.sleep(timedelta(seconds=schedule["interval_seconds"]))
+            missed_runs = 0
+            schedule = tick["schedule"]
+            interval = timedelta(seconds=schedule["interval_seconds"])
+            if catch_up:
+                catch_up -= 1
+                next_fire = fire_at = next_fire + interval
+                continue
+            next_fire = advance_fire_time(next_fire, interval, workflow.now(), fixed_rate)
+            fire_at = next_fire + jitter(interval, jitter_ratio)
+            await sleep_until(fire_at)
 
 
-@workflow.defn
-class WindowScheduleWorkflow:
+@workflow.defn(name="WindowScheduleWorkflowV2")
+class WindowScheduleWorkflow(ScheduleSignals):
     @workflow.run
-    async def run(self, schedule_id: UUID) -> None:
-        schedule_data = await workflow.execute_activity(
-            "get_schedule_and_target",
-            schedule_id,
-            start_to_close_timeout=timedelta(seconds=10),
-        )
+    async def run(
+        self,
+        schedule_id: UUID,
+        run_number: int = 1,
+        max_ticks: int = DEFAULT_MAX_TICKS_PER_RUN,
+        max_history_events: int = DEFAULT_MAX_HISTORY_EVENTS,
+        fused_tick: bool = False,
+        end_time: str | None = None,
+        fixed_rate: bool = False,
+        next_fire_time: str | None = None,
+        phase_spread: bool = False,
+        jitter_ratio: float = 0.0,
+        queue_routing: bool = False,
+    ) -> None:
+        schedule_data = await fetch_schedule_data(schedule_id, queue_routing)
 
         if schedule_data.get("deleted"):
             return
@@ -70,60 +373,85 @@ class WindowScheduleWorkflow:
         if schedule_data.get("paused"):
             return
 
-        schedule = schedule_data["schedule"]
-        target = schedule_data["target"]
-        url = schedule_data["url"]
-
-        if "duration_seconds" not in schedule:
+        if "duration_seconds" not in schedule_data["schedule"]:
             return
 
-        duration = timedelta(seconds=schedule["duration_seconds"])
-        interval = timedelta(seconds=schedule["interval_seconds"])
-        end_time = workflow.now() + duration
-        run_number = 1
+        if end_time is None:
+            window_end = workflow.now() + timedelta(
+                seconds=schedule_data["schedule"]["duration_seconds"])
+        else:
+            window_end = datetime.fromisoformat(end_time)
+        self._load_config(schedule_data)
+        ticks = 0
+        next_fire = (
+            datetime.fromisoformat(next_fire_time) if next_fire_time else workflow.now()
+        )
 
-        while workflow.now() < end_time:
-            current_schedule_data = await workflow.execute_activity(
-                "get_schedule_and_target",
+        if phase_spread and next_fire_time is None:
+            phased = phased_fire_time(
                 schedule_id,
-                start_to_close_timeout=timedelta(seconds=10),
+                timedelta(seconds=schedule_data["schedule"]["interval_seconds"]),
+                workflow.now(),
             )
+            if phased < window_end:
+                next_fire = phased
+                await sleep_until(next_fire)
+        fire_at = next_fire
+        schedule = schedule_data["schedule"]
+        missed_runs = catch_up = 0
 
-            if current_schedule_data.get("deleted"):
-                return
+        while workflow.now() < window_end:
+            if ticks and should_continue_as_new(ticks, max_ticks, max_history_events):
+                workflow.continue_as_new(args=[
+                    schedule_id, run_number, max_ticks, max_history_events, fused_tick,
+                    window_end.isoformat(), fixed_rate, next_fire.isoformat(),
+                    phase_spread, jitter_ratio, queue_routing,
+                ])
 
-            if current_schedule_data.get("paused"):
+            if self._paused:
                 break
 
-            current_target = current_schedule_data["target"]
-            current_url = current_schedule_data["url"]
+            if not catch_up:
+                now = workflow.now()
+                next_fire, skipped, catch_up, wait = resolve_misfire(
+                    schedule, next_fire, now - fire_at, now)
+                if skipped or catch_up:
+                    missed_runs += skipped
+                    fire_at = next_fire
+                if wait:
+                    if fire_at >= window_end:
+                        break
+                    await sleep_until(fire_at)
+                    continue
+            ticks += 1
 
-            request_result = await workflow.execute_activity(
-                "execute_http_request",
-                args=(
-                    current_url,
-                    current_target["method"],
-                    current_target["headers"],
-                    current_target["body"],
-                    current_target.get("timeout_seconds", 30),
-                    current_target.get("retry_count", 0),
-                    current_target.get("retry_delay_seconds", 1),
-                    current_target.get("follow_redirects", True),
-                ),
-                start_to_close_timeout=timedelta(seconds=current_target.get(
-                    "timeout_seconds", 30) * (current_target.get("retry_count", 0) + 1) + 60),
-            )
+            config = self._cached_config()
+            tick = await run_tick(
+                schedule_id, run_number, fused_tick, config, fire_at,
+                missed_runs, queue_routing)
 
-            await workflow.execute_activity(
-                "create_job_record",
-                args=(schedule_id, run_number, request_result),
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+            if tick.get("deleted"):
+                return
 
-            run_number += 1
+            if tick.get("paused"):
+                break
 
-            next_run_time = workflow.now() + interval
-            if next_run_time < end_time:
-                await workflow.sleep(interval)
+            self._store_tick(config, tick)
+
+            if tick.get("deferred"):
+                continue
+
+            run_number += 1
+            missed_runs = 0
+            schedule = tick["schedule"]
+            interval = timedelta(seconds=schedule["interval_seconds"])
+            if catch_up:
+                catch_up -= 1
+                next_fire = fire_at = next_fire + interval
+                continue
+            next_fire = advance_fire_time(next_fire, interval, workflow.now(), fixed_rate)
+            fire_at = next_fire + jitter(interval, jitter_ratio)
+            if fire_at < window_end:
+                await sleep_until(fire_at)
             else:
                 break
@@ -1,5 +1,6 @@
 import asyncio
 import os
+from contextlib import asynccontextmanager
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,6 +10,10 @@ from sqlmodel import SQLModel
 
 import db.database
 from main import create_app
+from temporal.client import temporal_client_manager
+from temporal.config_cache import schedule_config_cache
+from temporal.http_pool import http_client_pool
+from temporal.payload_store import payload_store
 
 
 def setup_test_env():
@@ -69,6 +74,37 @@ def override_database(monkeypatch):
     asyncio.run(cleanup())
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_http_client_pool():
+    yield
+    asyncio.run(http_client_pool.close())
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_payload_store(override_database, monkeypatch):
+    @asynccontextmanager
+    async def get_session():
+        async with AsyncSession(db.database.engine, expire_on_commit=False) as session:
+            yield session
+
+    monkeypatch.setattr("temporal.payload_store.get_session", get_session)
+    monkeypatch.setattr(payload_store, "_next_sweep", 0.0)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_schedule_config_cache():
+    schedule_config_cache.clear()
+    yield
+    schedule_config_cache.clear()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_temporal_client():
+    temporal_client_manager.close()
+    yield
+    temporal_client_manager.close()
+
+
 @pytest.fixture
 def client():
     app = create_app()
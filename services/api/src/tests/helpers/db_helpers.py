@@ -4,11 +4,12 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models.job import Job as JobModel
-from db.models.schedule import IntervalSchedule as IntervalScheduleModel
+from db.models.schedule import Schedule as ScheduleModel
 from db.models.target import Target as TargetModel
 from db.models.url import URL as URLModel
 from enums.http_methods import HTTPMethods
 from enums.job_status import JobStatus
+from enums.schedule_type import ScheduleType
 
 
 async def create_test_url(
@@ -61,8 +62,9 @@ async def create_test_schedule(
     interval_seconds: int = 60,
     paused: bool = False,
     name: str = "Test Schedule",
-) -> IntervalScheduleModel:
-    schedule = IntervalScheduleModel(
+) -> ScheduleModel:
+    schedule = ScheduleModel(
+        schedule_type=ScheduleType.INTERVAL,
         target_id=target_id,
         interval_seconds=interval_seconds,
         paused=paused,
@@ -103,7 +105,7 @@ async def create_test_data_chain(
     url_kwargs: dict | None = None,
     target_kwargs: dict | None = None,
     schedule_kwargs: dict | None = None,
-) -> tuple[URLModel, TargetModel, IntervalScheduleModel]:
+) -> tuple[URLModel, TargetModel, ScheduleModel]:
     url = await create_test_url(session, **(url_kwargs or {}))
     target = await create_test_target(
         session, url.id, **(target_kwargs or {})
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,3 +18,23 @@ def mock_session(session: AsyncSession, *module_paths: str):
     finally:
         for mock_patch in patches:
             mock_patch.__exit__(None, None, None)
+
+
+def mock_http_client() -> AsyncMock:
+    client = AsyncMock()
+    client.build_request = MagicMock()
+    return client
+
+
+def stream_response(response: MagicMock) -> MagicMock:
+    content = response.content
+
+    async def aiter_bytes(chunk_size=None):
+        if content:
+            yield content
+
+    response.aiter_bytes = aiter_bytes
+    response.aclose = AsyncMock()
+    response.encoding = "utf-8"
+    response.http_version = "HTTP/1.1"
+    return response
@@ -59,3 +59,26 @@ def test_get_runs_pagination(client):
     if response.status_code == 200:
         data = response.json()
         assert data["success"] is True
+
+
+def test_get_runs_with_invalid_cursor(client):
+    response = client.get("/runs?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_runs_with_multiple_statuses(client):
+    response = client.get("/runs?status=success&status=timeout&limit=5")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+def test_get_runs_with_unknown_field(client):
+    response = client.get("/runs?fields=status,not_a_column")
+    assert response.status_code == 400
+
+
+def test_get_runs_with_sparse_fields(client, schedule_id):
+    response = client.get(
+        f"/runs?schedule_id={schedule_id}&fields=status,status_code&include=response_body")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
@@ -3,15 +3,19 @@ from datetime import UTC, datetime
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+from sqlmodel import select
 
 from temporal.activities import (
     get_schedule_and_target,
     execute_http_request,
     create_job_record,
+    run_schedule_tick,
 )
+from db.models.job import Job as JobModel
 from enums.job_status import JobStatus
 from tests.helpers.db_helpers import create_test_data_chain
-from tests.helpers.mocks import mock_session
+from temporal.payload_store import payload_store
+from tests.helpers.mocks import mock_http_client, mock_session, stream_response
 
 
 @pytest.mark.asyncio
@@ -26,6 +30,9 @@ async def test_get_schedule_and_target_success(test_db):
         assert "target" in result
         assert "url" in result
         assert result["schedule"]["interval_seconds"] == 60
+        assert result["schedule"]["misfire_policy"] == "coalesce"
+        assert result["schedule"]["max_catch_up_runs"] == 3
+        assert result["schedule"]["priority"] == "normal"
 
 
 @pytest.mark.asyncio
@@ -59,12 +66,11 @@ async def test_execute_http_request_success():
     mock_response.json.return_value = {"success": True}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -76,17 +82,16 @@ async def test_execute_http_request_success():
         
         assert result["status"] == JobStatus.SUCCESS.value
         assert result["status_code"] == 200
-        assert result["response_body"] == {"success": True}
+        assert "response_body" not in result
+        assert (await payload_store.get(result["payload_ref"]))["response_body"] == {"success": True}
         assert result["redirected"] is False
 
 
 @pytest.mark.asyncio
 async def test_execute_http_request_timeout():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -106,10 +111,8 @@ async def test_execute_http_request_timeout():
 @pytest.mark.asyncio
 async def test_execute_http_request_connection_error():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(
             side_effect=httpx.ConnectError("Connection failed")
         )
         mock_client.return_value = mock_instance
@@ -129,10 +132,8 @@ async def test_execute_http_request_connection_error():
 @pytest.mark.asyncio
 async def test_execute_http_request_dns_error():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(
             side_effect=httpx.ConnectError("name resolution failed")
         )
         mock_client.return_value = mock_instance
@@ -158,12 +159,11 @@ async def test_execute_http_request_4xx_error():
     mock_response.json.return_value = {"error": "Not found"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -186,12 +186,11 @@ async def test_execute_http_request_5xx_error():
     mock_response.json.return_value = {"error": "Internal server error"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -215,6 +214,7 @@ async def test_execute_http_request_with_retries():
     mock_response_fail.json.return_value = {"error": "Service unavailable"}
     mock_response_fail.history = []
     mock_response_fail.is_redirect = False
+    stream_response(mock_response_fail)
     
     mock_response_success = MagicMock()
     mock_response_success.status_code = 200
@@ -223,12 +223,11 @@ async def test_execute_http_request_with_retries():
     mock_response_success.json.return_value = {"success": True}
     mock_response_success.history = []
     mock_response_success.is_redirect = False
+    stream_response(mock_response_success)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(
             side_effect=[mock_response_fail, mock_response_success]
         )
         mock_client.return_value = mock_instance
@@ -256,12 +255,11 @@ async def test_execute_http_request_retries_exhausted():
     mock_response.json.return_value = {"error": "Service unavailable"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -291,12 +289,11 @@ async def test_execute_http_request_with_redirects():
     mock_response.json.return_value = {"success": True}
     mock_response.history = [mock_redirect]
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -321,12 +318,11 @@ async def test_execute_http_request_post_with_body():
     mock_response.json.return_value = {"id": "123"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.post = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -402,3 +398,87 @@ async def test_create_job_record_with_error(test_db):
         job_id = await create_job_record(schedule.id, 1, request_result)
         
         assert job_id is not None
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_renumbers_legacy_workflow_runs(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+        request_result = {
+            "status": JobStatus.SUCCESS.value,
+            "status_code": 200,
+            "started_at": datetime.now(UTC).replace(tzinfo=None),
+            "attempts": [],
+        }
+        first_id = await create_job_record(schedule.id, 1, request_result)
+
+        with patch('temporal.activities.called_from_legacy_workflow', return_value=True):
+            restarted_id = await create_job_record(schedule.id, 1, request_result)
+
+        assert restarted_id != first_id
+        runs = (await test_db.execute(
+            select(JobModel.run_number).where(JobModel.schedule_id == schedule.id)
+        )).scalars().all()
+        assert sorted(runs) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_run_schedule_tick_executes_and_persists():
+    schedule_id = uuid4()
+    job_id = uuid4()
+    schedule_data = {
+        "paused": False,
+        "schedule": {"interval_seconds": 60},
+        "target": {"method": "GET", "headers": {}, "body": None, "timeout_seconds": 5},
+        "url": "https://api.example.com/test",
+    }
+    request_result = {"status": JobStatus.SUCCESS.value, "attempts": []}
+
+    with patch('temporal.activities.get_schedule_and_target', AsyncMock(return_value=schedule_data)), \
+            patch('temporal.activities.send_http_request', AsyncMock(return_value=request_result)) as mock_http, \
+            patch('temporal.activities.save_job_record', AsyncMock(return_value=job_id)) as mock_create, \
+            patch('temporal.activities.payload_store') as mock_store:
+        tick = await run_schedule_tick(schedule_id, 7)
+
+    assert mock_http.await_args.kwargs["timeout_seconds"] == 5
+    mock_create.assert_awaited_once_with(schedule_id, 7, request_result, None, 0)
+    assert tick["persisted"] is True
+    assert tick["job_id"] == job_id
+    assert tick["target"] == schedule_data["target"]
+    assert "request_result" not in tick
+    mock_store.put.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_schedule_tick_returns_result_when_persist_fails():
+    schedule_data = {
+        "paused": False,
+        "schedule": {"interval_seconds": 60},
+        "target": {"method": "GET", "headers": {}, "body": None},
+        "url": "https://api.example.com/test",
+    }
+    request_result = {
+        "status": JobStatus.SUCCESS.value,
+        "response_body": {"ok": True},
+        "attempts": [],
+    }
+
+    with patch('temporal.activities.get_schedule_and_target', AsyncMock(return_value=schedule_data)), \
+            patch('temporal.activities.send_http_request', AsyncMock(return_value=request_result)), \
+            patch('temporal.activities.save_job_record', AsyncMock(side_effect=Exception("db down"))):
+        tick = await run_schedule_tick(uuid4(), 1)
+
+    assert tick["persisted"] is False
+    assert "response_body" not in tick["request_result"]
+    heavy = await payload_store.get(tick["request_result"]["payload_ref"])
+    assert heavy["response_body"] == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_run_schedule_tick_skips_request_when_paused():
+    with patch('temporal.activities.get_schedule_and_target', AsyncMock(return_value={"paused": True})), \
+            patch('temporal.activities.send_http_request', AsyncMock()) as mock_http:
+        tick = await run_schedule_tick(uuid4(), 1)
+
+    assert tick == {"paused": True}
+    mock_http.assert_not_awaited()
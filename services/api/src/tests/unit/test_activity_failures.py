@@ -2,6 +2,7 @@ import pytest
 from datetime import UTC, datetime
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch, MagicMock
+from sqlalchemy import delete
 from sqlalchemy.exc import OperationalError, DatabaseError
 
 from temporal.activities import (
@@ -9,9 +10,10 @@ from temporal.activities import (
     execute_http_request,
     create_job_record,
 )
+from db.models.target import Target as TargetModel
 from enums.job_status import JobStatus
 from tests.helpers.db_helpers import create_test_data_chain
-from tests.helpers.mocks import mock_session
+from tests.helpers.mocks import mock_http_client, mock_session, stream_response
 
 
 @pytest.mark.asyncio
@@ -110,17 +112,21 @@ async def test_execute_http_request_network_complete_failure():
     import httpx
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.side_effect = Exception("Network interface down")
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=Exception("Network interface down"))
         mock_client.return_value = mock_instance
         
-        with pytest.raises(Exception):
-            await execute_http_request(
-                url="https://api.example.com/test",
-                method="GET",
-                headers=None,
-                body=None,
-            )
+        result = await execute_http_request(
+            url="https://api.example.com/test",
+            method="GET",
+            headers=None,
+            body=None,
+        )
+        
+        assert result["status"] == JobStatus.ERROR.value
+        assert result["status_code"] is None
+        assert "Network interface down" in result["error_message"]
+        assert len(result["attempts"]) == 1
 
 
 @pytest.mark.asyncio
@@ -128,10 +134,8 @@ async def test_execute_http_request_ssl_failure():
     import httpx
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.ConnectError("SSL certificate verification failed"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.ConnectError("SSL certificate verification failed"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -164,13 +168,12 @@ async def test_execute_http_request_intermittent_network():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=intermittent_failure)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=intermittent_failure)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -215,15 +218,18 @@ async def test_create_job_record_with_large_response():
             "attempts": [],
         }
         
-        mock_job = MagicMock()
-        mock_job.id = uuid4()
-        mock_session_obj.add = MagicMock()
+        returned_id = uuid4()
+        mock_session_obj.execute = AsyncMock(side_effect=[
+            MagicMock(all=MagicMock(return_value=[])),
+            MagicMock(all=MagicMock(return_value=[(schedule_id, 1, returned_id)])),
+        ])
         mock_session_obj.commit = AsyncMock()
-        mock_session_obj.refresh = AsyncMock()
-        
-        with patch('temporal.activities.JobModel', return_value=mock_job):
-            job_id = await create_job_record(schedule_id, 1, request_result)
-            assert job_id == mock_job.id
+
+        job_id = await create_job_record(schedule_id, 1, request_result)
+        assert job_id == returned_id
+        job_rows = mock_session_obj.execute.call_args_list[1].args[1]
+        assert job_rows[0]["response_body"] == large_response_body
+        mock_session_obj.refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -231,17 +237,13 @@ async def test_get_schedule_and_target_target_deleted_mid_execution(test_db):
     with mock_session(test_db, "temporal.activities"):
         _, target, schedule = await create_test_data_chain(test_db)
         
-        with patch('temporal.activities.select') as mock_select:
-            def side_effect_select(model):
-                if model.__name__ == 'Target':
-                    mock_result = AsyncMock()
-                    mock_result.scalar_one_or_none.return_value = None
-                    return mock_result
-                return MagicMock()
-            
-            with pytest.raises(ValueError) as exc_info:
-                await get_schedule_and_target(schedule.id)
-            assert "not found" in str(exc_info.value).lower()
+        # SQLite does not enforce the cascade, leaving the schedule orphaned
+        await test_db.execute(delete(TargetModel).where(TargetModel.id == target.id))
+        await test_db.commit()
+        
+        with pytest.raises(ValueError) as exc_info:
+            await get_schedule_and_target(schedule.id)
+        assert str(exc_info.value) == f"Target {target.id} not found"
 
 
 @pytest.mark.asyncio
@@ -249,10 +251,8 @@ async def test_execute_http_request_max_redirects():
     import httpx
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TooManyRedirects("Too many redirects"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TooManyRedirects("Too many redirects"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -273,10 +273,8 @@ async def test_execute_http_request_response_too_large():
     import httpx
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=Exception("Response too large"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=Exception("Response too large"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
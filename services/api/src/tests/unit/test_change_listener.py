@@ -0,0 +1,78 @@
+import json
+import pytest
+from uuid import uuid4
+
+from db.database import ChangeListener, change_listener, notify_change
+from domains.schedules.repository import ScheduleRepository
+from tests.helpers.db_helpers import create_test_data_chain
+from tests.helpers.mocks import mock_session
+
+
+def test_dispatch_reaches_all_subscribers_despite_errors():
+    listener = ChangeListener()
+    received = []
+
+    def failing(change):
+        raise RuntimeError("boom")
+
+    listener.subscribe(failing)
+    unsubscribe = listener.subscribe(received.append)
+
+    listener.dispatch({"entity": "schedule", "id": "1", "action": "paused"})
+    unsubscribe()
+    listener.dispatch({"entity": "schedule", "id": "2", "action": "paused"})
+
+    assert received == [{"entity": "schedule", "id": "1", "action": "paused"}]
+
+
+def test_notification_payload_is_decoded():
+    listener = ChangeListener()
+    received = []
+    listener.subscribe(received.append)
+    change = {"entity": "target", "id": str(uuid4()), "action": "updated"}
+
+    listener._on_notification(None, 1234, "api_scheduler_changes", json.dumps(change))
+    listener._on_notification(None, 1234, "api_scheduler_changes", "not json")
+
+    assert received == [change]
+
+
+@pytest.mark.asyncio
+async def test_changes_dispatched_only_after_commit(test_db):
+    received = []
+    unsubscribe = change_listener.subscribe(received.append)
+    try:
+        schedule_id = uuid4()
+
+        await notify_change(test_db, "schedule", schedule_id, "updated")
+        assert received == []
+
+        await test_db.commit()
+        assert received == [{"entity": "schedule", "id": str(schedule_id), "action": "updated"}]
+
+        await notify_change(test_db, "schedule", schedule_id, "deleted")
+        await test_db.rollback()
+        await test_db.commit()
+        assert len(received) == 1
+    finally:
+        unsubscribe()
+
+
+@pytest.mark.asyncio
+async def test_schedule_repository_writes_emit_changes(test_db):
+    received = []
+    unsubscribe = change_listener.subscribe(received.append)
+    try:
+        with mock_session(test_db, "domains.schedules.repository"):
+            repo = ScheduleRepository()
+            _, _, schedule = await create_test_data_chain(test_db)
+
+            await repo.pause_schedule(schedule.id)
+            await repo.resume_schedule(schedule.id)
+
+        assert [(c["entity"], c["id"], c["action"]) for c in received] == [
+            ("schedule", str(schedule.id), "paused"),
+            ("schedule", str(schedule.id), "resumed"),
+        ]
+    finally:
+        unsubscribe()
@@ -0,0 +1,89 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import patch
+
+from domains.schedules.repository import ScheduleRepository
+from temporal.activities import get_schedule_and_target
+from temporal.config_cache import ScheduleConfigCache, schedule_config_cache
+from tests.helpers.db_helpers import create_test_data_chain
+from tests.helpers.mocks import mock_session
+
+
+def test_cache_expires_entries_after_ttl():
+    cache = ScheduleConfigCache(ttl_seconds=10, max_entries=10)
+    schedule_id = uuid4()
+
+    with patch('temporal.config_cache.time.monotonic', return_value=100.0):
+        cache.put(schedule_id, {"paused": False})
+        assert cache.get(schedule_id) == {"paused": False}
+
+    with patch('temporal.config_cache.time.monotonic', return_value=111.0):
+        assert cache.get(schedule_id) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ScheduleConfigCache(ttl_seconds=60, max_entries=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.put(first, {"n": 1})
+    cache.put(second, {"n": 2})
+    cache.get(first)
+    cache.put(third, {"n": 3})
+
+    assert cache.get(second) is None
+    assert cache.get(first) == {"n": 1}
+    assert cache.get(third) == {"n": 3}
+
+
+def test_cache_invalidates_by_target_and_url():
+    cache = ScheduleConfigCache(ttl_seconds=60, max_entries=10)
+    target_id, url_id = uuid4(), uuid4()
+    by_target, by_url, unrelated = uuid4(), uuid4(), uuid4()
+
+    cache.put(by_target, {}, target_id=target_id)
+    cache.put(by_url, {}, url_id=url_id)
+    cache.put(unrelated, {}, target_id=uuid4(), url_id=uuid4())
+
+    cache.invalidate_target(target_id)
+    cache.invalidate_url(url_id)
+
+    assert cache.get(by_target) is None
+    assert cache.get(by_url) is None
+    assert cache.get(unrelated) == {}
+
+
+def test_cache_disabled_with_zero_ttl():
+    cache = ScheduleConfigCache(ttl_seconds=0, max_entries=10)
+    schedule_id = uuid4()
+
+    cache.put(schedule_id, {"paused": False})
+
+    assert cache.get(schedule_id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_and_target_served_from_cache(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        first = await get_schedule_and_target(schedule.id)
+
+        with patch('temporal.activities.get_session') as mock_get_session:
+            second = await get_schedule_and_target(schedule.id)
+            mock_get_session.assert_not_called()
+
+        assert second == first
+
+
+@pytest.mark.asyncio
+async def test_pause_invalidates_cached_config(test_db):
+    with mock_session(test_db, "temporal.activities", "domains.schedules.repository"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        assert (await get_schedule_and_target(schedule.id))["paused"] is False
+
+        await ScheduleRepository().pause_schedule(schedule.id)
+
+        assert schedule_config_cache.get(schedule.id) is None
+        assert (await get_schedule_and_target(schedule.id))["paused"] is True
@@ -0,0 +1,125 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from enums.job_status import JobStatus
+from temporal.activities import execute_http_request
+from temporal.http_pool import HTTPClientPool, http_client_pool
+from tests.helpers.mocks import mock_http_client, stream_response
+
+
+def test_get_client_reuses_client_for_same_settings():
+    pool = HTTPClientPool()
+
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_client.side_effect = lambda **kwargs: MagicMock()
+
+        first = pool.get_client(follow_redirects=True)
+        second = pool.get_client(follow_redirects=True)
+
+        assert first is second
+        assert mock_client.call_count == 1
+
+
+def test_get_client_separates_clients_by_settings():
+    pool = HTTPClientPool()
+
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_client.side_effect = lambda **kwargs: MagicMock()
+
+        following = pool.get_client(follow_redirects=True)
+        not_following = pool.get_client(follow_redirects=False)
+        unverified = pool.get_client(follow_redirects=True, verify=False)
+        proxied = pool.get_client(follow_redirects=True, proxy="http://proxy.internal:3128")
+
+        assert len({id(following), id(not_following), id(unverified), id(proxied)}) == 4
+        assert mock_client.call_count == 4
+
+
+def test_get_client_separates_http2_clients():
+    pool = HTTPClientPool()
+
+    with patch('temporal.http_pool.HTTP2_AVAILABLE', True):
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.side_effect = lambda **kwargs: MagicMock()
+
+            http1 = pool.get_client(follow_redirects=True)
+            http2 = pool.get_client(follow_redirects=True, http2=True)
+
+            assert http1 is not http2
+            assert mock_client.call_args_list[0].kwargs["http2"] is False
+            assert mock_client.call_args_list[1].kwargs["http2"] is True
+
+
+def test_get_client_falls_back_to_http1_without_h2():
+    pool = HTTPClientPool()
+
+    with patch('temporal.http_pool.HTTP2_AVAILABLE', False):
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.side_effect = lambda **kwargs: MagicMock()
+
+            http1 = pool.get_client(follow_redirects=True)
+            requested_http2 = pool.get_client(follow_redirects=True, http2=True)
+
+            assert http1 is requested_http2
+            assert mock_client.call_count == 1
+            assert mock_client.call_args.kwargs["http2"] is False
+
+
+@pytest.mark.asyncio
+async def test_close_closes_all_clients():
+    pool = HTTPClientPool()
+
+    with patch('httpx.AsyncClient') as mock_client:
+        clients = []
+
+        def build(**kwargs):
+            instance = AsyncMock()
+            clients.append(instance)
+            return instance
+
+        mock_client.side_effect = build
+
+        pool.get_client(follow_redirects=True)
+        pool.get_client(follow_redirects=False)
+
+        await pool.close()
+
+        for instance in clients:
+            instance.aclose.assert_awaited_once()
+
+        pool.get_client(follow_redirects=True)
+        assert mock_client.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_http_request_reuses_pooled_client():
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"success": true}'
+    mock_response.headers = {"Content-Type": "application/json"}
+    mock_response.json.return_value = {"success": True}
+    mock_response.history = []
+    mock_response.is_redirect = False
+    stream_response(mock_response)
+
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
+        mock_client.return_value = mock_instance
+
+        for _ in range(3):
+            result = await execute_http_request(
+                url="https://api.example.com/test",
+                method="GET",
+                headers=None,
+                body=None,
+                timeout_seconds=5,
+            )
+            assert result["status"] == JobStatus.SUCCESS.value
+
+        assert mock_client.call_count == 1
+        assert mock_instance.send.await_count == 3
+        assert mock_instance.build_request.call_args.kwargs["timeout"] == 5
+
+    await http_client_pool.close()
+    mock_instance.aclose.assert_awaited_once()
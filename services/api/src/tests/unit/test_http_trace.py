@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporal.activities import execute_http_request
+from temporal.http_trace import RequestPhaseTracer
+from tests.helpers.mocks import mock_http_client, stream_response
+
+
+async def replay(tracer, events):
+    with patch('temporal.http_trace.time.perf_counter') as mock_clock:
+        for event_name, at in events:
+            mock_clock.return_value = at
+            await tracer(event_name, {})
+
+
+@pytest.mark.asyncio
+async def test_tracer_records_all_phases_for_new_connection():
+    tracer = RequestPhaseTracer()
+
+    await replay(tracer, [
+        ("connection.connect_tcp.started", 0.000),
+        ("connection.connect_tcp.complete", 0.010),
+        ("connection.start_tls.started", 0.010),
+        ("connection.start_tls.complete", 0.030),
+        ("http11.send_request_headers.started", 0.030),
+        ("http11.send_request_headers.complete", 0.031),
+        ("http11.receive_response_headers.started", 0.031),
+        ("http11.receive_response_headers.complete", 0.080),
+        ("http11.receive_response_body.started", 0.080),
+        ("http11.receive_response_body.complete", 0.100),
+    ])
+
+    timings = tracer.to_dict()
+    assert timings["connect_ms"] == pytest.approx(10.0)
+    assert timings["tls_ms"] == pytest.approx(20.0)
+    assert timings["ttfb_ms"] == pytest.approx(50.0)
+    assert timings["download_ms"] == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_tracer_leaves_connection_phases_empty_on_reuse():
+    tracer = RequestPhaseTracer()
+
+    await replay(tracer, [
+        ("http2.send_request_headers.started", 0.000),
+        ("http2.send_request_headers.complete", 0.001),
+        ("http2.receive_response_headers.started", 0.001),
+        ("http2.receive_response_headers.complete", 0.040),
+        ("http2.receive_response_body.started", 0.040),
+        ("http2.receive_response_body.complete", 0.045),
+    ])
+
+    timings = tracer.to_dict()
+    assert timings["connect_ms"] is None
+    assert timings["tls_ms"] is None
+    assert timings["ttfb_ms"] == pytest.approx(40.0)
+    assert timings["download_ms"] == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_tracer_sums_phases_across_redirect_hops():
+    tracer = RequestPhaseTracer()
+
+    hop = [
+        ("connection.connect_tcp.started", 0.000),
+        ("connection.connect_tcp.complete", 0.005),
+        ("http11.send_request_headers.started", 0.005),
+        ("http11.receive_response_headers.complete", 0.015),
+    ]
+    await replay(tracer, hop)
+    await replay(tracer, hop)
+
+    assert tracer.connect_ms == pytest.approx(10.0)
+    assert tracer.ttfb_ms == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_http_request_passes_trace_extension():
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"success": true}'
+    mock_response.headers = {"Content-Type": "application/json"}
+    mock_response.json.return_value = {"success": True}
+    mock_response.history = []
+    mock_response.is_redirect = False
+    stream_response(mock_response)
+
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
+        mock_client.return_value = mock_instance
+
+        result = await execute_http_request(
+            url="https://api.example.com/test",
+            method="GET",
+            headers=None,
+            body=None,
+        )
+
+        tracer = mock_instance.build_request.call_args.kwargs["extensions"]["trace"]
+        assert isinstance(tracer, RequestPhaseTracer)
+        for field in ("connect_ms", "tls_ms", "ttfb_ms", "download_ms"):
+            assert field in result
+            assert field in result["attempts"][0]
+        assert result["latency_ms"] >= 0
@@ -10,6 +10,7 @@ from domains.targets.service import TargetService
 from models.schedule import IntervalSchedule as IntervalSchedulePydantic
 from models.target import Target as TargetPydantic
 from sqlalchemy.exc import DatabaseError, OperationalError
+from temporalio.service import RPCError, RPCStatusCode
 
 
 @pytest.mark.asyncio
@@ -307,11 +308,14 @@ async def test_temporal_workflow_already_terminated():
         paused=True,
     )
 
-    mock_client = AsyncMock()
+    mock_client = MagicMock()
+    mock_client.get_workflow_handle.return_value.signal = AsyncMock(
+        side_effect=RPCError("workflow not found", RPCStatusCode.NOT_FOUND, b""))
+    not_found = RPCError("workflow not found", RPCStatusCode.NOT_FOUND, b"")
 
     with patch.object(service.repository, 'get_schedule_by_id', return_value=mock_schedule):
-        with patch('temporal.client.get_temporal_client', return_value=mock_client):
-            with patch('temporal.client.terminate_schedule_workflow', side_effect=Exception("Workflow not found")):
+        with patch('domains.schedules.service.get_temporal_client', return_value=mock_client):
+            with patch('temporal.client.terminate_schedule_workflow', side_effect=not_found):
                 with patch.object(service.repository, 'pause_schedule', return_value=mock_schedule):
                     result = await service.pause_schedule(schedule_id)
                     assert result.paused is True
@@ -68,3 +68,16 @@ async def test_get_jobs_by_schedule_id(test_db):
 
         jobs = await repo.get_jobs_by_schedule_id(schedule.id)
         assert len(jobs) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_last_run_number(test_db):
+    with mock_session(test_db, "domains.jobs.repository"):
+        repo = JobRepository()
+        _, _, schedule = await create_test_data_chain(test_db)
+        assert await repo.get_last_run_number(schedule.id) == 0
+
+        await create_test_job(test_db, schedule.id, run_number=1)
+        await create_test_job(test_db, schedule.id, run_number=5)
+
+        assert await repo.get_last_run_number(schedule.id) == 5
@@ -0,0 +1,189 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlmodel import select
+
+from db.models.attempt import Attempt
+from db.models.job import Job as JobModel
+from enums.job_status import JobStatus
+from temporal import activities
+from temporal.activities import create_job_record
+from temporal.job_writer import JobWriteBuffer, attempt_row, job_row, parse_status
+from tests.helpers.db_helpers import create_test_data_chain
+from tests.helpers.mocks import mock_session
+from tests.unit.test_payload_store import make_request_result
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def all(self):
+        return [(row["schedule_id"], row["run_number"], row["id"]) for row in self.rows]
+
+
+class FakeSession:
+    def __init__(self, log: list, poisoned: set):
+        self.log = log
+        self.poisoned = poisoned
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def execute(self, statement, rows=None):
+        if rows is None:
+            return FakeResult([])
+        self.rows.extend(rows)
+        return FakeResult([row for row in rows if "schedule_id" in row])
+
+    async def commit(self):
+        if any(row["id"] in self.poisoned for row in self.rows):
+            raise ValueError("constraint violation")
+        self.log.append(list(self.rows))
+
+
+def make_row():
+    return {"id": uuid4(), "schedule_id": uuid4(), "run_number": 1}
+
+
+@pytest.mark.asyncio
+async def test_buffer_coalesces_concurrent_submits_into_one_transaction():
+    commits = []
+    buffer = JobWriteBuffer(lambda: FakeSession(commits, set()), max_batch_size=100, max_delay_ms=5)
+    jobs = [make_row() for _ in range(10)]
+
+    job_ids = await asyncio.gather(*(buffer.submit(job, [{"id": uuid4(), "job_id": job["id"]}]) for job in jobs))
+
+    assert job_ids == [job["id"] for job in jobs]
+    assert len(commits) == 1
+    assert len(commits[0]) == 20
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_when_batch_is_full():
+    commits = []
+    buffer = JobWriteBuffer(lambda: FakeSession(commits, set()), max_batch_size=3, max_delay_ms=60_000)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(buffer.submit(make_row(), []) for _ in range(3))), timeout=1)
+
+    assert [len(batch) for batch in commits] == [3]
+
+
+@pytest.mark.asyncio
+async def test_buffer_isolates_failing_record():
+    commits = []
+    bad = make_row()
+    buffer = JobWriteBuffer(lambda: FakeSession(commits, {bad["id"]}), max_batch_size=100, max_delay_ms=5)
+    good = [make_row(), make_row()]
+
+    results = await asyncio.gather(
+        buffer.submit(good[0], []),
+        buffer.submit(bad, []),
+        buffer.submit(good[1], []),
+        return_exceptions=True,
+    )
+
+    assert results[0] == good[0]["id"]
+    assert isinstance(results[1], ValueError)
+    assert results[2] == good[1]["id"]
+    assert [batch[0]["id"] for batch in commits] == [good[0]["id"], good[1]["id"]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flushing_submitter_does_not_strand_batch():
+    commits = []
+    released = asyncio.Event()
+
+    class SlowSession(FakeSession):
+        async def commit(self):
+            await released.wait()
+            await super().commit()
+
+    buffer = JobWriteBuffer(lambda: SlowSession(commits, set()), max_batch_size=2, max_delay_ms=60_000)
+    first, second = make_row(), make_row()
+
+    waiting = asyncio.create_task(buffer.submit(first, []))
+    await asyncio.sleep(0)
+    flushing = asyncio.create_task(buffer.submit(second, []))
+    await asyncio.sleep(0.01)
+    flushing.cancel()
+    released.set()
+
+    assert await asyncio.wait_for(waiting, timeout=1) == first["id"]
+    assert [len(batch) for batch in commits] == [2]
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_batches_concurrent_activities(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        job_ids = await asyncio.gather(*(
+            create_job_record(schedule.id, run_number, make_request_result())
+            for run_number in range(1, 6)
+        ))
+        assert activities.get_session.call_count == 1
+
+        attempts = (await test_db.execute(
+            select(Attempt).where(Attempt.job_id.in_(job_ids)))).scalars().all()
+        assert len(attempts) == 5
+
+        jobs = (await test_db.execute(
+            select(JobModel).where(JobModel.schedule_id == schedule.id))).scalars().all()
+        assert {job.id for job in jobs} == set(job_ids)
+
+
+def test_rows_normalize_timestamps_and_status():
+    job = job_row(uuid4(), 1, make_request_result())
+
+    row = attempt_row(job, {
+        "attempt_number": 1,
+        "started_at": "2024-01-01T00:00:00Z",
+        "status": "HTTP_5XX",
+    })
+
+    assert row["job_id"] == job["id"]
+    assert row["job_started_at"] == job["started_at"]
+    assert row["started_at"] == datetime(2024, 1, 1)
+    assert row["status"] == JobStatus.HTTP_5XX
+    assert parse_status("bogus") == JobStatus.ERROR
+    assert job["status"] == JobStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_is_idempotent_per_run(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        first_id = await create_job_record(schedule.id, 7, make_request_result())
+        retried_id = await create_job_record(schedule.id, 7, make_request_result())
+
+        assert retried_id == first_id
+        jobs = (await test_db.execute(
+            select(JobModel).where(JobModel.schedule_id == schedule.id))).scalars().all()
+        attempts = (await test_db.execute(
+            select(Attempt).where(Attempt.job_id == first_id))).scalars().all()
+        assert len(jobs) == 1
+        assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_reexecuted_request_does_not_duplicate_run(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+        first = make_request_result()
+        retried = {**make_request_result(), "started_at": first["started_at"] + timedelta(seconds=30)}
+
+        first_id = await create_job_record(schedule.id, 3, first)
+        retried_id = await create_job_record(schedule.id, 3, retried)
+
+        assert retried_id == first_id
+        jobs = (await test_db.execute(
+            select(JobModel).where(JobModel.schedule_id == schedule.id))).scalars().all()
+        assert len(jobs) == 1
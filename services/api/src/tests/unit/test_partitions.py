@@ -0,0 +1,121 @@
+import pytest
+from datetime import date
+
+from db import partitions
+from db.partitions import (
+    create_partition_sql,
+    create_partitions,
+    drop_expired_partitions,
+    expired_partitions,
+    maintain_partitions,
+    partition_day,
+    partition_name,
+)
+
+
+class FakeResult:
+    def __init__(self, names: list[str]):
+        self.names = names
+
+    def all(self):
+        return [(name,) for name in self.names]
+
+
+class FakeConnection:
+    def __init__(self, existing: dict[str, list[str]], default_rows: set[str] = frozenset()):
+        self.existing = existing
+        self.default_rows = default_rows
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        if "pg_inherits" in str(statement):
+            return FakeResult(self.existing.get(params["table"], []))
+        self.statements.append(str(statement))
+
+    async def scalar(self, statement, params=None):
+        return any(f"FROM {table}_default " in str(statement) for table in self.default_rows)
+
+
+def test_partition_names_round_trip():
+    name = partition_name("jobs", date(2024, 3, 9))
+
+    assert name == "jobs_p20240309"
+    assert partition_day("jobs", name) == date(2024, 3, 9)
+    assert partition_day("attempts", name) is None
+    assert partition_day("jobs", "jobs_default") is None
+    assert create_partition_sql("attempts", date(2024, 12, 31)) == (
+        "CREATE TABLE IF NOT EXISTS attempts_p20241231 PARTITION OF attempts "
+        "FOR VALUES FROM ('2024-12-31') TO ('2025-01-01')"
+    )
+
+
+def test_expired_partitions_keeps_partitions_overlapping_retention():
+    names = ["jobs_p20240101", "jobs_p20240102", "jobs_p20240103", "jobs_default"]
+
+    assert expired_partitions("jobs", names, cutoff=date(2024, 1, 3)) == [
+        "jobs_p20240101",
+        "jobs_p20240102",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_partitions_only_creates_missing_days():
+    connection = FakeConnection({"jobs": ["jobs_p20240101"]})
+
+    created = await create_partitions(connection, date(2024, 1, 1), premake_days=1)
+
+    assert created == ["attempts_p20240101", "jobs_p20240102", "attempts_p20240102"]
+    assert any("jobs_default PARTITION OF jobs DEFAULT" in sql for sql in connection.statements)
+    assert not any("staging" in sql for sql in connection.statements)
+
+
+@pytest.mark.asyncio
+async def test_create_partitions_moves_rows_out_of_default_partition():
+    connection = FakeConnection({}, default_rows={"jobs"})
+
+    await create_partitions(connection, date(2024, 1, 1), premake_days=0)
+
+    steps = [
+        sql.split(" (")[0] if sql.startswith("CREATE") else sql.split(" WHERE")[0]
+        for sql in connection.statements
+        if "DEFAULT" not in sql
+    ]
+    assert steps == [
+        "CREATE TEMP TABLE attempts_p20240101_staging",
+        "WITH moved AS (DELETE FROM attempts",
+        "CREATE TEMP TABLE jobs_p20240101_staging",
+        "WITH moved AS (DELETE FROM jobs",
+        "CREATE TABLE IF NOT EXISTS jobs_p20240101 PARTITION OF jobs FOR VALUES FROM",
+        "CREATE TABLE IF NOT EXISTS attempts_p20240101 PARTITION OF attempts FOR VALUES FROM",
+        "INSERT INTO jobs SELECT * FROM jobs_p20240101_staging",
+        "DROP TABLE jobs_p20240101_staging",
+        "INSERT INTO attempts SELECT * FROM attempts_p20240101_staging",
+        "DROP TABLE attempts_p20240101_staging",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_partitions_drops_attempts_before_jobs():
+    connection = FakeConnection({
+        "jobs": ["jobs_p20240101", "jobs_p20240110"],
+        "attempts": ["attempts_p20240101", "attempts_p20240110"],
+    })
+
+    dropped = await drop_expired_partitions(connection, date(2024, 1, 10), retention_days=7)
+
+    assert dropped == ["attempts_p20240101", "jobs_p20240101"]
+    ddl = [sql for sql in connection.statements if not sql.startswith("DELETE")]
+    assert ddl == [
+        "ALTER TABLE attempts DETACH PARTITION attempts_p20240101",
+        "DROP TABLE attempts_p20240101",
+        "ALTER TABLE jobs DETACH PARTITION jobs_p20240101",
+        "DROP TABLE jobs_p20240101",
+    ]
+    assert not any(sql.startswith("DELETE FROM jobs ") for sql in connection.statements)
+
+
+@pytest.mark.asyncio
+async def test_maintain_partitions_skips_non_postgres(monkeypatch):
+    monkeypatch.setattr(partitions.settings, "job_retention_days", 1)
+
+    assert await maintain_partitions() == {"skipped": True}
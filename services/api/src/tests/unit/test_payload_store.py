@@ -0,0 +1,143 @@
+import pytest
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+from sqlalchemy import update
+from sqlmodel import select
+from temporalio.exceptions import ApplicationError
+
+from db.models.attempt import Attempt
+from db.models.job import Job as JobModel
+from db.models.payload_blob import PayloadBlob
+from enums.job_status import JobStatus
+from temporal import payload_store as payload_store_module
+from temporal.activities import create_job_record
+from temporal.payload_store import (PAYLOAD_MISSING, merge_payload, payload_store,
+                                    split_payload)
+from tests.helpers.db_helpers import create_test_data_chain
+from tests.helpers.mocks import mock_session
+
+
+def make_request_result():
+    return {
+        "status": JobStatus.SUCCESS.value,
+        "status_code": 200,
+        "latency_ms": 120.0,
+        "response_size_bytes": 17,
+        "started_at": datetime.now(UTC).replace(tzinfo=None),
+        "request_headers": {"Authorization": "Bearer token"},
+        "request_body": None,
+        "response_headers": {"Content-Type": "application/json"},
+        "response_body": {"success": True},
+        "error_message": None,
+        "redirected": False,
+        "redirect_count": 0,
+        "attempts": [
+            {
+                "attempt_number": 1,
+                "started_at": datetime.now(UTC).replace(tzinfo=None),
+                "status": JobStatus.SUCCESS.value,
+                "status_code": 200,
+                "latency_ms": 120.0,
+                "response_headers": {"Content-Type": "application/json"},
+                "response_body": {"success": True},
+                "error_message": None,
+            }
+        ],
+    }
+
+
+def test_split_payload_keeps_only_summary_fields():
+    summary, heavy = split_payload(make_request_result())
+
+    for field in ("request_headers", "request_body", "response_headers", "response_body"):
+        assert field not in summary
+    assert "response_body" not in summary["attempts"][0]
+    assert summary["attempts"][0]["status_code"] == 200
+    assert heavy["response_body"] == {"success": True}
+    assert heavy["attempts"][0]["response_headers"] == {"Content-Type": "application/json"}
+
+
+def test_split_and_merge_round_trip():
+    request_result = make_request_result()
+
+    summary, heavy = split_payload(request_result)
+
+    assert merge_payload(summary, heavy) == request_result
+
+
+@pytest.mark.asyncio
+async def test_store_put_get_delete():
+    key = await payload_store.put({"response_body": "x" * 10_000})
+
+    assert await payload_store.get(key) == {"response_body": "x" * 10_000}
+
+    await payload_store.delete(key)
+    assert await payload_store.get(key) is None
+    await payload_store.delete(key)
+    assert await payload_store.get("not-a-key") is None
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_resolves_payload_ref(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        summary, heavy = split_payload(make_request_result())
+        summary["payload_ref"] = await payload_store.put(heavy)
+
+        job_id = await create_job_record(schedule.id, 1, summary)
+
+        job = (await test_db.execute(select(JobModel).where(JobModel.id == job_id))).scalar_one()
+        attempt = (await test_db.execute(select(Attempt).where(Attempt.job_id == job_id))).scalar_one()
+        assert job.response_body == {"success": True}
+        assert job.request_headers == {"Authorization": "Bearer token"}
+        assert attempt.response_headers == {"Content-Type": "application/json"}
+        assert await payload_store.get(summary["payload_ref"]) is None
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_rejects_missing_payload(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        summary, _ = split_payload(make_request_result())
+        summary["payload_ref"] = "missing"
+
+        with pytest.raises(ApplicationError) as exc_info:
+            await create_job_record(schedule.id, 1, summary)
+
+        assert exc_info.value.type == PAYLOAD_MISSING
+        assert exc_info.value.non_retryable
+        jobs = (await test_db.execute(select(JobModel))).scalars().all()
+        assert jobs == []
+
+
+@pytest.mark.asyncio
+async def test_create_job_record_retry_after_write_returns_recorded_job(test_db):
+    with mock_session(test_db, "temporal.activities"):
+        _, _, schedule = await create_test_data_chain(test_db)
+
+        summary, heavy = split_payload(make_request_result())
+        summary["payload_ref"] = await payload_store.put(heavy)
+
+        job_id = await create_job_record(schedule.id, 1, summary)
+
+        assert await create_job_record(schedule.id, 1, summary) == job_id
+
+
+@pytest.mark.asyncio
+async def test_sweep_removes_only_expired_blobs():
+    old_key = await payload_store.put({"response_body": "old"})
+    new_key = await payload_store.put({"response_body": "new"})
+    async with payload_store_module.get_session() as session:
+        await session.execute(
+            update(PayloadBlob)
+            .where(PayloadBlob.id == UUID(old_key))
+            .values(created_at=datetime.now() - timedelta(hours=2))
+        )
+        await session.commit()
+
+    assert await payload_store.sweep(max_age_seconds=3600) == 1
+
+    assert await payload_store.get(old_key) is None
+    assert await payload_store.get(new_key) == {"response_body": "new"}
@@ -396,6 +396,7 @@ async def test_concurrent_operations_during_db_recovery():
 async def test_http_request_during_network_recovery():
     """Test HTTP requests retry after network recovery"""
     from temporal.activities import execute_http_request
+    from tests.helpers.mocks import mock_http_client, stream_response
     import httpx
     
     call_count = 0
@@ -416,13 +417,12 @@ async def test_http_request_during_network_recovery():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=network_recovery)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=network_recovery)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -0,0 +1,103 @@
+import hashlib
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporal.activities import execute_http_request
+from temporal.payload_store import payload_store
+from temporal.response_capture import ResponseCapture
+from tests.helpers.mocks import mock_http_client
+
+
+def chunked_response(*chunks: bytes) -> MagicMock:
+    async def aiter_bytes(chunk_size=None):
+        for chunk in chunks:
+            yield chunk
+
+    response = MagicMock()
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
+@pytest.mark.asyncio
+async def test_capture_keeps_small_json_body():
+    body = json.dumps({"success": True}).encode()
+    capture = ResponseCapture(max_capture_bytes=1024)
+
+    await capture.consume(chunked_response(body))
+
+    assert capture.size_bytes == len(body)
+    assert capture.truncated is False
+    assert capture.sha256 == hashlib.sha256(body).hexdigest()
+    assert capture.decode_body("utf-8") == {"success": True}
+
+
+@pytest.mark.asyncio
+async def test_capture_truncates_but_records_true_size_and_hash():
+    chunks = [b"a" * 600, b"b" * 600, b"c" * 600]
+    full_body = b"".join(chunks)
+    capture = ResponseCapture(max_capture_bytes=1000)
+
+    await capture.consume(chunked_response(*chunks))
+
+    assert capture.size_bytes == len(full_body)
+    assert capture.captured_bytes == 1000
+    assert capture.truncated is True
+    assert capture.sha256 == hashlib.sha256(full_body).hexdigest()
+    assert capture.decode_body("utf-8") == "a" * 600 + "b" * 400
+
+
+@pytest.mark.asyncio
+async def test_capture_holds_at_most_max_capture_bytes():
+    capture = ResponseCapture(max_capture_bytes=100)
+
+    await capture.consume(chunked_response(*[b"x" * 1000] * 50))
+
+    assert capture.size_bytes == 50_000
+    assert len(capture.read_bytes()) == 100
+
+
+@pytest.mark.asyncio
+async def test_capture_disabled_still_measures_body():
+    capture = ResponseCapture(max_capture_bytes=0)
+
+    await capture.consume(chunked_response(b"payload"))
+
+    assert capture.size_bytes == 7
+    assert capture.truncated is True
+    assert capture.decode_body("utf-8") is None
+
+
+@pytest.mark.asyncio
+async def test_execute_http_request_applies_max_capture_bytes():
+    body = b"z" * 5000
+    mock_response = chunked_response(body[:2500], body[2500:])
+    mock_response.status_code = 200
+    mock_response.headers = {"Content-Type": "text/plain"}
+    mock_response.history = []
+    mock_response.is_redirect = False
+    mock_response.aclose = AsyncMock()
+    mock_response.encoding = "utf-8"
+    mock_response.http_version = "HTTP/1.1"
+
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
+        mock_client.return_value = mock_instance
+
+        result = await execute_http_request(
+            url="https://api.example.com/large",
+            method="GET",
+            headers=None,
+            body=None,
+            max_capture_bytes=100,
+        )
+
+        assert mock_instance.send.call_args.kwargs["stream"] is True
+        mock_response.aclose.assert_awaited_once()
+        assert result["response_size_bytes"] == 5000
+        assert result["response_truncated"] is True
+        assert (await payload_store.get(result["payload_ref"]))["response_body"] == "z" * 100
+        assert result["response_sha256"] == hashlib.sha256(body).hexdigest()
+        assert result["attempts"][0]["response_truncated"] is True
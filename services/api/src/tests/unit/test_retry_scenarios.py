@@ -4,6 +4,7 @@ import httpx
 
 from temporal.activities import execute_http_request
 from enums.job_status import JobStatus
+from tests.helpers.mocks import mock_http_client, stream_response
 
 
 @pytest.mark.asyncio
@@ -23,13 +24,12 @@ async def test_retry_on_timeout():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=timeout_then_success)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=timeout_then_success)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -66,13 +66,12 @@ async def test_retry_on_connection_error():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=connection_error_then_success)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=connection_error_then_success)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -101,6 +100,7 @@ async def test_retry_on_5xx_error():
         mock_response.json.return_value = {"error": "Server error"}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     async def server_error_then_success(*args, **kwargs):
@@ -111,10 +111,8 @@ async def test_retry_on_5xx_error():
         return create_response(200)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=server_error_then_success)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=server_error_then_success)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -143,12 +141,11 @@ async def test_no_retry_on_4xx_error():
     mock_response.json.return_value = {"error": "Not found"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -173,12 +170,11 @@ async def test_all_retries_fail():
     mock_response.json.return_value = {"error": "Server error"}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -214,6 +210,7 @@ async def test_mixed_retry_failures():
             mock_response.json.return_value = {"error": "Service unavailable"}
             mock_response.history = []
             mock_response.is_redirect = False
+            stream_response(mock_response)
             return mock_response
         else:
             mock_response = MagicMock()
@@ -223,13 +220,12 @@ async def test_mixed_retry_failures():
             mock_response.json.return_value = {"success": True}
             mock_response.history = []
             mock_response.is_redirect = False
+            stream_response(mock_response)
             return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=mixed_failures)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=mixed_failures)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -249,10 +245,8 @@ async def test_mixed_retry_failures():
 @pytest.mark.asyncio
 async def test_zero_retries():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -289,13 +283,12 @@ async def test_custom_retry_delay():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=track_timing)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=track_timing)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -2,6 +2,7 @@ import pytest
 from datetime import UTC, datetime
 from uuid import uuid4
 
+from domains.runs.projection import SUMMARY_FIELDS, parse_fields
 from domains.runs.repository import RunRepository
 from enums.job_status import JobStatus
 from tests.helpers.db_helpers import (
@@ -42,7 +43,7 @@ async def test_get_runs_by_schedule_id(test_db):
         await create_test_job(test_db, schedule.id, run_number=1)
         await create_test_job(test_db, schedule.id, run_number=2)
 
-        runs = await repo.get_runs_by_schedule_id(schedule.id)
+        runs, _ = await repo.get_runs_by_schedule_id(schedule.id)
         assert len(runs) == 2
 
 
@@ -51,10 +52,10 @@ async def test_get_runs_by_schedule_id_with_status_filter(test_db):
     with mock_session(test_db, "domains.runs.repository"):
         repo = RunRepository()
         _, _, schedule = await create_test_data_chain(test_db)
-        await create_test_job(test_db, schedule.id, status=JobStatus.SUCCESS)
-        await create_test_job(test_db, schedule.id, status=JobStatus.ERROR)
+        await create_test_job(test_db, schedule.id, run_number=1, status=JobStatus.SUCCESS)
+        await create_test_job(test_db, schedule.id, run_number=2, status=JobStatus.ERROR)
 
-        runs = await repo.get_runs_by_schedule_id(
+        runs, _ = await repo.get_runs_by_schedule_id(
             schedule.id, status_filter=JobStatus.SUCCESS
         )
         assert len(runs) == 1
@@ -71,7 +72,7 @@ async def test_get_runs_by_schedule_id_with_time_filter(test_db):
         start_time = datetime.now(UTC)
         end_time = datetime.now(UTC)
 
-        runs = await repo.get_runs_by_schedule_id(
+        runs, _ = await repo.get_runs_by_schedule_id(
             schedule.id, start_time=start_time, end_time=end_time
         )
         assert len(runs) >= 0
@@ -87,7 +88,7 @@ async def test_get_all_runs(test_db):
         await create_test_job(test_db, schedule1.id)
         await create_test_job(test_db, schedule2.id)
 
-        runs = await repo.get_all_runs()
+        runs, _ = await repo.get_all_runs()
         assert len(runs) >= 2
 
 
@@ -96,10 +97,10 @@ async def test_get_all_runs_with_status_filter(test_db):
     with mock_session(test_db, "domains.runs.repository"):
         repo = RunRepository()
         _, _, schedule = await create_test_data_chain(test_db)
-        await create_test_job(test_db, schedule.id, status=JobStatus.SUCCESS)
-        await create_test_job(test_db, schedule.id, status=JobStatus.ERROR)
+        await create_test_job(test_db, schedule.id, run_number=1, status=JobStatus.SUCCESS)
+        await create_test_job(test_db, schedule.id, run_number=2, status=JobStatus.ERROR)
 
-        runs = await repo.get_all_runs(status_filter=JobStatus.ERROR)
+        runs, _ = await repo.get_all_runs(status_filter=JobStatus.ERROR)
         assert len(runs) >= 1
 
 
@@ -113,5 +114,73 @@ async def test_get_all_runs_with_time_filter(test_db):
         start_time = datetime.now(UTC)
         end_time = datetime.now(UTC)
 
-        runs = await repo.get_all_runs(start_time=start_time, end_time=end_time)
+        runs, _ = await repo.get_all_runs(start_time=start_time, end_time=end_time)
         assert len(runs) >= 0
+
+
+@pytest.mark.asyncio
+async def test_get_all_runs_pages_with_keyset_cursor(test_db):
+    with mock_session(test_db, "domains.runs.repository"):
+        repo = RunRepository()
+        _, _, schedule = await create_test_data_chain(test_db)
+        for run_number in range(1, 6):
+            await create_test_job(test_db, schedule.id, run_number=run_number)
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await repo.get_all_runs(limit=2, cursor=cursor)
+            assert len(page) <= 2
+            seen.extend(run.id for run, _ in page)
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_all_runs_with_multi_value_filters(test_db):
+    with mock_session(test_db, "domains.runs.repository"):
+        repo = RunRepository()
+        _, _, first = await create_test_data_chain(test_db)
+        _, _, second = await create_test_data_chain(test_db)
+        _, _, other = await create_test_data_chain(test_db)
+        await create_test_job(test_db, first.id, status=JobStatus.SUCCESS, latency_ms=50.0)
+        await create_test_job(test_db, second.id, status=JobStatus.TIMEOUT, latency_ms=900.0)
+        await create_test_job(test_db, second.id, run_number=2, status=JobStatus.ERROR, latency_ms=20.0)
+        await create_test_job(test_db, other.id, status=JobStatus.SUCCESS, latency_ms=60.0)
+
+        runs, _ = await repo.get_all_runs(
+            status_filter=[JobStatus.SUCCESS, JobStatus.TIMEOUT],
+            schedule_ids=[first.id, second.id],
+            min_latency_ms=40.0,
+        )
+
+        assert {run.schedule_id for run, _ in runs} == {first.id, second.id}
+        assert {run.status for run, _ in runs} == {JobStatus.SUCCESS, JobStatus.TIMEOUT}
+        assert all(not hasattr(run, "response_body") for run, _ in runs)
+
+
+@pytest.mark.asyncio
+async def test_get_all_runs_projects_requested_fields(test_db):
+    with mock_session(test_db, "domains.runs.repository"):
+        repo = RunRepository()
+        _, _, schedule = await create_test_data_chain(test_db)
+        await create_test_job(test_db, schedule.id, latency_ms=12.5)
+
+        runs, _ = await repo.get_all_runs(
+            fields=["status", "latency_ms"], include=["response_body"])
+
+        run, _ = runs[0]
+        assert set(run._fields) == {"id", "started_at", "status", "latency_ms", "response_body"}
+        assert run.latency_ms == 12.5
+
+
+def test_parse_fields_accepts_repeated_and_comma_separated_names():
+    assert parse_fields(["status,status_code", "latency_ms"], SUMMARY_FIELDS) == [
+        "status", "status_code", "latency_ms"]
+    assert parse_fields(None, SUMMARY_FIELDS) is None
+
+    with pytest.raises(ValueError):
+        parse_fields(["response_body"], SUMMARY_FIELDS)
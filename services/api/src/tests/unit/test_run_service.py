@@ -1,13 +1,27 @@
 import pytest
+from collections import namedtuple
 from datetime import UTC, datetime
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch
 
 from domains.runs.service import RunService
 from enums.job_status import JobStatus
+from domains.runs.cursor import decode_cursor
 from models.job import Job as JobPydantic
 
 
+def make_run_row(**overrides):
+    row = {
+        "id": uuid4(),
+        "schedule_id": uuid4(),
+        "run_number": 1,
+        "started_at": datetime.now(UTC),
+        "status": JobStatus.SUCCESS,
+        **overrides,
+    }
+    return namedtuple("RunRow", row)(**row)
+
+
 @pytest.mark.asyncio
 async def test_get_run_by_id_success():
     service = RunService()
@@ -77,20 +91,15 @@ async def test_get_runs_by_schedule_id():
     service = RunService()
     schedule_id = uuid4()
     
-    mock_db_run = AsyncMock()
-    mock_db_run.to_pydantic_model = lambda: JobPydantic(
-        id=uuid4(),
-        schedule_id=schedule_id,
-        run_number=1,
-        started_at=datetime.now(UTC),
-        status=JobStatus.SUCCESS,
-    )
-    
-    runs = [(mock_db_run, "Test Schedule")]
+    run_id = uuid4()
+    started_at = datetime(2024, 1, 1)
+    runs = [(make_run_row(id=run_id, schedule_id=schedule_id, started_at=started_at), "Test Schedule")]
     
-    with patch.object(service.repository, 'get_runs_by_schedule_id', return_value=runs):
-        result = await service.get_runs_by_schedule_id(schedule_id)
+    with patch.object(service.repository, 'get_runs_by_schedule_id', return_value=(runs, (started_at, run_id))):
+        result, next_cursor = await service.get_runs_by_schedule_id(schedule_id)
         assert len(result) == 1
+        assert result[0].name == "Test Schedule"
+        assert decode_cursor(next_cursor) == (started_at, run_id)
 
 
 @pytest.mark.asyncio
@@ -98,8 +107,8 @@ async def test_get_runs_by_schedule_id_with_filters():
     service = RunService()
     schedule_id = uuid4()
     
-    with patch.object(service.repository, 'get_runs_by_schedule_id', return_value=[]):
-        result = await service.get_runs_by_schedule_id(
+    with patch.object(service.repository, 'get_runs_by_schedule_id', return_value=([], None)):
+        result, next_cursor = await service.get_runs_by_schedule_id(
             schedule_id,
             status_filter=JobStatus.SUCCESS,
             start_time=datetime.now(UTC),
@@ -112,30 +121,55 @@ async def test_get_runs_by_schedule_id_with_filters():
 async def test_get_all_runs():
     service = RunService()
     
-    mock_db_run = AsyncMock()
-    mock_db_run.to_pydantic_model = lambda: JobPydantic(
-        id=uuid4(),
-        schedule_id=uuid4(),
-        run_number=1,
-        started_at=datetime.now(UTC),
-        status=JobStatus.SUCCESS,
-    )
-    
-    runs = [(mock_db_run, "Test Schedule")]
+    runs = [(make_run_row(), "Test Schedule")]
     
-    with patch.object(service.repository, 'get_all_runs', return_value=runs):
-        result = await service.get_all_runs()
+    with patch.object(service.repository, 'get_all_runs', return_value=(runs, None)):
+        result, next_cursor = await service.get_all_runs()
         assert len(result) == 1
+        assert next_cursor is None
 
 
 @pytest.mark.asyncio
 async def test_get_all_runs_with_filters():
     service = RunService()
     
-    with patch.object(service.repository, 'get_all_runs', return_value=[]):
-        result = await service.get_all_runs(
+    with patch.object(service.repository, 'get_all_runs', return_value=([], None)):
+        result, next_cursor = await service.get_all_runs(
             status_filter=JobStatus.ERROR,
             start_time=datetime.now(UTC),
             end_time=datetime.now(UTC)
         )
         assert len(result) == 0
+
+
+def test_list_response_serializes_validated_rows_without_nulls():
+    import json
+
+    from domains.runs.schemas import RunListResponse
+    from domains.runs.service import RUN_LIST_ADAPTER
+    from models.response import list_response
+
+    row = make_run_row(started_at=datetime(2024, 1, 1))
+    runs = RUN_LIST_ADAPTER.validate_python([{**row._asdict(), "name": None}])
+
+    response = list_response(RunListResponse, runs, "ok", next_cursor="abc")
+    body = json.loads(response.body)
+
+    assert body["next_cursor"] == "abc"
+    assert body["data"] == [{
+        "id": str(row.id),
+        "schedule_id": str(row.schedule_id),
+        "run_number": 1,
+        "started_at": "2024-01-01T00:00:00",
+        "status": "success",
+    }]
+    assert "error" not in body
+
+
+def test_status_filter_is_case_insensitive_and_ignores_unknown_values():
+    from domains.runs.router import parse_statuses
+
+    assert parse_statuses(["SUCCESS", "Http_5xx", "bogus"]) == [
+        JobStatus.SUCCESS, JobStatus.HTTP_5XX]
+    assert parse_statuses(["bogus"]) is None
+    assert parse_statuses(None) is None
@@ -11,7 +11,7 @@ from temporal.activities import (
 )
 from enums.job_status import JobStatus
 from tests.helpers.db_helpers import create_test_data_chain
-from tests.helpers.mocks import mock_session
+from tests.helpers.mocks import mock_http_client, mock_session, stream_response
 
 
 @pytest.mark.asyncio
@@ -86,12 +86,11 @@ async def test_schedule_about_to_run_http_execution_db_fails():
     mock_response.json.return_value = {"success": True}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         # HTTP request succeeds
@@ -199,13 +198,12 @@ async def test_schedule_mid_execution_db_goes_down_during_http_call():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=slow_http_request)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=slow_http_request)
         mock_client.return_value = mock_instance
         
         # HTTP completes successfully
@@ -450,12 +448,11 @@ async def test_http_request_completes_but_temporal_crashes_before_save():
     mock_response.json.return_value = {"success": True}
     mock_response.history = []
     mock_response.is_redirect = False
+    stream_response(mock_response)
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_instance
         
         # HTTP request completes
@@ -2,7 +2,9 @@ import pytest
 from uuid import uuid4
 
 from domains.schedules.repository import ScheduleRepository
+from enums.schedule_type import ScheduleType
 from models.schedule import IntervalSchedule as IntervalSchedulePydantic
+from models.schedule import WindowSchedule as WindowSchedulePydantic
 from tests.helpers.db_helpers import (
     create_test_data_chain,
     create_test_schedule,
@@ -38,6 +40,29 @@ async def test_get_schedule_by_id(test_db):
         assert db_schedule.interval_seconds == 60
 
 
+@pytest.mark.asyncio
+async def test_window_schedule_shares_schedules_table(test_db):
+    with mock_session(test_db, "domains.schedules.repository"):
+        repo = ScheduleRepository()
+        _, target, interval = await create_test_data_chain(test_db)
+
+        window = await repo.create_schedule(WindowSchedulePydantic(
+            name="Window Schedule",
+            target_id=target.id,
+            interval_seconds=30,
+            duration_seconds=300,
+        ))
+
+        db_schedule = await repo.get_schedule_by_id(window.id)
+        assert db_schedule.schedule_type == ScheduleType.WINDOW
+        assert db_schedule.get_workflow_type() == "window"
+        assert db_schedule.to_pydantic_model().duration_seconds == 300
+        assert interval.duration_seconds is None
+
+        schedules = await repo.get_schedules_by_target_id(target.id)
+        assert {schedule.id for schedule in schedules} == {interval.id, window.id}
+
+
 @pytest.mark.asyncio
 async def test_get_schedule_by_id_not_found(test_db):
     with mock_session(test_db, "domains.schedules.repository"):
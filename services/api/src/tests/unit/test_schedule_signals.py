@@ -0,0 +1,255 @@
+import pytest
+from datetime import timedelta
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporalio import activity
+from temporalio.client import WorkflowExecutionStatus
+from temporalio.service import RPCError, RPCStatusCode
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from domains.schedules.service import ScheduleService
+from enums.job_status import JobStatus
+from enums.misfire_policy import MisfirePolicy
+from enums.schedule_priority import SchedulePriority
+from models.schedule import IntervalSchedule as IntervalSchedulePydantic
+from temporal.workflows import CONFIG_RECHECK_INTERVAL, IntervalScheduleWorkflow
+
+
+def make_db_schedule(schedule_id, workflow_id="schedule-workflow", paused=False):
+    db_schedule = MagicMock()
+    db_schedule.id = schedule_id
+    db_schedule.temporal_workflow_id = workflow_id
+    db_schedule.interval_seconds = 120
+    db_schedule.misfire_policy = MisfirePolicy.COALESCE
+    db_schedule.max_catch_up_runs = 3
+    db_schedule.priority = SchedulePriority.NORMAL
+    db_schedule.get_workflow_type = lambda: "interval"
+    db_schedule.to_pydantic_model = lambda: IntervalSchedulePydantic(
+        id=schedule_id,
+        target_id=uuid4(),
+        interval_seconds=120,
+        paused=paused,
+    )
+    return db_schedule
+
+
+def make_client(status=WorkflowExecutionStatus.RUNNING):
+    handle = MagicMock()
+    handle.signal = AsyncMock()
+    handle.describe = AsyncMock(return_value=MagicMock(status=status))
+    client = MagicMock()
+    client.get_workflow_handle = MagicMock(return_value=handle)
+    return client, handle
+
+
+@pytest.mark.asyncio
+async def test_pause_schedule_signals_workflow():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client()
+
+    with patch.object(service.repository, 'pause_schedule', return_value=make_db_schedule(schedule_id, paused=True)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            result = await service.pause_schedule(schedule_id)
+
+    assert result.paused is True
+    client.get_workflow_handle.assert_called_once_with("schedule-workflow")
+    handle.signal.assert_awaited_once_with("pause")
+
+
+@pytest.mark.asyncio
+async def test_pause_schedule_terminates_workflow_when_signal_fails():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client()
+    handle.signal.side_effect = RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b"")
+
+    with patch.object(service.repository, 'pause_schedule', return_value=make_db_schedule(schedule_id, paused=True)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            with patch('temporal.client.terminate_schedule_workflow') as mock_terminate:
+                result = await service.pause_schedule(schedule_id)
+
+    assert result.paused is True
+    mock_terminate.assert_awaited_once_with(schedule_id, client)
+
+
+@pytest.mark.asyncio
+async def test_pause_schedule_fails_when_workflow_cannot_be_stopped():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client()
+    handle.signal.side_effect = RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b"")
+    unavailable = RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b"")
+
+    with patch.object(service.repository, 'pause_schedule', return_value=make_db_schedule(schedule_id, paused=True)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            with patch('temporal.client.terminate_schedule_workflow', side_effect=unavailable):
+                with pytest.raises(Exception, match="unavailable"):
+                    await service.pause_schedule(schedule_id)
+
+
+@pytest.mark.asyncio
+async def test_resume_schedule_signals_running_workflow():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client()
+
+    with patch.object(service.repository, 'resume_schedule', return_value=make_db_schedule(schedule_id)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            with patch('domains.schedules.service.start_schedule_workflow') as mock_start:
+                await service.resume_schedule(schedule_id)
+
+    handle.signal.assert_awaited_once_with("resume")
+    mock_start.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resume_schedule_restarts_closed_workflow():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client(status=WorkflowExecutionStatus.TERMINATED)
+
+    with patch.object(service.repository, 'resume_schedule', return_value=make_db_schedule(schedule_id)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            with patch('domains.schedules.service.start_schedule_workflow', return_value="new-workflow-id") as mock_start:
+                with patch.object(service.repository, 'update_workflow_id') as mock_update:
+                    with patch('domains.schedules.service.JobRepository.get_last_run_number', return_value=41):
+                        await service.resume_schedule(schedule_id)
+
+    handle.signal.assert_not_awaited()
+    mock_start.assert_awaited_once()
+    assert mock_start.call_args.kwargs["run_number"] == 42
+    mock_update.assert_awaited_once_with(schedule_id, "new-workflow-id")
+
+
+@pytest.mark.asyncio
+async def test_update_schedule_signals_new_interval():
+    service = ScheduleService()
+    schedule_id = uuid4()
+    client, handle = make_client()
+    schedule = IntervalSchedulePydantic(target_id=uuid4(), interval_seconds=120)
+
+    with patch.object(service.repository, 'update_schedule', return_value=make_db_schedule(schedule_id)):
+        with patch('domains.schedules.service.get_temporal_client', return_value=client):
+            await service.update_schedule(schedule_id, schedule)
+
+    handle.signal.assert_awaited_once_with("update_schedule", {
+        "interval_seconds": 120,
+        "misfire_policy": "coalesce",
+        "max_catch_up_runs": 3,
+        "priority": "normal",
+    })
+
+
+@pytest.mark.asyncio
+async def test_workflow_blocks_while_paused_without_polling():
+    schedule_id = uuid4()
+    config_loads = []
+    requests = []
+
+    @activity.defn(name="get_schedule_and_target")
+    async def stub_get_schedule(schedule_id) -> dict:
+        config_loads.append(schedule_id)
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10},
+            "target": {"method": "GET", "headers": {}, "body": None},
+            "url": "https://api.example.com/test",
+        }
+
+    @activity.defn(name="execute_http_request")
+    async def stub_http(*args) -> dict:
+        requests.append(args[0])
+        return {"status": JobStatus.SUCCESS.value, "started_at": "2024-01-01T00:00:00", "attempts": []}
+
+    @activity.defn(name="create_job_record")
+    async def stub_create_job(schedule_id, run_number, request_result, scheduled_at=None, missed_runs=0) -> str:
+        return str(uuid4())
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_get_schedule, stub_http, stub_create_job],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                schedule_id,
+                id=f"test-interval-signals-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=25))
+            assert len(config_loads) == 1
+            assert len(requests) == 3
+
+            await handle.signal(IntervalScheduleWorkflow.pause)
+            await env.sleep(timedelta(seconds=240))
+            paused_requests = len(requests)
+            assert paused_requests <= 4
+            assert len(config_loads) == 1
+
+            await handle.signal(IntervalScheduleWorkflow.resume)
+            await env.sleep(timedelta(seconds=5))
+            assert len(requests) == paused_requests + 1
+            assert len(config_loads) == 2
+
+            await handle.cancel()
+
+
+@pytest.mark.asyncio
+async def test_workflow_rechecks_paused_state_without_signals():
+    schedule_id = uuid4()
+    db_state = {"paused": False}
+    requests = []
+
+    @activity.defn(name="get_schedule_and_target")
+    async def stub_get_schedule(schedule_id) -> dict:
+        if db_state["paused"]:
+            return {"paused": True}
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10},
+            "target": {"method": "GET", "headers": {}, "body": None},
+            "url": "https://api.example.com/test",
+        }
+
+    @activity.defn(name="execute_http_request")
+    async def stub_http(*args) -> dict:
+        requests.append(args[0])
+        return {"status": JobStatus.SUCCESS.value, "started_at": "2024-01-01T00:00:00", "attempts": []}
+
+    @activity.defn(name="create_job_record")
+    async def stub_create_job(schedule_id, run_number, request_result, scheduled_at=None, missed_runs=0) -> str:
+        return str(uuid4())
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_get_schedule, stub_http, stub_create_job],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                schedule_id,
+                id=f"test-interval-recheck-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=25))
+            db_state["paused"] = True
+            await env.sleep(CONFIG_RECHECK_INTERVAL + timedelta(seconds=100))
+            paused_requests = len(requests)
+            assert paused_requests <= 31
+            await env.sleep(timedelta(seconds=60))
+            assert len(requests) == paused_requests
+
+            db_state["paused"] = False
+            await env.sleep(CONFIG_RECHECK_INTERVAL)
+            assert len(requests) > paused_requests
+
+            await handle.cancel()
@@ -0,0 +1,18 @@
+import pytest
+from unittest.mock import patch
+
+import main
+from enums.service_role import ServiceRole
+
+
+@pytest.mark.asyncio
+async def test_api_refuses_to_start_with_worker_role():
+    with patch.object(main.settings, "role", ServiceRole.WORKER), \
+            patch("main.change_listener") as mock_listener, \
+            patch("main.run_partition_maintenance") as mock_maintenance:
+        with pytest.raises(RuntimeError, match="ROLE=worker"):
+            async with main.lifespan(main.app):
+                pass
+
+    mock_listener.start.assert_not_called()
+    mock_maintenance.assert_not_called()
@@ -1,12 +1,18 @@
 import pytest
 from uuid import uuid4
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import urlparse
 
 from domains.targets.service import TargetService
 from models.target import Target as TargetPydantic
 
 
+def mock_temporal_client():
+    client = MagicMock()
+    client.get_workflow_handle.return_value.signal = AsyncMock()
+    return client
+
+
 @pytest.mark.asyncio
 async def test_create_target_success():
     service = TargetService()
@@ -136,10 +142,19 @@ async def test_update_target_success():
     mock_url = AsyncMock()
     mock_url.get_url_string = lambda: "https://api.example.com/v2/test"
     
-    with patch.object(service.repository, 'update_target', return_value=(mock_db_target, mock_url)):
+    schedule = MagicMock(temporal_workflow_id="schedule-workflow")
+    client = mock_temporal_client()
+
+    with patch.object(service.repository, 'update_target', return_value=(mock_db_target, mock_url)), \
+            patch.object(service.repository.schedule_repository, 'get_schedules_by_target_id',
+                         AsyncMock(return_value=[schedule])), \
+            patch('domains.targets.service.get_temporal_client', AsyncMock(return_value=client)):
         result = await service.update_target(target_id, target)
         assert result.name == "Updated Target"
 
+    client.get_workflow_handle.assert_called_once_with("schedule-workflow")
+    client.get_workflow_handle.return_value.signal.assert_awaited_once_with("refresh_config")
+
 
 @pytest.mark.asyncio
 async def test_update_target_not_found():
@@ -177,17 +192,27 @@ async def test_delete_target_success():
     mock_url = AsyncMock()
     mock_url.get_url_string = lambda: "https://api.example.com/test"
     
-    with patch.object(service.repository, 'delete_target', return_value=(mock_db_target, mock_url)):
+    schedule = MagicMock(temporal_workflow_id="schedule-workflow")
+    client = mock_temporal_client()
+
+    with patch.object(service.repository, 'delete_target', return_value=(mock_db_target, mock_url)), \
+            patch.object(service.repository.schedule_repository, 'get_schedules_by_target_id',
+                         AsyncMock(return_value=[schedule])), \
+            patch('domains.targets.service.get_temporal_client', AsyncMock(return_value=client)):
         result = await service.delete_target(target_id)
         assert result.id == target_id
 
+    client.get_workflow_handle.return_value.signal.assert_awaited_once_with("refresh_config")
+
 
 @pytest.mark.asyncio
 async def test_delete_target_not_found():
     service = TargetService()
     target_id = uuid4()
     
-    with patch.object(service.repository, 'delete_target', side_effect=Exception("Target not found")):
+    with patch.object(service.repository, 'delete_target', side_effect=Exception("Target not found")), \
+            patch.object(service.repository.schedule_repository, 'get_schedules_by_target_id',
+                         AsyncMock(return_value=[])):
         with pytest.raises(Exception) as exc_info:
             await service.delete_target(target_id)
         assert "not found" in str(exc_info.value).lower()
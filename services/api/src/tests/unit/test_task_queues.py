@@ -0,0 +1,40 @@
+import pytest
+
+from temporal.task_queues import (db_task_queue, http_task_queue, select_task_queues,
+                                  split_slots, task_queue, timeout_class)
+
+
+def test_timeout_class_uses_worst_case_request_budget():
+    assert timeout_class({"timeout_seconds": 5}) == "fast"
+    assert timeout_class({"timeout_seconds": 5, "retry_count": 2}) == "slow"
+    assert timeout_class(None) == "slow"
+
+
+def test_http_task_queue_partitions_by_priority_and_timeout_class():
+    schedule_data = {
+        "schedule": {"priority": "critical"},
+        "target": {"timeout_seconds": 2},
+    }
+
+    assert http_task_queue("q", schedule_data) == "q-http-critical-fast"
+    assert http_task_queue("q", {"schedule": {}, "target": {"timeout_seconds": 60}}) == "q-http-normal-slow"
+    assert db_task_queue("q") == "q-db"
+
+
+def test_select_task_queues_matches_groups():
+    assert select_task_queues(["workflow", "db"]) == ["workflow", "db"]
+    assert select_task_queues(["http-critical"]) == ["http-critical-fast", "http-critical-slow"]
+    assert len(select_task_queues(["http"])) == 6
+    assert len(select_task_queues([])) == 8
+    assert task_queue("q", "workflow") == "q"
+    assert task_queue("q", "http-low-slow") == "q-http-low-slow"
+
+    with pytest.raises(ValueError):
+        select_task_queues(["htp"])
+
+
+def test_split_slots_keeps_process_total():
+    assert split_slots(100, 8) == [13, 13, 13, 13, 12, 12, 12, 12]
+    assert sum(split_slots(100, 3)) == 100
+    assert split_slots(100, 1) == [100]
+    assert split_slots(2, 4) == [1, 1, 1, 1]
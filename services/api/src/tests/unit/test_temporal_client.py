@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal.client import get_temporal_client, temporal_client_manager
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_connection():
+    connected = MagicMock()
+
+    async def slow_connect(**kwargs):
+        await asyncio.sleep(0.01)
+        return connected
+
+    with patch('temporal.client.Client.connect', side_effect=slow_connect) as mock_connect:
+        clients = await asyncio.gather(*(get_temporal_client() for _ in range(10)))
+        assert await get_temporal_client() is connected
+
+    assert all(client is connected for client in clients)
+    assert mock_connect.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_is_retried_on_next_call():
+    connected = MagicMock()
+
+    with patch('temporal.client.Client.connect',
+               AsyncMock(side_effect=[RuntimeError("connection refused"), connected])):
+        with pytest.raises(RuntimeError):
+            await get_temporal_client()
+
+        assert await get_temporal_client() is connected
+
+
+@pytest.mark.asyncio
+async def test_unavailable_error_reconnects():
+    first, second = MagicMock(), MagicMock()
+
+    with patch('temporal.client.Client.connect', AsyncMock(side_effect=[first, second])):
+        assert await get_temporal_client() is first
+
+        temporal_client_manager.handle_error(ValueError("not an rpc error"))
+        assert await get_temporal_client() is first
+
+        temporal_client_manager.handle_error(
+            RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b""))
+        assert await get_temporal_client() is second
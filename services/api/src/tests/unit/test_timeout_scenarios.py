@@ -5,15 +5,15 @@ import asyncio
 
 from temporal.activities import execute_http_request
 from enums.job_status import JobStatus
+from temporal.payload_store import payload_store
+from tests.helpers.mocks import mock_http_client, stream_response
 
 
 @pytest.mark.asyncio
 async def test_timeout_on_first_attempt():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -33,10 +33,8 @@ async def test_timeout_on_first_attempt():
 @pytest.mark.asyncio
 async def test_timeout_with_custom_timeout_value():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -55,10 +53,8 @@ async def test_timeout_with_custom_timeout_value():
 @pytest.mark.asyncio
 async def test_timeout_after_multiple_retries():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -94,13 +90,12 @@ async def test_timeout_recovery_on_retry():
         mock_response.json.return_value = {"success": True}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=timeout_then_success)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=timeout_then_success)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -123,10 +118,8 @@ async def test_timeout_recovery_on_retry():
 @pytest.mark.asyncio
 async def test_timeout_on_post_request():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.post = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -144,15 +137,13 @@ async def test_timeout_on_post_request():
 @pytest.mark.asyncio
 async def test_timeout_latency_measurement():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
+        mock_instance = mock_http_client()
         
         async def delayed_timeout(*args, **kwargs):
             await asyncio.sleep(0.1)
             raise httpx.TimeoutException("Request timed out")
         
-        mock_instance.get = AsyncMock(side_effect=delayed_timeout)
+        mock_instance.send = AsyncMock(side_effect=delayed_timeout)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -174,12 +165,9 @@ async def test_timeout_with_different_http_methods():
     
     for method in methods:
         with patch('httpx.AsyncClient') as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+            mock_instance = mock_http_client()
             
-            method_mock = getattr(mock_instance, method.lower())
-            method_mock.side_effect = httpx.TimeoutException("Request timed out")
+            mock_instance.send.side_effect = httpx.TimeoutException("Request timed out")
             
             mock_client.return_value = mock_instance
             
@@ -213,13 +201,12 @@ async def test_partial_timeout_in_retry_sequence():
         mock_response.json.return_value = {"error": "Service unavailable"}
         mock_response.history = []
         mock_response.is_redirect = False
+        stream_response(mock_response)
         return mock_response
     
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=partial_timeout)
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=partial_timeout)
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -240,10 +227,8 @@ async def test_partial_timeout_in_retry_sequence():
 @pytest.mark.asyncio
 async def test_timeout_no_response_data():
     with patch('httpx.AsyncClient') as mock_client:
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
+        mock_instance = mock_http_client()
+        mock_instance.send = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
         mock_client.return_value = mock_instance
         
         result = await execute_http_request(
@@ -258,5 +243,6 @@ async def test_timeout_no_response_data():
         assert result["status"] == JobStatus.TIMEOUT.value
         assert result["status_code"] is None
         assert result["response_size_bytes"] is None
-        assert result["response_headers"] is None
-        assert result["response_body"] is None
+        payload = await payload_store.get(result["payload_ref"])
+        assert payload["response_headers"] is None
+        assert payload["response_body"] is None
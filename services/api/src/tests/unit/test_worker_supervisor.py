@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock, patch
+
+from temporal import supervisor as supervisor_module
+from temporal.supervisor import (STABLE_UPTIME_SECONDS, WorkerSupervisor, restart_delay,
+                                 run_event_loop)
+
+
+def make_child(pid, alive=True):
+    child = MagicMock()
+    child.pid = pid
+    child.is_alive.return_value = alive
+    return child
+
+
+def test_health_reports_all_children_alive():
+    supervisor = WorkerSupervisor(2)
+    supervisor.children = [make_child(101), make_child(102)]
+
+    health = supervisor.health()
+
+    assert health["status"] == "healthy"
+    assert [process["pid"] for process in health["processes"]] == [101, 102]
+
+
+def test_health_degraded_when_child_dead():
+    supervisor = WorkerSupervisor(2)
+    supervisor.children = [make_child(101), make_child(102, alive=False)]
+    supervisor.restarts = [0, 3]
+
+    health = supervisor.health()
+
+    assert health["status"] == "degraded"
+    assert health["processes"][1] == {"index": 1, "pid": 102, "alive": False, "restarts": 3}
+
+
+def test_run_event_loop_returns_coroutine_result():
+    async def main():
+        return 7
+
+    assert run_event_loop(main()) == 7
+
+
+def test_restart_delay_backs_off_exponentially_up_to_max(monkeypatch):
+    monkeypatch.setattr(supervisor_module.settings, "worker_restart_backoff_max_seconds", 10.0)
+
+    assert [restart_delay(failures) for failures in range(1, 6)] == [1.0, 2.0, 4.0, 8.0, 10.0]
+
+
+def test_crashed_child_restarts_after_backoff(monkeypatch):
+    monkeypatch.setattr(supervisor_module.settings, "worker_max_restarts", 5)
+    supervisor = WorkerSupervisor(1)
+    supervisor.children = [make_child(101, alive=False)]
+    supervisor.started_at = [100.0]
+
+    with patch.object(supervisor, "reap"), patch.object(supervisor, "spawn") as spawn:
+        assert supervisor.supervise(110.0)
+        assert supervisor.respawn_at == [111.0]
+        spawn.assert_not_called()
+
+        assert supervisor.supervise(110.5)
+        spawn.assert_not_called()
+
+        assert supervisor.supervise(111.0)
+        spawn.assert_called_once_with(0)
+
+    assert supervisor.restarts == [1]
+    assert supervisor.respawn_at == [None]
+
+
+def test_supervisor_gives_up_after_restart_limit(monkeypatch):
+    monkeypatch.setattr(supervisor_module.settings, "worker_max_restarts", 2)
+    supervisor = WorkerSupervisor(1)
+    supervisor.children = [make_child(101, alive=False)]
+    supervisor.failures = [2]
+
+    with patch.object(supervisor, "reap"), patch.object(supervisor, "spawn") as spawn:
+        assert not supervisor.supervise(10.0)
+
+    spawn.assert_not_called()
+
+
+def test_stable_child_crash_resets_backoff(monkeypatch):
+    monkeypatch.setattr(supervisor_module.settings, "worker_max_restarts", 2)
+    supervisor = WorkerSupervisor(1)
+    supervisor.children = [make_child(101, alive=False)]
+    supervisor.failures = [2]
+
+    with patch.object(supervisor, "reap"):
+        assert supervisor.supervise(STABLE_UPTIME_SECONDS)
+
+    assert supervisor.failures == [1]
+    assert supervisor.respawn_at == [STABLE_UPTIME_SECONDS + 1.0]
+
+
+def test_run_removes_metrics_dir_it_created(monkeypatch, tmp_path):
+    monkeypatch.delenv(supervisor_module.MULTIPROC_ENV, raising=False)
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    monkeypatch.setattr(supervisor_module.tempfile, "mkdtemp", lambda prefix: str(metrics_dir))
+    supervisor = WorkerSupervisor(1)
+
+    with patch.object(supervisor, "supervise_children", return_value=0) as supervise_children:
+        assert supervisor.run() == 0
+
+    supervise_children.assert_called_once()
+    assert not metrics_dir.exists()
+    assert supervisor_module.MULTIPROC_ENV not in supervisor_module.os.environ
+
+
+def test_run_keeps_configured_metrics_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv(supervisor_module.MULTIPROC_ENV, str(tmp_path))
+    supervisor = WorkerSupervisor(1)
+
+    with patch.object(supervisor, "supervise_children", return_value=0):
+        supervisor.run()
+
+    assert tmp_path.exists()
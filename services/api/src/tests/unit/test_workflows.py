@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 from temporalio.testing import WorkflowEnvironment
 from temporalio.worker import Worker
 
+from temporal.legacy_workflows import LegacyIntervalScheduleWorkflow
 from temporal.workflows import IntervalScheduleWorkflow, WindowScheduleWorkflow
 from temporal.activities import (
     get_schedule_and_target,
@@ -274,3 +275,335 @@ async def test_window_schedule_workflow_completes_duration():
                         
                         result = await handle.result()
                         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_interval_schedule_workflow_continues_as_new_and_carries_run_number():
+    from temporalio import activity
+
+    schedule_id = uuid4()
+    recorded_run_numbers = []
+
+    @activity.defn(name="get_schedule_and_target")
+    async def stub_get_schedule(schedule_id) -> dict:
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10},
+            "target": {"method": "GET", "headers": {}, "body": None},
+            "url": "https://api.example.com/test",
+        }
+
+    @activity.defn(name="execute_http_request")
+    async def stub_http(*args) -> dict:
+        return {"status": JobStatus.SUCCESS.value, "started_at": "2024-01-01T00:00:00", "attempts": []}
+
+    @activity.defn(name="create_job_record")
+    async def stub_create_job(schedule_id, run_number, request_result, scheduled_at=None, missed_runs=0) -> str:
+        recorded_run_numbers.append(run_number)
+        return str(uuid4())
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_get_schedule, stub_http, stub_create_job],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                args=[schedule_id, 1, 2, 10_000],
+                id=f"test-interval-can-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=55))
+
+            description = await env.client.get_workflow_handle(handle.id).describe()
+            assert description.run_id != handle.result_run_id
+            assert recorded_run_numbers == list(range(1, len(recorded_run_numbers) + 1))
+            assert len(recorded_run_numbers) >= 5
+
+            await env.client.get_workflow_handle(handle.id).cancel()
+
+
+@pytest.mark.asyncio
+async def test_interval_schedule_workflow_fused_tick():
+    from temporalio import activity
+
+    schedule_id = uuid4()
+    ticks = []
+
+    @activity.defn(name="run_schedule_tick")
+    async def stub_tick(schedule_id, run_number, scheduled_at=None, missed_runs=0) -> dict:
+        ticks.append(run_number)
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10},
+            "target": {"method": "GET", "timeout_seconds": 5},
+            "persisted": True,
+        }
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_tick],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                args=[schedule_id, 1, 500, 10_000, True],
+                id=f"test-interval-fused-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=35))
+
+            assert ticks[:3] == [1, 2, 3]
+
+            await handle.cancel()
+
+
+def test_advance_fire_time_fixed_rate_ignores_tick_duration():
+    from datetime import datetime
+
+    from temporal.workflows import advance_fire_time
+
+    interval = timedelta(seconds=60)
+    previous = datetime(2024, 1, 1, 0, 0, 0)
+
+    assert advance_fire_time(previous, interval, previous + timedelta(seconds=5), True) == previous + interval
+    assert advance_fire_time(previous, interval, previous + timedelta(seconds=5), False) == previous + timedelta(seconds=65)
+
+
+def test_advance_fire_time_fixed_rate_skips_missed_slots():
+    from datetime import datetime
+
+    from temporal.workflows import advance_fire_time
+
+    interval = timedelta(seconds=60)
+    previous = datetime(2024, 1, 1, 0, 0, 0)
+
+    assert advance_fire_time(previous, interval, previous + timedelta(seconds=150), True) == previous + timedelta(seconds=180)
+    assert advance_fire_time(previous, interval, previous + interval, True) == previous + 2 * interval
+
+
+@pytest.mark.asyncio
+async def test_interval_schedule_workflow_fixed_rate_records_intended_fire_times():
+    from datetime import datetime
+
+    from temporalio import activity
+
+    schedule_id = uuid4()
+    scheduled = []
+
+    @activity.defn(name="run_schedule_tick")
+    async def stub_tick(schedule_id, run_number, scheduled_at=None, missed_runs=0) -> dict:
+        scheduled.append(datetime.fromisoformat(scheduled_at))
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10},
+            "target": {"method": "GET", "timeout_seconds": 5},
+            "persisted": True,
+        }
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_tick],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                args=[schedule_id, 1, 500, 10_000, True, True],
+                id=f"test-interval-fixed-rate-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=35))
+
+            assert len(scheduled) >= 3
+            assert all(
+                later - earlier == timedelta(seconds=10)
+                for earlier, later in zip(scheduled, scheduled[1:])
+            )
+
+            await handle.cancel()
+
+
+def test_phased_fire_time_is_stable_and_spread_across_interval():
+    from datetime import UTC, datetime
+
+    from temporal.workflows import phased_fire_time
+
+    interval = timedelta(seconds=60)
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+    schedule_ids = [uuid4() for _ in range(600)]
+
+    fire_times = [phased_fire_time(schedule_id, interval, now) for schedule_id in schedule_ids]
+
+    assert all(now <= fire_time < now + interval for fire_time in fire_times)
+    assert phased_fire_time(schedule_ids[0], interval, now) == fire_times[0]
+    assert phased_fire_time(schedule_ids[0], interval, now + interval) == fire_times[0] + interval
+
+    buckets = [0] * 6
+    for fire_time in fire_times:
+        buckets[int((fire_time - now) / (interval / 6))] += 1
+    assert min(buckets) > 50
+
+
+def test_resolve_misfire_policies():
+    from datetime import datetime
+
+    from temporal.workflows import resolve_misfire
+
+    slot = datetime(2024, 1, 1, 0, 0, 0)
+    now = slot + timedelta(seconds=350)
+    late_by = now - slot
+
+    def schedule(policy, max_catch_up_runs=2):
+        return {
+            "interval_seconds": 60,
+            "misfire_policy": policy,
+            "max_catch_up_runs": max_catch_up_runs,
+        }
+
+    assert resolve_misfire(schedule("coalesce"), slot, late_by, now) == (
+        slot + timedelta(seconds=300), 5, 0, False)
+    assert resolve_misfire(schedule("catch_up"), slot, late_by, now) == (
+        slot + timedelta(seconds=180), 3, 2, False)
+    assert resolve_misfire(schedule("skip"), slot, late_by, now) == (
+        slot + timedelta(seconds=360), 6, 0, True)
+    assert resolve_misfire(schedule("skip"), slot, timedelta(seconds=30), now) == (
+        slot, 0, 0, False)
+
+
+@pytest.mark.asyncio
+async def test_interval_schedule_workflow_applies_misfire_policy_to_carried_fire_time():
+    from datetime import datetime
+
+    from temporalio import activity
+
+    schedule_id = uuid4()
+    carried_fire_time = datetime.fromisoformat("2024-01-01T00:00:00+00:00")
+    ticks = []
+
+    @activity.defn(name="get_schedule_and_target")
+    async def stub_get_schedule(schedule_id) -> dict:
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10, "misfire_policy": "coalesce"},
+            "target": {"method": "GET", "timeout_seconds": 5},
+        }
+
+    @activity.defn(name="run_schedule_tick")
+    async def stub_tick(schedule_id, run_number, scheduled_at=None, missed_runs=0) -> dict:
+        ticks.append((datetime.fromisoformat(scheduled_at), missed_runs))
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10, "misfire_policy": "coalesce"},
+            "target": {"method": "GET", "timeout_seconds": 5},
+            "persisted": True,
+        }
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow],
+            activities=[stub_get_schedule, stub_tick],
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                args=[schedule_id, 1, 500, 10_000, True, True, carried_fire_time.isoformat()],
+                id=f"test-interval-misfire-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=5))
+
+            first_slot, missed_runs = ticks[0]
+            assert missed_runs > 0
+            assert first_slot > carried_fire_time
+            assert (first_slot - carried_fire_time) % timedelta(seconds=10) == timedelta(0)
+
+            await handle.cancel()
+
+
+@pytest.mark.asyncio
+async def test_interval_schedule_workflow_routes_activities_by_queue():
+    from temporalio import activity
+
+    schedule_id = uuid4()
+    calls = []
+
+    @activity.defn(name="get_schedule_and_target")
+    async def stub_get_schedule(schedule_id) -> dict:
+        calls.append(("get_schedule_and_target", activity.info().task_queue))
+        return {
+            "paused": False,
+            "schedule": {"interval_seconds": 10, "priority": "critical"},
+            "target": {"method": "GET", "headers": {}, "body": None, "timeout_seconds": 5},
+            "url": "https://api.example.com/test",
+        }
+
+    @activity.defn(name="execute_http_request")
+    async def stub_http(*args) -> dict:
+        calls.append(("execute_http_request", activity.info().task_queue))
+        return {"status": JobStatus.SUCCESS.value, "started_at": "2024-01-01T00:00:00", "attempts": []}
+
+    @activity.defn(name="create_job_record")
+    async def stub_create_job(schedule_id, run_number, request_result, scheduled_at=None, missed_runs=0) -> str:
+        calls.append(("create_job_record", activity.info().task_queue))
+        return str(uuid4())
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with (
+            Worker(env.client, task_queue="test-queue", workflows=[IntervalScheduleWorkflow]),
+            Worker(env.client, task_queue="test-queue-db",
+                   activities=[stub_get_schedule, stub_create_job]),
+            Worker(env.client, task_queue="test-queue-http-critical-fast", activities=[stub_http]),
+        ):
+            handle = await env.client.start_workflow(
+                IntervalScheduleWorkflow.run,
+                args=[schedule_id, 1, 500, 10_000, False, True, None, False, 0.0, True],
+                id=f"test-interval-routing-{schedule_id}",
+                task_queue="test-queue",
+            )
+
+            await env.sleep(timedelta(seconds=15))
+
+            assert calls[:4] == [
+                ("get_schedule_and_target", "test-queue-db"),
+                ("execute_http_request", "test-queue-http-critical-fast"),
+                ("create_job_record", "test-queue-db"),
+                ("execute_http_request", "test-queue-http-critical-fast"),
+            ]
+
+            await handle.cancel()
+
+
+@pytest.mark.asyncio
+async def test_legacy_workflow_type_keeps_running_alongside_v2():
+    schedule_id = uuid4()
+
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        async with Worker(
+            env.client,
+            task_queue="test-queue",
+            workflows=[IntervalScheduleWorkflow, LegacyIntervalScheduleWorkflow],
+            activities=[get_schedule_and_target, execute_http_request, create_job_record],
+        ):
+            with patch('temporal.activities.get_schedule_and_target') as mock_get_schedule:
+                mock_get_schedule.return_value = {"deleted": True}
+
+                for workflow_type in ("IntervalScheduleWorkflow", "IntervalScheduleWorkflowV2"):
+                    handle = await env.client.start_workflow(
+                        workflow_type,
+                        schedule_id,
+                        id=f"test-{workflow_type}-{schedule_id}",
+                        task_queue="test-queue",
+                    )
+                    await handle.result()
+                    assert (await handle.describe()).workflow_type == workflow_type
@@ -0,0 +1,11 @@
+from core.config import settings
+from enums.service_role import ServiceRole
+from temporal.supervisor import WorkerSupervisor, run_event_loop
+from temporal.worker_service import run_worker_process
+
+if __name__ == "__main__":
+    if settings.role == ServiceRole.API:
+        raise SystemExit("ROLE=api runs no worker; set ROLE=worker to start one")
+    if settings.worker_processes > 1:
+        raise SystemExit(WorkerSupervisor(settings.worker_processes).run())
+    raise SystemExit(run_event_loop(run_worker_process()))